@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Samsung LH55BECHLGFXGO Video Wall Benchmark Suite
+Drives the controller and API against simulated displays and writes machine-readable results
+"""
+
+import asyncio
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from mdc_display_simulator import SimulatedFleet, SimulatorProfile
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+SCENARIOS = ['send_command', 'poll_all', 'bulk_power', 'layout_10x10', 'ui_readers']
+
+logger = logging.getLogger('benchmark')
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = math.ceil(pct * len(ordered) / 100.0)
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+def latency_summary(samples: List[float]) -> Dict[str, Any]:
+    """p50/p95/p99 summary of latency samples, in milliseconds"""
+    def ms(value):
+        return round(value * 1000, 3) if value is not None else None
+    
+    return {
+        'count': len(samples),
+        'mean_ms': ms(sum(samples) / len(samples)) if samples else None,
+        'p50_ms': ms(percentile(samples, 50)),
+        'p95_ms': ms(percentile(samples, 95)),
+        'p99_ms': ms(percentile(samples, 99)),
+        'max_ms': ms(max(samples)) if samples else None
+    }
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage // 1024 if sys.platform == 'darwin' else usage
+
+def git_revision() -> Optional[str]:
+    """Commit the benchmark ran against, so result files can be compared across commits"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+class VideoWallBenchmark:
+    """Runs benchmark scenarios against a simulated fleet"""
+    
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.core = None
+        self.fleet: Optional[SimulatedFleet] = None
+        self.sim_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.results: Dict[str, Dict[str, Any]] = {}
+    
+    # Setup
+    
+    def setup(self):
+        """Start the simulated fleet and load the application against it"""
+        args = self.args
+        
+        self.sim_loop = asyncio.new_event_loop()
+        threading.Thread(target=self.sim_loop.run_forever, name='mdc-simulator', daemon=True).start()
+        
+        profile = SimulatorProfile(args.latency, args.jitter, args.loss, args.bad_checksum)
+        fleet = SimulatedFleet(args.displays, args.chain_size, profile=profile)
+        self.fleet = asyncio.run_coroutine_threadsafe(fleet.start(), self.sim_loop).result()
+        
+        # The application writes its database and log to the working directory
+        workdir = args.workdir or tempfile.mkdtemp(prefix='video_wall_bench_')
+        os.makedirs(workdir, exist_ok=True)
+        os.chdir(workdir)
+        
+        sys.path.insert(0, str(PROJECT_ROOT))
+        import clean_video_wall_system as core
+        
+        # The endpoints module is meant to run alongside the core module's globals
+        # (see main.py), so execute it in that namespace
+        endpoints = PROJECT_ROOT / 'samsung_lh55_api_endpoints.py'
+        exec(compile(endpoints.read_text(), str(endpoints), 'exec'), core.__dict__)
+        
+        logging.getLogger().setLevel(getattr(logging, args.log_level.upper()))
+        logger.setLevel(logging.INFO)
+        
+        core.init_database()
+        core.config.config['displays'] = self.fleet.displays_config()
+        core.display_controllers.clear()
+        core.initialize_displays()
+        
+        self.core = core
+        self.client_factory = core.app.test_client
+        
+        logger.info(f"Benchmarking {args.displays} simulated displays "
+                    f"({len(self.fleet.links)} links) in {workdir}")
+        
+        # Warm up: open every connection once so scenarios measure steady state
+        asyncio.run(self.core.fan_out(
+            list(self.core.display_controllers.keys()),
+            lambda display_id, controller: controller.get_full_status()
+        ))
+    
+    def teardown(self):
+        """Disconnect displays and stop the simulated fleet"""
+        if self.core:
+            self.core.status_poller.stop()
+            asyncio.run(self.core.fan_out(
+                list(self.core.display_controllers.keys()),
+                lambda display_id, controller: controller.disconnect()
+            ))
+        
+        if self.fleet:
+            asyncio.run_coroutine_threadsafe(self.fleet.stop(), self.sim_loop).result()
+        if self.sim_loop:
+            self.sim_loop.call_soon_threadsafe(self.sim_loop.stop)
+    
+    # Measurement
+    
+    def simulator_commands(self) -> int:
+        """Total MDC requests the simulated fleet has received"""
+        return sum(link.stats['commands'] for link in self.fleet.links)
+    
+    def measure(self, name: str, scenario: Callable[[], Dict[str, Any]]):
+        """Run one scenario and record latency, throughput and memory"""
+        logger.info(f"Running scenario {name}")
+        
+        if self.args.trace_memory:
+            tracemalloc.start()
+        
+        commands_before = self.simulator_commands()
+        started = time.perf_counter()
+        
+        result = scenario()
+        
+        duration = time.perf_counter() - started
+        commands = self.simulator_commands() - commands_before
+        
+        memory = {'peak_rss_kb': peak_rss_kb()}
+        if self.args.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            memory.update({'traced_current_kb': current // 1024, 'traced_peak_kb': peak // 1024})
+        
+        samples = result.pop('samples', [])
+        result.update({
+            'latency': latency_summary(samples),
+            'duration_s': round(duration, 3),
+            'mdc_commands': commands,
+            'commands_per_sec': round(commands / duration, 1) if duration > 0 else None,
+            'memory': memory
+        })
+        self.results[name] = result
+        
+        latency = result['latency']
+        logger.info(f"{name}: p50={latency['p50_ms']}ms p95={latency['p95_ms']}ms "
+                    f"p99={latency['p99_ms']}ms, {result['commands_per_sec']} commands/s, "
+                    f"{result.get('errors', 0)} errors")
+    
+    def timed_fan_out(self, operation, succeeded=lambda result: result.get('success')) -> Dict[str, Any]:
+        """Run operation on every display once via fan_out, timing each display"""
+        samples = []
+        
+        async def timed(display_id, controller):
+            started = time.perf_counter()
+            try:
+                return await operation(display_id, controller)
+            finally:
+                samples.append(time.perf_counter() - started)
+        
+        results = asyncio.run(self.core.fan_out(list(self.core.display_controllers.keys()), timed))
+        errors = sum(1 for r in results.values() if not succeeded(r))
+        return {'samples': samples, 'errors': errors}
+    
+    def timed_request(self, client, method: str, url: str, samples: List[float], **kwargs) -> bool:
+        """Issue one API request, append its latency and return whether it succeeded"""
+        started = time.perf_counter()
+        response = getattr(client, method)(url, **kwargs)
+        samples.append(time.perf_counter() - started)
+        return response.status_code == 200
+    
+    # Scenarios
+    
+    def scenario_send_command(self) -> Dict[str, Any]:
+        """STATUS query to every display, repeated; per-command latency"""
+        samples, errors = [], 0
+        for _ in range(self.args.iterations):
+            run = self.timed_fan_out(
+                lambda display_id, controller: controller.send_command(self.core.MDCCommand.STATUS)
+            )
+            samples += run['samples']
+            errors += run['errors']
+        return {'samples': samples, 'errors': errors, 'iterations': self.args.iterations}
+    
+    def scenario_poll_all(self) -> Dict[str, Any]:
+        """Full poller cycle (health_check on every display); per-display latency"""
+        samples, cycles, errors = [], [], 0
+        for _ in range(self.args.iterations):
+            started = time.perf_counter()
+            run = self.timed_fan_out(
+                lambda display_id, controller: controller.health_check(),
+                lambda health: health.get('overall_health') in ('healthy', 'warning')
+            )
+            cycles.append(time.perf_counter() - started)
+            samples += run['samples']
+            errors += run['errors']
+        return {'samples': samples, 'errors': errors, 'iterations': self.args.iterations,
+                'cycle': latency_summary(cycles)}
+    
+    def scenario_bulk_power(self) -> Dict[str, Any]:
+        """POST /api/displays/bulk/power for the whole fleet; per-request latency"""
+        client = self.client_factory()
+        samples, errors = [], 0
+        for i in range(self.args.iterations):
+            action = 'off' if i % 2 == 0 else 'on'
+            if not self.timed_request(client, 'post', '/api/displays/bulk/power', samples,
+                                      json={'action': action}):
+                errors += 1
+        
+        # Leave the fleet powered on for the scenarios that follow
+        client.post('/api/displays/bulk/power', json={'action': 'on'})
+        return {'samples': samples, 'errors': errors, 'iterations': self.args.iterations}
+    
+    def scenario_layout_10x10(self) -> Dict[str, Any]:
+        """POST /api/video-wall/apply with a 10x10 layout; per-request latency"""
+        if len(self.core.display_controllers) < 100:
+            return {'skipped': 'needs at least 100 displays', 'samples': []}
+        
+        client = self.client_factory()
+        samples, errors = [], 0
+        for _ in range(self.args.iterations):
+            if not self.timed_request(client, 'post', '/api/video-wall/apply', samples,
+                                      json={'layout_name': '10x10'}):
+                errors += 1
+        return {'samples': samples, 'errors': errors, 'iterations': self.args.iterations}
+    
+    def scenario_ui_readers(self) -> Dict[str, Any]:
+        """Concurrent dashboard readers on /api/displays and /api/monitoring/health while the poller runs"""
+        self.core.status_poller.start()
+        samples, errors = [], []
+        urls = ['/api/displays', '/api/monitoring/health']
+        
+        def reader(index: int):
+            client = self.client_factory()
+            reader_samples, reader_errors = [], 0
+            for i in range(self.args.reader_requests):
+                if not self.timed_request(client, 'get', urls[(index + i) % len(urls)], reader_samples):
+                    reader_errors += 1
+            samples.extend(reader_samples)
+            errors.append(reader_errors)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.args.readers) as pool:
+                list(pool.map(reader, range(self.args.readers)))
+        finally:
+            self.core.status_poller.stop()
+        
+        return {'samples': samples, 'errors': sum(errors), 'readers': self.args.readers,
+                'requests_per_reader': self.args.reader_requests}
+    
+    # Run
+    
+    def run(self, scenarios: List[str]) -> Dict[str, Any]:
+        """Run the selected scenarios and return the report"""
+        self.setup()
+        try:
+            for name in scenarios:
+                try:
+                    self.measure(name, getattr(self, f'scenario_{name}'))
+                except Exception as e:
+                    logger.error(f"Scenario {name} failed: {e}")
+                    self.results[name] = {'error': str(e)}
+        finally:
+            self.teardown()
+        
+        args = self.args
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'fleet': {
+                'displays': args.displays,
+                'chain_size': args.chain_size,
+                'latency': args.latency,
+                'jitter': args.jitter,
+                'packet_loss': args.loss,
+                'bad_checksum': args.bad_checksum
+            },
+            'scenarios': self.results
+        }
+
+def compare(report: Dict[str, Any], baseline_file: str):
+    """Print p50/p95/p99 and throughput changes against an earlier result file"""
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+    
+    print(f"Compared with {baseline_file} ({baseline.get('git_revision')}):")
+    for name, result in report['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if not before or 'latency' not in before or 'latency' not in result:
+            continue
+        
+        changes = []
+        for key in ('p50_ms', 'p95_ms', 'p99_ms'):
+            old, new = before['latency'].get(key), result['latency'].get(key)
+            if old and new is not None:
+                changes.append(f"{key[:-3]} {old}->{new}ms ({(new - old) / old * 100:+.1f}%)")
+        
+        old, new = before.get('commands_per_sec'), result.get('commands_per_sec')
+        if old and new is not None:
+            changes.append(f"commands/s {old}->{new} ({(new - old) / old * 100:+.1f}%)")
+        
+        print(f"  {name}: {', '.join(changes)}")
+
+def main():
+    """Parse arguments, run the benchmark and write the results file"""
+    parser = argparse.ArgumentParser(description='Samsung LH55BECHLGFXGO video wall benchmark suite')
+    parser.add_argument('--displays', type=int, default=100, help='number of simulated displays')
+    parser.add_argument('--chain-size', type=int, default=1, help='displays per TCP link (daisy chain)')
+    parser.add_argument('--latency', type=float, default=0.005, help='simulated reply latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='latency standard deviation in seconds')
+    parser.add_argument('--loss', type=float, default=0.0, help='probability a reply is dropped')
+    parser.add_argument('--bad-checksum', type=float, default=0.0, help='probability a reply is corrupted')
+    parser.add_argument('--iterations', type=int, default=5, help='repetitions per scenario')
+    parser.add_argument('--readers', type=int, default=8, help='concurrent UI readers')
+    parser.add_argument('--reader-requests', type=int, default=50, help='requests per UI reader')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help=f'comma-separated subset of {",".join(SCENARIOS)}')
+    parser.add_argument('--output', default='benchmark_results.json', help='results file')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    parser.add_argument('--workdir', help='directory for the benchmark database and log (default: temporary)')
+    parser.add_argument('--trace-memory', action='store_true', help='trace Python allocations (slower)')
+    parser.add_argument('--log-level', default='warning', help='application log level during the run')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {unknown}")
+    
+    output = Path(args.output).resolve()
+    baseline = Path(args.compare).resolve() if args.compare else None
+    
+    report = VideoWallBenchmark(args).run(scenarios)
+    
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Results written to {output}")
+    
+    if baseline:
+        compare(report, str(baseline))
+
+if __name__ == "__main__":
+    main()
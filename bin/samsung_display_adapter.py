@@ -5,12 +5,17 @@ Enhanced MDC protocol support for Samsung Business Displays
 """
 
 import asyncio
+import sys
 import socket
 import struct
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import ipaddress
+from collections import Counter, deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Any, AsyncIterator, Iterable, Iterator, Union
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 import time
 
 logger = logging.getLogger(__name__)
@@ -351,11 +356,320 @@ class SamsungLHB55ECHAdapter:
         return health_data
 
 
+# Network Discovery Component
+class DisplayScanner:
+    """Two-stage network scan for Samsung displays
+    
+    Stage one is a plain TCP connect to the MDC port under a concurrency limit.
+    Stage two sends an MDC identity probe (model, serial, firmware) over that
+    same connection, only for hosts that accepted it. Hosts are generated lazily
+    and results are yielded as they arrive, so large ranges stay bounded in
+    memory and file descriptors.
+    """
+    
+    def __init__(self, port: int = 1515, display_id: int = 1, max_connects: int = 256,
+                 max_probes: int = 32, connect_timeout: float = 0.5, probe_timeout: float = 3.0):
+        self.port = port
+        self.display_id = display_id
+        self.max_connects = max_connects
+        self.max_probes = max_probes
+        self.connect_timeout = connect_timeout
+        self.probe_timeout = probe_timeout
+        self.stats = {'scanned': 0, 'open': 0, 'identified': 0}
+    
+    @staticmethod
+    def parse_targets(targets: Union[str, Iterable[str]]) -> List[Tuple]:
+        """Parse CIDR blocks, "a.b.c.x-y" ranges or single IPs without expanding them
+        
+        A string may hold several comma-separated targets. Raises ValueError
+        for a target that is none of these.
+        """
+        if isinstance(targets, str):
+            targets = targets.split(',')
+        
+        parsed = []
+        for target in targets:
+            target = target.strip()
+            if not target:
+                continue
+            
+            if '/' in target:
+                parsed.append(('network', ipaddress.ip_network(target, strict=False)))
+            
+            elif '-' in target:
+                try:
+                    base_ip, range_part = target.rsplit('.', 1)
+                    start, end = map(int, range_part.split('-'))
+                except ValueError:
+                    raise ValueError(f"Invalid IP range: {target!r}") from None
+                if not 0 <= start <= end <= 255:
+                    raise ValueError(f"Invalid IP range: {target!r}")
+                ipaddress.ip_address(f"{base_ip}.{start}")
+                parsed.append(('range', base_ip, start, end))
+            
+            else:
+                parsed.append(('host', ipaddress.ip_address(target)))
+        
+        return parsed
+    
+    @classmethod
+    def expand_targets(cls, targets: Union[str, Iterable[str]]) -> Iterator[str]:
+        """Yield host IPs from CIDR blocks, "a.b.c.x-y" ranges or single IPs"""
+        return cls._expand(cls.parse_targets(targets))
+    
+    @staticmethod
+    def _expand(targets: List[Tuple]) -> Iterator[str]:
+        for target in targets:
+            if target[0] == 'network':
+                network = target[1]
+                hosts = network.hosts() if network.num_addresses > 2 else iter(network)
+                for host in hosts:
+                    yield str(host)
+            
+            elif target[0] == 'range':
+                _, base_ip, start, end = target
+                for i in range(start, end + 1):
+                    yield f"{base_ip}.{i}"
+            
+            else:
+                yield str(target[1])
+    
+    @classmethod
+    def target_contains(cls, targets: Union[str, Iterable[str]], ip: str) -> bool:
+        """True if ip falls inside any of the targets, without expanding them"""
+        address = ipaddress.ip_address(ip)
+        for target in cls.parse_targets(targets):
+            if target[0] == 'network':
+                if address in target[1]:
+                    return True
+            
+            elif target[0] == 'range':
+                _, base_ip, start, end = target
+                prefix, last = ip.rsplit('.', 1)
+                if prefix == base_ip and start <= int(last) <= end:
+                    return True
+            
+            elif address == target[1]:
+                return True
+        
+        return False
+    
+    async def _open(self, ip: str) -> Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]]:
+        """Stage one: TCP connect to the MDC port"""
+        started = time.monotonic()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, self.port),
+                timeout=self.connect_timeout
+            )
+        except (asyncio.TimeoutError, OSError):
+            return None
+        return reader, writer, time.monotonic() - started
+    
+    async def _identify(self, ip: str, reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter, connect_time: float) -> Optional[Dict]:
+        """Stage two: ask an open host who it is over the stage one connection"""
+        adapter = SamsungLHB55ECHAdapter(self.display_id, ip, self.port)
+        adapter.reader, adapter.writer = reader, writer
+        adapter.connected = True
+        adapter.max_retries = 1
+        
+        identity = {}
+        try:
+            for query, field in ((adapter.get_model_number, 'model_number'),
+                                 (adapter.get_serial_number, 'serial_number'),
+                                 (adapter.get_software_version, 'software_version')):
+                result = await asyncio.wait_for(query(), timeout=self.probe_timeout)
+                if not result['success']:
+                    break
+                # send_command reports success for empty or unparseable replies too,
+                # so only a decoded, non-empty field counts as an answer
+                if result.get(field):
+                    identity[field] = result[field]
+        except (asyncio.TimeoutError, OSError) as e:
+            logger.debug(f"Identity probe of {ip} failed: {e}")
+        finally:
+            try:
+                await adapter.disconnect()
+            except OSError:
+                pass
+        
+        if not identity.get('model_number') and not identity.get('serial_number'):
+            # Open port, but not a display speaking MDC
+            return None
+        
+        return {
+            'ip': ip,
+            'port': self.port,
+            'model': identity.get('model_number') or 'Samsung Display',
+            'serial_number': identity.get('serial_number'),
+            'software_version': identity.get('software_version'),
+            'connect_ms': round(connect_time * 1000, 1),
+            'responsive': True
+        }
+    
+    async def scan(self, targets: Union[str, Iterable[str]],
+                   exclude: Optional[Iterable[str]] = None) -> AsyncIterator[Dict]:
+        """Yield a result dict for every display found, as soon as it is identified
+        
+        Hosts in exclude are skipped. Invalid targets raise ValueError before
+        anything is scanned. Closing the generator early (e.g. breaking out
+        inside contextlib.aclosing) cancels the rest of the scan.
+        """
+        targets = self.parse_targets(targets)
+        
+        hosts: asyncio.Queue = asyncio.Queue(maxsize=self.max_connects * 2)
+        candidates: asyncio.Queue = asyncio.Queue(maxsize=self.max_probes * 2)
+        results: asyncio.Queue = asyncio.Queue()
+        exclude = set(exclude or ())
+        
+        async def connect_worker():
+            while True:
+                ip = await hosts.get()
+                if ip is None:
+                    return
+                
+                connection = await self._open(ip)
+                self.stats['scanned'] += 1
+                if connection:
+                    self.stats['open'] += 1
+                    await candidates.put((ip, connection))
+        
+        async def probe_worker():
+            while True:
+                item = await candidates.get()
+                if item is None:
+                    return
+                
+                ip, connection = item
+                result = await self._identify(ip, *connection)
+                if result:
+                    self.stats['identified'] += 1
+                    await results.put(result)
+        
+        async def run():
+            connectors = [asyncio.create_task(connect_worker()) for _ in range(self.max_connects)]
+            probers = [asyncio.create_task(probe_worker()) for _ in range(self.max_probes)]
+            try:
+                for ip in self._expand(targets):
+                    if ip not in exclude:
+                        await hosts.put(ip)
+                for _ in connectors:
+                    await hosts.put(None)
+                await asyncio.gather(*connectors)
+                
+                for _ in probers:
+                    await candidates.put(None)
+                await asyncio.gather(*probers)
+            finally:
+                # wait_for can swallow a cancellation that races with completion,
+                # so keep cancelling until every worker has exited
+                pending = set(connectors + probers)
+                while pending:
+                    for task in pending:
+                        task.cancel()
+                    _, pending = await asyncio.wait(pending, timeout=0.1)
+                
+                # Close stage one connections that never reached a probe worker
+                while not candidates.empty():
+                    item = candidates.get_nowait()
+                    if item:
+                        item[1][1].close()
+                
+                await results.put(None)
+        
+        supervisor = asyncio.create_task(run())
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    break
+                yield result
+        finally:
+            supervisor.cancel()
+            await asyncio.gather(supervisor, return_exceptions=True)
+        
+        if not supervisor.cancelled() and supervisor.exception():
+            raise supervisor.exception()
+        
+        logger.info(f"Scan finished: {self.stats['scanned']} hosts, {self.stats['open']} open, "
+                    f"{self.stats['identified']} displays identified")
+
+
+def _control_system():
+    """clean_video_wall_system, imported on first use so the adapter loads without it"""
+    try:
+        import clean_video_wall_system
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        import clean_video_wall_system
+    return clean_video_wall_system
+
+
+class DiscoveryCache:
+    """Discovery results persisted in SQLite, keyed by serial number
+    
+    Lives in the control system's database (DATABASE_URL) and goes through
+    its connection pool, so rescans can try the addresses displays were
+    last seen at before sweeping a whole range. The discovered_displays
+    table is created by init_database along with the rest of the schema.
+    """
+    
+    def __init__(self):
+        core = _control_system()
+        core.init_database()
+        self._get_db = core.get_db
+    
+    def known_displays(self) -> List[Dict]:
+        """Cached displays, most recently seen first"""
+        with self._get_db() as conn:
+            rows = conn.execute('''
+                SELECT * FROM discovered_displays ORDER BY last_seen DESC
+            ''').fetchall()
+        return [dict(row) for row in rows]
+    
+    def record(self, display: Dict) -> Optional[str]:
+        """Save a discovered display; returns its previous IP if it has moved"""
+        serial = display.get('serial_number')
+        if not serial:
+            return None
+        
+        with self._get_db() as conn:
+            previous = conn.execute(
+                'SELECT ip FROM discovered_displays WHERE serial_number = ?', (serial,)
+            ).fetchone()
+            
+            conn.execute('''
+                INSERT INTO discovered_displays (serial_number, ip, port, model, software_version, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(serial_number) DO UPDATE SET
+                    ip = excluded.ip,
+                    port = excluded.port,
+                    model = excluded.model,
+                    software_version = excluded.software_version,
+                    last_seen = excluded.last_seen
+            ''', (
+                serial,
+                display['ip'],
+                display.get('port', 1515),
+                display.get('model'),
+                display.get('software_version'),
+                datetime.now()
+            ))
+            conn.commit()
+        
+        if previous and previous['ip'] != display['ip']:
+            logger.info(f"Display {serial} moved from {previous['ip']} to {display['ip']}")
+            return previous['ip']
+        return None
+
+
 # Configuration Wizard Component
 class VideoWallConfigWizard:
     """Interactive configuration wizard for video wall setup"""
     
-    def __init__(self):
+    def __init__(self, discovery_cache: Optional[DiscoveryCache] = None):
+        self.discovery_cache = discovery_cache
         self.config = {
             'displays': {},
             'magicinfo': {},
@@ -364,50 +678,87 @@ class VideoWallConfigWizard:
             'server': {}
         }
     
-    async def discover_displays(self, ip_range: str = "192.168.1.1-254") -> List[Dict]:
-        """Discover Samsung displays on network"""
+    async def discover_displays(self, ip_range: str = "192.168.1.1-254", port: int = 1515) -> List[Dict]:
+        """Discover Samsung displays on network
+        
+        ip_range accepts CIDR blocks ("10.0.0.0/16"), "a.b.c.x-y" ranges and
+        single IPs, comma-separated.
+        """
         discovered = []
+        async for display in self.scan_displays(ip_range, DisplayScanner(port=port)):
+            discovered.append(display)
+        return discovered
+    
+    async def scan_displays(self, ip_range: Union[str, Iterable[str]], scanner: Optional[DisplayScanner] = None,
+                            exclude: Optional[Iterable[str]] = None) -> AsyncIterator[Dict]:
+        """Yield discovered displays as they are identified"""
+        scanner = scanner or DisplayScanner()
+        async for display in scanner.scan(ip_range, exclude):
+            logger.info(f"Discovered {display['model']} at {display['ip']} (serial {display['serial_number']})")
+            if self.discovery_cache:
+                self.discovery_cache.record(display)
+            yield display
+    
+    async def rediscover_displays(self, ip_range: str = "192.168.1.1-254", port: int = 1515,
+                                  expected_count: Optional[int] = None) -> List[Dict]:
+        """Discover displays starting from the addresses in the discovery cache
         
-        # Parse IP range
-        if '-' in ip_range:
-            base_ip, range_part = ip_range.rsplit('.', 1)
-            start, end = map(int, range_part.split('-'))
-        else:
-            # Single IP
-            return await self._test_single_ip(ip_range)
+        Cached addresses inside ip_range are probed first. The rest of the range
+        is only swept while fewer than expected_count displays have been found;
+        expected_count defaults to the number of cached displays in the range.
+        """
+        cache = self.discovery_cache = self.discovery_cache or DiscoveryCache()
+        known = [
+            display for display in cache.known_displays()
+            if DisplayScanner.target_contains(ip_range, display['ip'])
+        ]
+        if expected_count is None:
+            expected_count = len(known)
         
-        # Test IP range
-        tasks = []
-        for i in range(start, end + 1):
-            ip = f"{base_ip}.{i}"
-            tasks.append(self._test_single_ip(ip))
+        # Only displays that reported a serial number count towards expected_count
+        found: Dict[str, Dict] = {}
+        unidentified: List[Dict] = []
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        def add(display: Dict):
+            if display['serial_number']:
+                found[display['serial_number']] = display
+            else:
+                unidentified.append(display)
         
-        for result in results:
-            if isinstance(result, dict) and result.get('responsive'):
-                discovered.append(result)
+        # Re-probe each cached address on the port it was last seen on
+        by_port: Dict[int, List[str]] = {}
+        for display in known:
+            by_port.setdefault(display['port'] or port, []).append(display['ip'])
         
-        return discovered
+        for cached_port, ips in by_port.items():
+            async for display in self.scan_displays(ips, DisplayScanner(port=cached_port)):
+                add(display)
+        
+        logger.info(f"{len(found)} of {len(known)} cached displays answered at their last address")
+        
+        if expected_count and len(found) >= expected_count:
+            return list(found.values()) + unidentified
+        
+        # Sweep the rest of the range for new or moved displays
+        sweep = self.scan_displays(ip_range, DisplayScanner(port=port), exclude=by_port.get(port, []))
+        try:
+            async for display in sweep:
+                add(display)
+                if expected_count and len(found) >= expected_count:
+                    break
+        finally:
+            await sweep.aclose()
+        
+        return list(found.values()) + unidentified
     
     async def _test_single_ip(self, ip: str) -> Optional[Dict]:
         """Test if IP has a responsive Samsung display"""
+        scan = DisplayScanner().scan([ip])
         try:
-            adapter = SamsungLHB55ECHAdapter(1, ip)  # Use ID 1 for discovery
-            health = await adapter.health_check()
-            await adapter.disconnect()
-            
-            if health['responsive']:
-                return {
-                    'ip': ip,
-                    'model': health.get('model', 'Samsung Display'),
-                    'serial_number': health.get('serial_number'),
-                    'temperature': health.get('temperature'),
-                    'responsive': True
-                }
-        except Exception:
-            pass
-        
+            async for display in scan:
+                return display
+        finally:
+            await scan.aclose()
         return None
     
     def generate_config(self, discovered_displays: List[Dict], 
@@ -473,6 +824,106 @@ class VideoWallConfigWizard:
         return config
 
 
+class AlertStore:
+    """Bounded alert history with constant-time dedupe and per-level counts
+    
+    An alert is suppressed while an alert of the same (display, type) key is
+    still active, unless it escalates to a more severe level. Alerts stay
+    current until pushed out by newer ones, or, if retention is set, until
+    they are older than retention seconds.
+    """
+    
+    LEVEL_RANK = {'info': 0, 'warning': 1, 'error': 2, 'critical': 3}
+    
+    def __init__(self, max_alerts: int = 100, dedupe_window: float = 300,
+                 retention: Optional[float] = None):
+        self.max_alerts = max_alerts
+        self.dedupe_window = dedupe_window
+        self.retention = retention
+        self.level_counts: Counter = Counter()
+        self.suppressed = 0
+        self._alerts: deque = deque()
+        self._active: Dict[Tuple, Tuple[float, str]] = {}  # key -> (expires, level)
+        self._expiry: deque = deque()  # (expires, key) in expiry order
+    
+    def add(self, level: str, message: str, display_id: Optional[int] = None,
+            alert_type: Optional[str] = None) -> Optional[Dict]:
+        """Store an alert; returns it, or None if it was deduplicated"""
+        now = time.time()
+        self._expire(now)
+        
+        key = (display_id, alert_type or message)
+        active = self._active.get(key)
+        if active and self.LEVEL_RANK.get(level, 0) <= self.LEVEL_RANK.get(active[1], 0):
+            self.suppressed += 1
+            return None
+        
+        expires = now + self.dedupe_window
+        self._active[key] = (expires, level)
+        self._expiry.append((expires, key))
+        
+        alert = {
+            'level': level,
+            'message': message,
+            'display_id': display_id,
+            'type': alert_type,
+            'timestamp': now,
+            'id': f"{level}_{hash(message)}_{int(now)}"
+        }
+        
+        if len(self._alerts) >= self.max_alerts:
+            self._evict()
+        self._alerts.append(alert)
+        self.level_counts[level] += 1
+        return alert
+    
+    def _evict(self):
+        self.level_counts[self._alerts.popleft()['level']] -= 1
+    
+    def _expire(self, now: float):
+        """Drop expired dedupe keys and alerts past retention (amortised O(1))"""
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, key = self._expiry.popleft()
+            if self._active.get(key, (None,))[0] == expires:
+                del self._active[key]
+        
+        if self.retention is None:
+            return
+        
+        cutoff = now - self.retention
+        while self._alerts and self._alerts[0]['timestamp'] < cutoff:
+            self._evict()
+    
+    def alerts(self, level_filter: Optional[str] = None) -> List[Dict]:
+        """Stored alerts, oldest first"""
+        self._expire(time.time())
+        if level_filter:
+            if not self.level_counts[level_filter]:
+                return []
+            return [a for a in self._alerts if a['level'] == level_filter]
+        return list(self._alerts)
+    
+    def counts(self, window: Optional[float] = None) -> Dict[str, int]:
+        """Number of stored alerts per level, or only of those from the last window seconds"""
+        now = time.time()
+        self._expire(now)
+        if window is None:
+            return {level: count for level, count in self.level_counts.items() if count}
+        
+        # Newest first, stopping at the first alert outside the window
+        cutoff = now - window
+        recent: Counter = Counter()
+        for alert in reversed(self._alerts):
+            if alert['timestamp'] < cutoff:
+                break
+            recent[alert['level']] += 1
+        return dict(recent)
+    
+    def __len__(self) -> int:
+        self._expire(time.time())
+        return len(self._alerts)
+
+
 # Enhanced Monitoring Dashboard Component
 class MonitoringDashboard:
     """Real-time monitoring dashboard for video wall system"""
@@ -487,7 +938,7 @@ class MonitoringDashboard:
             'response_timeout': 10,  # seconds
             'error_count_warning': 3
         }
-        self.alerts = []
+        self.alerts = AlertStore()
     
     async def start_monitoring(self):
         """Start continuous monitoring"""
@@ -538,52 +989,39 @@ class MonitoringDashboard:
         if health_data.get('temperature'):
             temp = health_data['temperature']
             if temp >= self.alert_thresholds['temperature_critical']:
-                self._add_alert('critical', f'Display {display_id} temperature critical: {temp}°C')
+                self._add_alert('critical', f'Display {display_id} temperature critical: {temp}°C',
+                                display_id, 'temperature')
             elif temp >= self.alert_thresholds['temperature_warning']:
-                self._add_alert('warning', f'Display {display_id} temperature high: {temp}°C')
+                self._add_alert('warning', f'Display {display_id} temperature high: {temp}°C',
+                                display_id, 'temperature')
         
         # Check connectivity
         if not health_data.get('connected'):
-            self._add_alert('error', f'Display {display_id} not connected')
+            self._add_alert('error', f'Display {display_id} not connected', display_id, 'connection')
         elif not health_data.get('responsive'):
-            self._add_alert('warning', f'Display {display_id} not responding')
+            self._add_alert('warning', f'Display {display_id} not responding', display_id, 'connection')
         
         # Check response time
         if health_data.get('last_response'):
             response_age = current_time - health_data['last_response']
             if response_age > self.alert_thresholds['response_timeout']:
-                self._add_alert('warning', f'Display {display_id} last response {response_age:.1f}s ago')
+                self._add_alert('warning', f'Display {display_id} last response {response_age:.1f}s ago',
+                                display_id, 'response_time')
         
         # Check error count
         if health_data.get('error_count', 0) >= self.alert_thresholds['error_count_warning']:
-            self._add_alert('warning', f'Display {display_id} has {health_data["error_count"]} errors')
+            self._add_alert('warning', f'Display {display_id} has {health_data["error_count"]} errors',
+                            display_id, 'error_count')
     
-    def _add_alert(self, level: str, message: str):
+    def _add_alert(self, level: str, message: str, display_id: Optional[int] = None,
+                   alert_type: Optional[str] = None):
         """Add alert to the system"""
-        alert = {
-            'level': level,
-            'message': message,
-            'timestamp': time.time(),
-            'id': f"{level}_{hash(message)}_{int(time.time())}"
-        }
-        
-        # Avoid duplicate alerts (same message within 5 minutes)
-        cutoff_time = time.time() - 300
-        existing_alerts = [a for a in self.alerts if a['timestamp'] > cutoff_time and a['message'] == message]
-        
-        if not existing_alerts:
-            self.alerts.append(alert)
+        if self.alerts.add(level, message, display_id, alert_type):
             logger.warning(f"ALERT [{level.upper()}]: {message}")
-            
-            # Keep only last 100 alerts
-            if len(self.alerts) > 100:
-                self.alerts = self.alerts[-100:]
     
     def get_current_alerts(self, level_filter: Optional[str] = None) -> List[Dict]:
         """Get current alerts, optionally filtered by level"""
-        if level_filter:
-            return [a for a in self.alerts if a['level'] == level_filter]
-        return self.alerts.copy()
+        return self.alerts.alerts(level_filter)
     
     def get_system_status(self) -> Dict:
         """Get overall system status"""
@@ -593,7 +1031,9 @@ class MonitoringDashboard:
         avg_temperature = 0
         temp_count = 0
         
-        recent_alerts = [a for a in self.alerts if time.time() - a['timestamp'] < 3600]  # Last hour
+        alert_counts = self.alerts.counts(window=3600)  # Alerts from the last hour
+        recent_alerts = sum(alert_counts.values())
+        critical_alerts = alert_counts.get('critical', 0)
         
         for adapter in self.adapters.values():
             if hasattr(adapter, 'connected') and adapter.connected:
@@ -607,10 +1047,10 @@ class MonitoringDashboard:
             'connected_displays': connected_displays,
             'responsive_displays': responsive_displays,
             'connection_rate': connected_displays / total_displays if total_displays > 0 else 0,
-            'recent_alerts': len(recent_alerts),
-            'critical_alerts': len([a for a in recent_alerts if a['level'] == 'critical']),
-            'warning_alerts': len([a for a in recent_alerts if a['level'] == 'warning']),
-            'system_health': 'healthy' if len(recent_alerts) == 0 else 'warning' if len([a for a in recent_alerts if a['level'] == 'critical']) == 0 else 'critical'
+            'recent_alerts': recent_alerts,
+            'critical_alerts': critical_alerts,
+            'warning_alerts': alert_counts.get('warning', 0),
+            'system_health': 'healthy' if recent_alerts == 0 else 'warning' if critical_alerts == 0 else 'critical'
         }
 
 
@@ -0,0 +1,193 @@
+"""
+Tests for the Samsung business display adapter's discovery and monitoring helpers
+Displays are served by mdc_display_simulator (see conftest.py)
+"""
+
+import asyncio
+
+import pytest
+
+import samsung_display_adapter
+from conftest import on_mdc_loop
+from samsung_display_adapter import (AlertStore, DiscoveryCache, DisplayScanner, MonitoringDashboard,
+                                     VideoWallConfigWizard)
+
+async def collect(scanner: DisplayScanner, targets, exclude=None):
+    return [display async for display in scanner.scan(targets, exclude)]
+
+@pytest.fixture
+def junk_host():
+    """Factory for TCP servers that accept connections but do not speak MDC"""
+    servers = []
+    
+    async def serve(host, port):
+        async def reply_garbage(reader, writer):
+            await reader.read(64)
+            writer.write(b'HTTP/1.0 400 Bad Request\r\n\r\n')
+            await writer.drain()
+            writer.close()
+        
+        servers.append(await asyncio.start_server(reply_garbage, host, port))
+    
+    yield lambda host, port: on_mdc_loop(serve(host, port))
+    
+    for server in servers:
+        server.close()
+
+# Target parsing
+def test_targets_expand_lazily_from_ranges_networks_and_hosts():
+    hosts = list(DisplayScanner.expand_targets('10.0.0.0/30, 10.0.1.5-7,10.0.2.9'))
+    
+    assert hosts == ['10.0.0.1', '10.0.0.2', '10.0.1.5', '10.0.1.6', '10.0.1.7', '10.0.2.9']
+    assert DisplayScanner.target_contains('10.0.1.5-7', '10.0.1.6')
+    assert not DisplayScanner.target_contains(['10.0.0.0/30'], '10.0.0.9')
+
+@pytest.mark.parametrize('target', ['10.0.0.300', '10.0.0.9-2', '10.0.0.1-x', 'displays.local', '10.0.0.0/40'])
+def test_invalid_targets_raise_before_scanning(target):
+    scanner = DisplayScanner(port=1)
+    
+    with pytest.raises(ValueError):
+        asyncio.run(collect(scanner, target))
+    assert scanner.stats['scanned'] == 0
+
+# Scanning
+def test_scan_identifies_displays_and_skips_other_open_ports(link, junk_host):
+    display = link(host='127.0.0.1')
+    junk_host('127.0.0.2', display.port)
+    scanner = DisplayScanner(port=display.port, connect_timeout=0.5, probe_timeout=0.5)
+    
+    found = asyncio.run(collect(scanner, '127.0.0.1-3'))
+    
+    assert [(result['ip'], result['serial_number'], result['model']) for result in found] == [
+        ('127.0.0.1', 'SIM0000001', 'LH55BECHLGFXGO')]
+    assert scanner.stats == {'scanned': 3, 'open': 2, 'identified': 1}
+
+def test_scan_honours_exclusions(link):
+    display = link(host='127.0.0.1')
+    scanner = DisplayScanner(port=display.port)
+    
+    assert asyncio.run(collect(scanner, '127.0.0.1', exclude=['127.0.0.1'])) == []
+    assert scanner.stats['scanned'] == 0
+
+def test_scan_errors_reach_the_caller(monkeypatch):
+    def broken_expand(targets):
+        raise RuntimeError('host generator failed')
+        yield
+    
+    monkeypatch.setattr(DisplayScanner, '_expand', staticmethod(broken_expand))
+    
+    with pytest.raises(RuntimeError, match='host generator failed'):
+        asyncio.run(collect(DisplayScanner(port=1), '127.0.0.1'))
+
+# Discovery cache
+def sim_display(ip, port, serial='SIM0000001'):
+    return {'ip': ip, 'port': port, 'model': 'LH55BECHLGFXGO', 'serial_number': serial,
+            'software_version': 'S-BECSIM-1000.0'}
+
+def test_cache_reports_displays_that_moved(db):
+    cache = DiscoveryCache()
+    
+    assert cache.record(sim_display('10.0.0.5', 1515)) is None
+    assert cache.record(sim_display('10.0.0.5', 1515)) is None
+    assert cache.record(sim_display('10.0.0.9', 1515)) == '10.0.0.5'
+    assert cache.record(dict(sim_display('10.0.0.7', 1515), serial_number=None)) is None
+    assert [display['ip'] for display in cache.known_displays()] == ['10.0.0.9']
+
+def test_rediscovery_stops_once_cached_displays_answer(link, db, monkeypatch):
+    display = link(host='127.0.0.1')
+    cache = DiscoveryCache()
+    cache.record(sim_display('127.0.0.1', display.port))
+    wizard = VideoWallConfigWizard(cache)
+    
+    scans = []
+    scan_displays = wizard.scan_displays
+    
+    def recording_scan(ip_range, *args, **kwargs):
+        scans.append(ip_range)
+        return scan_displays(ip_range, *args, **kwargs)
+    
+    monkeypatch.setattr(wizard, 'scan_displays', recording_scan)
+    
+    found = asyncio.run(wizard.rediscover_displays('127.0.0.1-20', port=display.port))
+    
+    assert [result['serial_number'] for result in found] == ['SIM0000001']
+    assert scans == [['127.0.0.1']]
+
+def test_rediscovery_sweeps_for_a_moved_display(link, db):
+    display = link(host='127.0.0.3')
+    cache = DiscoveryCache()
+    cache.record(sim_display('127.0.0.5', display.port))
+    
+    found = asyncio.run(VideoWallConfigWizard(cache).rediscover_displays('127.0.0.1-6', port=display.port))
+    
+    assert [result['ip'] for result in found] == ['127.0.0.3']
+    assert [cached['ip'] for cached in cache.known_displays()] == ['127.0.0.3']
+
+# Alerts
+class FakeClock:
+    """Stands in for the time module so alert ages can be controlled"""
+    
+    def __init__(self):
+        self.now = 1_000_000.0
+    
+    def time(self):
+        return self.now
+    
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(samsung_display_adapter, 'time', fake)
+    return fake
+
+def test_alerts_are_deduplicated_unless_they_escalate(clock):
+    store = AlertStore(dedupe_window=300)
+    
+    assert store.add('warning', 'Display 1 temperature high: 71°C', 1, 'temperature')
+    assert store.add('warning', 'Display 1 temperature high: 72°C', 1, 'temperature') is None
+    assert store.add('critical', 'Display 1 temperature critical: 81°C', 1, 'temperature')
+    assert store.add('warning', 'Display 2 temperature high: 71°C', 2, 'temperature')
+    
+    clock.now += 301
+    assert store.add('warning', 'Display 1 temperature high: 71°C', 1, 'temperature')
+    
+    assert store.suppressed == 1
+    assert store.counts() == {'warning': 3, 'critical': 1}
+
+def test_alerts_stay_current_until_pushed_out(clock):
+    store = AlertStore(max_alerts=3)
+    for display_id in range(1, 5):
+        store.add('error', f'Display {display_id} not connected', display_id, 'connection')
+    
+    # Age alone does not expire alerts when no retention is set
+    clock.now += 7 * 86400
+    
+    assert [alert['display_id'] for alert in store.alerts()] == [2, 3, 4]
+    assert store.alerts('warning') == []
+    assert store.counts() == {'error': 3}
+
+def test_retention_and_windowed_counts(clock):
+    store = AlertStore(retention=600)
+    store.add('error', 'Display 1 not connected', 1, 'connection')
+    clock.now += 500
+    store.add('critical', 'Display 2 temperature critical: 85°C', 2, 'temperature')
+    
+    assert store.counts(window=100) == {'critical': 1}
+    
+    clock.now += 200
+    assert len(store) == 1
+    assert store.counts() == {'critical': 1}
+
+def test_dashboard_status_counts_only_the_last_hour(clock):
+    dashboard = MonitoringDashboard({})
+    dashboard._process_health_result({'display_id': 1, 'connected': True, 'responsive': True,
+                                      'temperature': 85})
+    assert dashboard.get_system_status()['system_health'] == 'critical'
+    
+    clock.now += 3601
+    status = dashboard.get_system_status()
+    
+    assert status['recent_alerts'] == 0 and status['system_health'] == 'healthy'
+    assert len(dashboard.get_current_alerts()) == 1
@@ -5,12 +5,22 @@ Complete solution for managing Samsung Business Displays
 """
 
 import asyncio
+import os
 import socket
 import struct
 import json
 import logging
 import time
+import random
 import threading
+import uuid
+import queue
+import atexit
+import bisect
+import zlib
+import base64
+from array import array
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
@@ -19,9 +29,10 @@ from pathlib import Path
 import sqlite3
 from contextlib import contextmanager
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify, render_template_string
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 import requests
 import schedule
 import yaml
@@ -38,7 +49,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Initialize Flask app
+class MDCJSONProvider(DefaultJSONProvider):
+    """JSON responses that carry raw MDC bytes as hex strings"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, (bytes, bytearray)):
+            return o.hex()
+        return DefaultJSONProvider.default(o)
+
 app = Flask(__name__)
+app.json = MDCJSONProvider(app)
 app.config['SECRET_KEY'] = 'samsung-lh55bechlgfxgo-control-system'
 CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
@@ -87,6 +108,9 @@ class LH55BECHLGFXGOSpecs:
 
 class MDCCommand(Enum):
     """Samsung MDC Protocol Commands for LH55BECHLGFXGO"""
+    # Status (power, volume, mute, input and picture mode in one reply)
+    STATUS = 0x00
+    
     # Power Control
     POWER = 0x11
     POWER_STATUS = 0xF1
@@ -136,6 +160,9 @@ class MDCCommand(Enum):
     POWER_OFF_DELAY = 0x1E
     OSD_DISPLAY = 0x3B
 
+# MDC display ID addressing every display on a daisy chain (no replies are sent)
+MDC_BROADCAST_ID = 0xFE
+
 class InputSource(Enum):
     """Input sources for Samsung LH55BECHLGFXGO"""
     HDMI1 = 0x21
@@ -186,6 +213,7 @@ class DisplayStatus:
     # System info
     temperature: Optional[int] = None
     serial_number: Optional[str] = None
+    model_number: Optional[str] = None
     software_version: Optional[str] = None
     uptime: Optional[str] = None
     
@@ -204,9 +232,199 @@ class DisplayStatus:
             data['last_seen'] = self.last_seen.isoformat()
         return data
 
+class RTTEstimator:
+    """Smoothed round-trip time estimate (TCP style, RFC 6298) used to derive timeouts"""
+    
+    ALPHA = 0.125  # Gain for the mean
+    BETA = 0.25    # Gain for the deviation
+    
+    def __init__(self, initial_timeout: float = 3.0, min_timeout: float = 0.2,
+                 max_timeout: float = 5.0):
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.backoff = 1
+    
+    def observe(self, sample: float):
+        """Fold a measured round trip (seconds) into the estimate"""
+        if self.srtt is None:
+            self.srtt = sample
+            self.rttvar = sample / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - sample)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * sample
+        self.backoff = 1
+    
+    def on_timeout(self):
+        """Double the timeout until the next successful sample"""
+        self.backoff = min(self.backoff * 2, 64)
+    
+    @property
+    def timeout(self) -> float:
+        """Current timeout, clamped to [min_timeout, max_timeout]"""
+        if self.srtt is None:
+            base = self.initial_timeout
+        else:
+            base = self.srtt + 4 * self.rttvar
+        return max(self.min_timeout, min(self.max_timeout, base * self.backoff))
+
+class CommandMetrics:
+    """Per-display MDC command latency histograms and counters for /metrics
+    
+    Only touched from the MDC loop, so plain lists and dicts are enough.
+    """
+    
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self):
+        self.histograms: Dict[str, List[float]] = {}  # command -> bucket counts, then +Inf, sum
+        self.counters: Dict[str, int] = {'retries': 0, 'timeouts': 0, 'failures': 0}
+    
+    def observe(self, command: str, seconds: float, success: bool):
+        """Record one command's latency, including its retries"""
+        histogram = self.histograms.get(command)
+        if histogram is None:
+            histogram = self.histograms[command] = [0] * (len(self.BUCKETS) + 1) + [0.0]
+        histogram[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+        histogram[-1] += seconds
+        if not success:
+            self.counters['failures'] += 1
+    
+    def count(self, name: str):
+        """Increment a counter"""
+        self.counters[name] += 1
+
+class CircuitBreaker:
+    """Per-display circuit breaker so unreachable displays fail fast
+    
+    closed: commands go to the display. open: commands fail immediately with a
+    cached unreachable result. half_open: a single background probe is deciding
+    whether to close again.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int = 2, max_error_count: int = 5):
+        self.failure_threshold = failure_threshold
+        self.max_error_count = max_error_count
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+    
+    @property
+    def is_open(self) -> bool:
+        """True while commands should fail fast (open or half-open)"""
+        return self.state != self.CLOSED
+    
+    def record_success(self):
+        """Close the breaker after a successful command"""
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.last_error = None
+    
+    def record_failure(self, error: str, error_count: int = 0) -> bool:
+        """Count a failed command; returns True if this opened the breaker"""
+        self.consecutive_failures += 1
+        self.last_error = error
+        
+        if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and (
+                    self.consecutive_failures >= self.failure_threshold or
+                    error_count >= self.max_error_count)):
+            was_closed = self.state == self.CLOSED
+            self.state = self.OPEN
+            self.opened_at = datetime.now()
+            return was_closed
+        return False
+    
+    def half_open(self):
+        """Let a single probe through"""
+        self.state = self.HALF_OPEN
+    
+    def unreachable_result(self, display_id: int) -> Dict[str, Any]:
+        """Cached negative result returned while the breaker is open"""
+        return {
+            'success': False,
+            'error': f'Display {display_id} unreachable (circuit {self.state})',
+            'circuit_state': self.state,
+            'last_error': self.last_error,
+            'unreachable_since': self.opened_at.isoformat() if self.opened_at else None
+        }
+
+class MDCFrameDecoder:
+    """Incremental decoder that cuts complete MDC frames out of a TCP byte stream"""
+    
+    HEADER = 0xAA
+    
+    def __init__(self):
+        self.buffer = bytearray()
+        self.checksum_errors = 0
+    
+    def feed(self, chunk: bytes):
+        """Append received bytes to the buffer"""
+        self.buffer.extend(chunk)
+    
+    def next_frame(self) -> Optional[bytes]:
+        """Return the next complete frame, or None if more bytes are needed"""
+        while True:
+            # Resynchronize on the next header byte
+            start = self.buffer.find(self.HEADER)
+            if start < 0:
+                self.buffer.clear()
+                return None
+            if start > 0:
+                del self.buffer[:start]
+            
+            # Header, command, display ID and length byte, then data and checksum
+            if len(self.buffer) < 4:
+                return None
+            frame_length = 4 + self.buffer[3] + 1
+            if len(self.buffer) < frame_length:
+                return None
+            
+            frame = bytes(self.buffer[:frame_length])
+            if sum(frame[:-1]) & 0xFF != frame[-1]:
+                # Corrupt frame - drop the header byte and look for the next one
+                self.checksum_errors += 1
+                logger.warning(f"Checksum mismatch in MDC frame {frame.hex()}")
+                del self.buffer[:1]
+                continue
+            
+            del self.buffer[:frame_length]
+            return frame
+    
+    def reset(self):
+        """Discard any buffered bytes"""
+        self.buffer.clear()
+
+# Shared event loop for display I/O. Flask runs each async view in its own
+# short-lived loop, so connections and command actors live here instead.
+_mdc_loop: Optional[asyncio.AbstractEventLoop] = None
+_mdc_loop_lock = threading.Lock()
+
+def get_mdc_loop() -> asyncio.AbstractEventLoop:
+    """Get (starting if needed) the event loop that owns all display connections"""
+    global _mdc_loop
+    
+    with _mdc_loop_lock:
+        if _mdc_loop is None or _mdc_loop.is_closed():
+            _mdc_loop = asyncio.new_event_loop()
+            threading.Thread(target=_mdc_loop.run_forever, name='mdc-io', daemon=True).start()
+    
+    return _mdc_loop
+
 class SamsungLH55BECHLGFXGOController:
     """Controller for Samsung LH55BECHLGFXGO Business Display"""
     
+    # Replies to these wait on the panel itself, not just the network
+    SLOW_COMMANDS = (MDCCommand.POWER, MDCCommand.VIDEO_WALL_MODE, MDCCommand.VIDEO_WALL_ON)
+    
     def __init__(self, display_id: int, ip: str, port: int = 1515):
         self.display_id = display_id
         self.ip = ip
@@ -217,17 +435,111 @@ class SamsungLH55BECHLGFXGOController:
             name=f"Samsung LH55BECHLGFXGO-{display_id}",
             ip=ip
         )
-        self.connection_timeout = 10.0
-        self.command_timeout = 5.0
         self.max_retries = 3
         
+        # Timeouts follow this display's measured round-trip time
+        self.rtt = RTTEstimator(
+            initial_timeout=config.get('mdc.initial_timeout', 3.0),
+            min_timeout=config.get('mdc.min_timeout', 0.2),
+            max_timeout=config.get('mdc.max_timeout', 5.0)
+        )
+        
+        # Unreachable displays fail fast until a background probe gets an answer
+        self.breaker = CircuitBreaker(
+            failure_threshold=config.get('mdc.breaker_failure_threshold', 2),
+            max_error_count=config.get('monitoring.max_error_count', 5)
+        )
+        self._probe_task: Optional[asyncio.Task] = None
+        self._probing = False
+        
+        # Latency histograms and error counters exported on /metrics
+        self.metrics = CommandMetrics()
+        
         # Connection management
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
         self.connected = False
+        self._decoder = MDCFrameDecoder()
+        
+        # Command actor - owns the reader/writer pair and runs one request at a time
+        self._command_queue: Optional[asyncio.Queue] = None
+        self._actor_task: Optional[asyncio.Task] = None
+        
+        # Identity tier - serial, model and firmware are fetched once per connection
+        self._connection_generation = 0
+        self._identity_generation = -1
+        self._identity_refreshed_at = 0.0
         
+    async def _call(self, func, *args) -> Any:
+        """Run func on the command actor and wait for its result"""
+        loop = get_mdc_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._enqueue(func, *args)
+        
+        future = asyncio.run_coroutine_threadsafe(self._enqueue(func, *args), loop)
+        return await asyncio.wrap_future(future)
+    
+    async def _enqueue(self, func, *args) -> Any:
+        """Queue a request for the actor (runs on the MDC loop)"""
+        if self._command_queue is None:
+            self._command_queue = asyncio.Queue()
+        if self._actor_task is None or self._actor_task.done():
+            self._actor_task = asyncio.get_running_loop().create_task(self._run_actor())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._command_queue.put((func, args, future))
+        return await future
+    
+    async def _run_actor(self):
+        """Process queued requests in order over a single connection"""
+        while True:
+            func, args, future = await self._command_queue.get()
+            try:
+                if future.cancelled():
+                    continue
+                
+                try:
+                    result = await func(*args)
+                except Exception as e:
+                    logger.error(f"Actor request failed for display {self.display_id}: {e}")
+                    if not future.done():
+                        future.set_exception(e)
+                    continue
+                
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._command_queue.task_done()
+    
+    @property
+    def connection_timeout(self) -> float:
+        """Connect timeout derived from the RTT estimate, never below mdc.connect_min_timeout"""
+        return max(config.get('mdc.connect_min_timeout', 1.0), self.rtt.timeout)
+    
+    def command_timeout(self, command: MDCCommand) -> float:
+        """Reply timeout derived from the RTT estimate, with a higher floor for slow commands"""
+        if command in self.SLOW_COMMANDS:
+            return max(config.get('mdc.slow_command_min_timeout', 3.0), self.rtt.timeout)
+        return self.rtt.timeout
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter before retry number attempt + 1"""
+        base = config.get('mdc.retry_backoff_base', 0.05)
+        cap = config.get('mdc.retry_backoff_max', 1.0)
+        return random.uniform(0, min(cap, base * (2 ** attempt)))
+    
     async def connect(self) -> bool:
         """Establish connection to display"""
+        if self.breaker.is_open:
+            return False
+        return await self._call(self._connect)
+    
+    async def disconnect(self):
+        """Close connection to display"""
+        await self._call(self._disconnect)
+    
+    async def _connect(self) -> bool:
+        """Open the display connection (actor only)"""
         try:
             logger.info(f"Connecting to Samsung LH55BECHLGFXGO at {self.ip}:{self.port}")
             
@@ -236,6 +548,8 @@ class SamsungLH55BECHLGFXGOController:
                 timeout=self.connection_timeout
             )
             
+            self._decoder.reset()
+            self._connection_generation += 1
             self.connected = True
             self.status.online = True
             self.status.last_seen = datetime.now()
@@ -246,6 +560,7 @@ class SamsungLH55BECHLGFXGOController:
             
         except asyncio.TimeoutError:
             logger.warning(f"Connection timeout for display {self.display_id}")
+            self.rtt.on_timeout()
             self.status.online = False
             return False
         except Exception as e:
@@ -254,8 +569,8 @@ class SamsungLH55BECHLGFXGOController:
             self.status.error_count += 1
             return False
     
-    async def disconnect(self):
-        """Close connection to display"""
+    async def _disconnect(self):
+        """Close the display connection (actor only)"""
         if self.writer:
             try:
                 self.writer.close()
@@ -266,12 +581,19 @@ class SamsungLH55BECHLGFXGOController:
         self.connected = False
         self.reader = None
         self.writer = None
+        self._decoder.reset()
     
-    def _create_mdc_packet(self, command: MDCCommand, data: bytes = b'') -> bytes:
+    @property
+    def link(self) -> Tuple[str, int]:
+        """Physical link (IP and port) this display is reached through"""
+        return (self.ip, self.port)
+    
+    def _create_mdc_packet(self, command: MDCCommand, data: bytes = b'',
+                           display_id: Optional[int] = None) -> bytes:
         """Create MDC protocol packet for Samsung LH55BECHLGFXGO"""
         header = 0xAA
         cmd = command.value
-        display_id = self.display_id
+        display_id = self.display_id if display_id is None else display_id
         data_length = len(data)
         
         # Calculate checksum (sum all bytes except checksum itself)
@@ -320,21 +642,76 @@ class SamsungLH55BECHLGFXGOController:
         except struct.error as e:
             return {'success': False, 'error': f'Parse error: {str(e)}'}
     
+    async def _read_frame(self) -> bytes:
+        """Read from the connection until one complete frame is available"""
+        while True:
+            frame = self._decoder.next_frame()
+            if frame is not None:
+                return frame
+            
+            chunk = await self.reader.read(1024)
+            if not chunk:
+                raise ConnectionError('Connection closed by display')
+            self._decoder.feed(chunk)
+    
+    async def _read_response(self, command: MDCCommand) -> bytes:
+        """Read the reply to command, skipping stale frames from earlier requests"""
+        while True:
+            frame = await self._read_frame()
+            if frame[1] == command.value:
+                return frame
+            logger.debug(f"Discarding stale frame for command 0x{frame[1]:02X} from display {self.display_id}")
+    
     async def send_command(self, command: MDCCommand, data: bytes = b'', 
                           expect_response: bool = True) -> Dict[str, Any]:
         """Send command to Samsung LH55BECHLGFXGO display"""
+        if self.breaker.is_open:
+            return self.breaker.unreachable_result(self.display_id)
+        return await self._call(self._execute_command, command, data, expect_response)
+    
+    async def send_broadcast(self, command: MDCCommand, data: bytes = b'') -> Dict[str, Any]:
+        """Send command to every display on this link using the MDC all-displays ID"""
+        if self.breaker.is_open:
+            return self.breaker.unreachable_result(self.display_id)
+        return await self._call(self._execute_command, command, data, False, MDC_BROADCAST_ID)
+    
+    async def _execute_command(self, command: MDCCommand, data: bytes = b'',
+                               expect_response: bool = True,
+                               target_id: Optional[int] = None) -> Dict[str, Any]:
+        """Write one command and read its reply (actor only)"""
+        
+        # Commands queued before the breaker opened fail fast too
+        if self.breaker.is_open and not self._probing:
+            return self.breaker.unreachable_result(self.display_id)
+        
+        started = time.monotonic()
+        result = await self._send_with_retries(command, data, expect_response, target_id)
+        elapsed = time.monotonic() - started
+        self.metrics.observe(command.name, elapsed, result['success'])
         
+        result.setdefault('command', command.value)
+        result['latency_ms'] = round(elapsed * 1000, 2)
+        return result
+    
+    async def _send_with_retries(self, command: MDCCommand, data: bytes, expect_response: bool,
+                                 target_id: Optional[int]) -> Dict[str, Any]:
+        """Retry loop for _execute_command (actor only)"""
         for attempt in range(self.max_retries):
+            if attempt > 0:
+                self.metrics.count('retries')
+                await asyncio.sleep(self._retry_delay(attempt - 1))
+            
             try:
                 # Ensure connection
                 if not self.connected:
-                    if not await self.connect():
+                    if not await self._connect():
                         continue
                 
                 # Create and send packet
-                packet = self._create_mdc_packet(command, data)
+                packet = self._create_mdc_packet(command, data, target_id)
                 
                 logger.debug(f"Sending command {command.name} to display {self.display_id}")
+                sent_at = time.monotonic()
                 self.writer.write(packet)
                 await self.writer.drain()
                 
@@ -342,39 +719,76 @@ class SamsungLH55BECHLGFXGOController:
                     # Wait for response
                     try:
                         response = await asyncio.wait_for(
-                            self.reader.read(1024),
-                            timeout=self.command_timeout
+                            self._read_response(command),
+                            timeout=self.command_timeout(command)
                         )
+                        if command not in self.SLOW_COMMANDS:
+                            # Panel processing time would inflate the network RTT
+                            self.rtt.observe(time.monotonic() - sent_at)
                         
-                        if response:
-                            result = self._parse_mdc_response(response)
-                            if result['success']:
-                                self.status.responsive = True
-                                self.status.last_seen = datetime.now()
-                                return result
-                            else:
-                                logger.warning(f"Command {command.name} failed: {result['error']}")
+                        result = self._parse_mdc_response(response)
+                        if result['success']:
+                            self.status.responsive = True
+                            self.status.last_seen = datetime.now()
+                            self.breaker.record_success()
+                            result['attempts'] = attempt + 1
+                            return result
+                        else:
+                            logger.warning(f"Command {command.name} failed: {result['error']}")
                                 
                     except asyncio.TimeoutError:
                         logger.warning(f"Command {command.name} timeout for display {self.display_id}")
-                        self.connected = False
+                        self.metrics.count('timeouts')
+                        self.rtt.on_timeout()
+                        await self._disconnect()
                         continue
                 else:
                     # Command sent successfully without expecting response
                     self.status.last_seen = datetime.now()
-                    return {'success': True, 'message': f'Command {command.name} sent'}
+                    self.breaker.record_success()
+                    return {'success': True, 'message': f'Command {command.name} sent', 'attempts': attempt + 1}
                 
             except Exception as e:
                 logger.error(f"Command {command.name} attempt {attempt + 1} failed: {e}")
-                self.connected = False
+                await self._disconnect()
                 self.status.error_count += 1
-                
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1)  # Wait before retry
         
         # All attempts failed
         self.status.responsive = False
-        return {'success': False, 'error': f'Command {command.name} failed after {self.max_retries} attempts'}
+        error = f'Command {command.name} failed after {self.max_retries} attempts'
+        self._record_failure(error)
+        return {'success': False, 'error': error, 'attempts': self.max_retries}
+    
+    def _record_failure(self, error: str):
+        """Feed a failed command to the circuit breaker (actor only)"""
+        if self.breaker.record_failure(error, self.status.error_count):
+            logger.warning(f"Circuit opened for display {self.display_id}: {error}")
+            self.status.online = False
+        
+        if self.breaker.is_open and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.get_running_loop().create_task(self._run_probe())
+    
+    async def _run_probe(self):
+        """Background probe that closes the breaker once the display answers again"""
+        delay = config.get('mdc.breaker_reset_timeout', 10.0)
+        max_delay = config.get('mdc.breaker_max_reset_timeout', 120.0)
+        
+        while self.breaker.is_open:
+            await asyncio.sleep(delay)
+            if await self._enqueue(self._probe_once):
+                logger.info(f"Circuit closed for display {self.display_id}")
+                return
+            delay = min(delay * 2, max_delay)
+    
+    async def _probe_once(self) -> bool:
+        """Let one status query through the half-open breaker (actor only)"""
+        self.breaker.half_open()
+        self._probing = True
+        try:
+            result = await self._execute_command(MDCCommand.STATUS)
+        finally:
+            self._probing = False
+        return result['success']
     
     # Power Control Methods
     async def power_on(self) -> Dict[str, Any]:
@@ -400,6 +814,41 @@ class SamsungLH55BECHLGFXGOController:
             result['power_on'] = self.status.power
         return result
     
+    async def get_full_status(self) -> Dict[str, Any]:
+        """Get power, volume, mute, input and picture mode in a single round trip"""
+        result = await self.send_command(MDCCommand.STATUS)
+        if not result['success']:
+            return result
+        
+        data = result.get('data', b'')
+        if len(data) < 5:
+            return {'success': False, 'error': f'Status reply too short ({len(data)} bytes)'}
+        
+        power, volume, mute, input_code, picture_code = data[:5]
+        self.status.power = power == PowerState.ON.value
+        self.status.volume = volume
+        self.status.muted = mute == 0x01
+        
+        try:
+            self.status.input_source = InputSource(input_code).name
+        except ValueError:
+            self.status.input_source = f'0x{input_code:02X}'
+        
+        try:
+            self.status.picture_mode = PictureMode(picture_code).name
+        except ValueError:
+            self.status.picture_mode = f'0x{picture_code:02X}'
+        
+        result['power_on'] = self.status.power
+        result['status'] = {
+            'power': self.status.power,
+            'volume': self.status.volume,
+            'muted': self.status.muted,
+            'input_source': self.status.input_source,
+            'picture_mode': self.status.picture_mode
+        }
+        return result
+    
     # Audio Control Methods
     async def set_volume(self, volume: int) -> Dict[str, Any]:
         """Set display volume (0-100)"""
@@ -478,6 +927,7 @@ class SamsungLH55BECHLGFXGOController:
         result = await self.send_command(MDCCommand.MODEL_NUMBER)
         if result['success'] and result.get('data'):
             model = result['data'].decode('ascii', errors='ignore').strip()
+            self.status.model_number = model
             result['model_number'] = model
         return result
     
@@ -490,6 +940,44 @@ class SamsungLH55BECHLGFXGOController:
             result['software_version'] = version
         return result
     
+    def identity_due(self) -> bool:
+        """True if identity fields have not been read on this connection or are too old"""
+        if self._identity_generation != self._connection_generation:
+            return True
+        
+        interval = config.get('monitoring.identity_refresh_interval', 86400)
+        return time.monotonic() - self._identity_refreshed_at >= interval
+    
+    async def refresh_identity(self, force: bool = False) -> Dict[str, Any]:
+        """Fetch serial number, model number and software version when due, else use the cache"""
+        if not self.connected:
+            # Connect first so the cached identity is tied to the connection it was read on
+            await self.connect()
+        
+        if force or self.identity_due():
+            generation = self._connection_generation
+            
+            # The command actor serializes these on one connection
+            results = await asyncio.gather(
+                self.get_serial_number(),
+                self.get_model_number(),
+                self.get_software_version(),
+                return_exceptions=True
+            )
+            
+            if all(isinstance(r, dict) and r.get('success') for r in results):
+                self._identity_generation = generation
+                self._identity_refreshed_at = time.monotonic()
+                # SQLite write off the MDC loop so other displays are not stalled
+                await asyncio.to_thread(save_display_identity, self)
+        
+        identity = {
+            'serial_number': self.status.serial_number,
+            'model_number': self.status.model_number,
+            'software_version': self.status.software_version
+        }
+        return {key: value for key, value in identity.items() if value}
+    
     # Video Wall Methods
     async def set_video_wall_mode(self, enabled: bool, h_monitors: int = 1, 
                                  v_monitors: int = 1, h_position: int = 1, 
@@ -545,6 +1033,7 @@ class SamsungLH55BECHLGFXGOController:
             
             health_data['connection'] = {
                 'status': 'connected' if connection_success else 'failed',
+                'circuit_state': self.breaker.state,
                 'error_count': self.status.error_count,
                 'last_seen': self.status.last_seen.isoformat() if self.status.last_seen else None
             }
@@ -554,9 +1043,9 @@ class SamsungLH55BECHLGFXGOController:
                 health_data['overall_health'] = 'critical'
                 return health_data
             
-            # Test power status
+            # Test power status (full status query also refreshes volume, mute, input and picture mode)
             try:
-                power_result = await self.get_power_status()
+                power_result = await self.get_full_status()
                 health_data['power'] = {
                     'status': 'on' if power_result.get('power_on') else 'off',
                     'responsive': power_result['success']
@@ -588,24 +1077,9 @@ class SamsungLH55BECHLGFXGOController:
             except Exception as e:
                 health_data['temperature'] = {'status': 'error', 'error': str(e)}
             
-            # Get system information
+            # Get system information (cached, only re-queried when the identity tier is due)
             try:
-                tasks = [
-                    self.get_serial_number(),
-                    self.get_model_number(),
-                    self.get_software_version()
-                ]
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for i, result in enumerate(results):
-                    if isinstance(result, dict) and result.get('success'):
-                        if i == 0 and 'serial_number' in result:
-                            health_data['system_info']['serial_number'] = result['serial_number']
-                        elif i == 1 and 'model_number' in result:
-                            health_data['system_info']['model_number'] = result['model_number']
-                        elif i == 2 and 'software_version' in result:
-                            health_data['system_info']['software_version'] = result['software_version']
+                health_data['system_info'] = await self.refresh_identity()
                             
             except Exception as e:
                 logger.debug(f"System info gathering failed: {e}")
@@ -626,13 +1100,106 @@ class SamsungLH55BECHLGFXGOController:
             health_data['error'] = str(e)
         
         return health_data
+    
+    def status_summary(self) -> Dict[str, Any]:
+        """Current status merged with health-check style fields for the web UI"""
+        data = self.status.to_dict()
+        data['connection'] = {
+            'status': 'connected' if self.status.online else 'failed',
+            'error_count': self.status.error_count,
+            'last_seen': data['last_seen']
+        }
+        data['power'] = {
+            'status': 'on' if self.status.power else 'off',
+            'responsive': self.status.responsive
+        }
+        
+        temp = self.status.temperature
+        if temp is not None:
+            data['temperature'] = {
+                'value': temp,
+                'status': 'normal' if temp < 60 else 'warning' if temp < 70 else 'critical',
+                'unit': 'celsius'
+            }
+        else:
+            data['temperature'] = {'status': 'unavailable'}
+        
+        return data
 
 # Database Management
+def database_path() -> str:
+    """SQLite file named by DATABASE_URL (a path or sqlite:/// URL), as in config.py"""
+    url = os.getenv('DATABASE_URL', 'samsung_video_wall.db')
+    return url[len('sqlite:///'):] if url.startswith('sqlite:///') else url
+
+class SQLitePool:
+    """Reusable SQLite connections tuned for many small writes
+    
+    Each get_db() block checks out a connection of its own, so a thread or
+    task never shares one with another while using it. Connections are
+    opened once with WAL journaling, synchronous=NORMAL, a larger page cache
+    and a prepared-statement cache, and returned to the pool afterwards.
+    """
+    
+    def __init__(self, path: str, max_idle: int = 8, cache_size_kb: int = 8192,
+                 cached_statements: int = 256, busy_timeout: float = 5.0):
+        self.path = path
+        self.max_idle = max_idle
+        self.cache_size_kb = cache_size_kb
+        self.cached_statements = cached_statements
+        self.busy_timeout = busy_timeout
+        self._idle: deque = deque()
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        # Checked-out connections have a single user, so they may move between threads
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA cache_size=-{self.cache_size_kb}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+    
+    def acquire(self) -> sqlite3.Connection:
+        """Most recently used idle connection, or a new one"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+    
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection, rolling back anything left uncommitted"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding database connection: {e}")
+            conn.close()
+            return
+        
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+    
+    def close(self):
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn in idle:
+            conn.close()
+
+db_pool = SQLitePool(database_path())
+
 def init_database():
     """Initialize SQLite database for the video wall system"""
-    db_path = Path('samsung_video_wall.db')
+    db_path = Path(db_pool.path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with sqlite3.connect(db_path) as conn:
+    with get_db() as conn:
         # Display status table
         conn.execute('''
             CREATE TABLE IF NOT EXISTS display_status (
@@ -651,6 +1218,7 @@ def init_database():
                 contrast INTEGER DEFAULT 50,
                 temperature INTEGER,
                 serial_number TEXT,
+                model_number TEXT,
                 software_version TEXT,
                 current_content TEXT,
                 video_wall_enabled BOOLEAN DEFAULT 0,
@@ -659,6 +1227,22 @@ def init_database():
                 error_count INTEGER DEFAULT 0
             )
         ''')
+        add_missing_columns(conn, 'display_status', {
+            'model_number': 'TEXT'
+        })
+        
+        # Network discovery cache, keyed by serial so moved displays are recognised
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS discovered_displays (
+                serial_number TEXT PRIMARY KEY,
+                ip TEXT NOT NULL,
+                port INTEGER DEFAULT 1515,
+                model TEXT,
+                software_version TEXT,
+                first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
         
         # Content library table
         conn.execute('''
@@ -684,9 +1268,47 @@ def init_database():
                 status TEXT NOT NULL,
                 content_id TEXT,
                 details TEXT,
+                command TEXT,
+                latency_ms REAL,
+                success BOOLEAN,
+                attempts INTEGER,
                 timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        add_missing_columns(conn, 'deployment_log', {
+            'command': 'TEXT',
+            'latency_ms': 'REAL',
+            'success': 'BOOLEAN',
+            'attempts': 'INTEGER'
+        })
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_deployment_log_status_time ON deployment_log (status, timestamp)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_deployment_log_display_time ON deployment_log (display_id, timestamp)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_deployment_log_time_id ON deployment_log (timestamp, id)')
+        
+        # Daily per-display summaries of deployment_log, kept after the rows are purged
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS deployment_log_daily (
+                day TEXT NOT NULL,
+                display_id INTEGER NOT NULL,
+                actions INTEGER DEFAULT 0,
+                successes INTEGER DEFAULT 0,
+                errors INTEGER DEFAULT 0,
+                warnings INTEGER DEFAULT 0,
+                attempts INTEGER DEFAULT 0,
+                latency_count INTEGER DEFAULT 0,
+                total_latency_ms REAL DEFAULT 0,
+                max_latency_ms REAL,
+                PRIMARY KEY (day, display_id)
+            )
+        ''')
+        
+        # Highest deployment_log id already counted in deployment_log_daily
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS deployment_log_rollup_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                last_id INTEGER NOT NULL
+            )
+        ''')
         
         # Scheduled tasks table
         conn.execute('''
@@ -731,15 +1353,354 @@ def init_database():
         
     logger.info(f"Database initialized: {db_path}")
 
+def add_missing_columns(conn: sqlite3.Connection, table: str, columns: Dict[str, str]):
+    """Bring a table created by an older version up to date"""
+    existing = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+    for name, column_type in columns.items():
+        if name not in existing:
+            conn.execute(f'ALTER TABLE {table} ADD COLUMN {name} {column_type}')
+            logger.info(f"Added column {table}.{name}")
+
 @contextmanager
 def get_db():
-    """Database context manager"""
-    conn = sqlite3.connect('samsung_video_wall.db')
-    conn.row_factory = sqlite3.Row
+    """Database context manager backed by the connection pool"""
+    conn = db_pool.acquire()
     try:
         yield conn
     finally:
-        conn.close()
+        db_pool.release(conn)
+
+# Deployment log encoding
+def compact_result(value: Any) -> Any:
+    """Copy of a command result that json.dumps accepts
+    
+    Raw reply frames are dropped (the parsed fields already hold their
+    contents) and any other bytes are hex-encoded.
+    """
+    if isinstance(value, dict):
+        return {key: compact_result(item) for key, item in value.items() if key != 'raw_response'}
+    if isinstance(value, (list, tuple)):
+        return [compact_result(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    return value
+
+def result_columns(result: Any) -> Dict[str, Any]:
+    """Normalized deployment_log columns for a single command result"""
+    if not isinstance(result, dict) or 'success' not in result:
+        return {}
+    
+    command = result.get('command')
+    if isinstance(command, int):
+        try:
+            command = MDCCommand(command).name
+        except ValueError:
+            command = f'0x{command:02X}'
+    
+    return {
+        'command': command,
+        'latency_ms': result.get('latency_ms'),
+        'success': bool(result['success']),
+        'attempts': result.get('attempts')
+    }
+
+def encode_details(details: Any) -> Optional[Any]:
+    """Compact JSON for deployment_log.details, zlib-compressed above audit_log.compress_threshold bytes"""
+    if details is None:
+        return None
+    
+    text = details if isinstance(details, str) else json.dumps(
+        compact_result(details), separators=(',', ':'), default=str)
+    
+    threshold = config.get('audit_log.compress_threshold', 1024)
+    if threshold and len(text) > threshold:
+        compressed = zlib.compress(text.encode('utf-8'))
+        if len(compressed) < len(text):
+            return compressed
+    return text
+
+def decode_details(value: Any) -> Optional[str]:
+    """deployment_log.details as text, whether or not it was stored compressed"""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode('utf-8')
+    return value
+
+class DeploymentLogWriter:
+    """Write-behind queue for deployment_log rows
+    
+    Request handlers only enqueue. A background thread serializes the rows
+    and inserts them with executemany in one transaction every
+    audit_log.flush_interval seconds, or sooner once audit_log.batch_size
+    rows are waiting. Queued rows are flushed at interpreter exit.
+    """
+    
+    def __init__(self, flush_interval: Optional[float] = None, batch_size: Optional[int] = None):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.stats = {'queued': 0, 'written': 0, 'batches': 0, 'errors': 0}
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def log(self, display_id: int, action: str, status: str, details: Any = None,
+            timestamp: Optional[datetime] = None, **columns):
+        """Queue one row
+        
+        details may be a string or a command result (or anything holding
+        them). command, latency_ms, success and attempts are taken from a
+        single command result unless given as keyword arguments.
+        """
+        self._queue.put((display_id, action, status, details, timestamp or datetime.now(), columns))
+        self.stats['queued'] += 1
+        
+        if self._thread is None:
+            self.start()
+    
+    def start(self):
+        """Start the writer thread"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='deployment-log', daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+    
+    def close(self):
+        """Write everything queued and stop the writer thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+    
+    def _run(self):
+        flush_interval = self.flush_interval or config.get('audit_log.flush_interval', 0.25)
+        batch_size = self.batch_size or config.get('audit_log.batch_size', 500)
+        
+        while True:
+            # Block for the first row, then gather more until the interval or batch size is reached
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + flush_interval
+            
+            while batch[-1] is not None and len(batch) < batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            stopping = batch[-1] is None
+            rows = [row for row in batch if row is not None]
+            if rows:
+                self._write(rows)
+            if stopping:
+                # Anything queued after close() was called
+                rows = []
+                while not self._queue.empty():
+                    row = self._queue.get_nowait()
+                    if row is not None:
+                        rows.append(row)
+                if rows:
+                    self._write(rows)
+                return
+    
+    def _write(self, rows: List[Tuple]):
+        params = []
+        for display_id, action, status, details, timestamp, columns in rows:
+            columns = {**result_columns(details), **columns}
+            params.append((
+                display_id, action, status, encode_details(details),
+                columns.get('command'), columns.get('latency_ms'),
+                columns.get('success'), columns.get('attempts'), timestamp
+            ))
+        
+        try:
+            with get_db() as conn:
+                conn.executemany('''
+                    INSERT INTO deployment_log
+                    (display_id, action, status, details, command, latency_ms, success, attempts, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', params)
+                conn.commit()
+            self.stats['written'] += len(params)
+            self.stats['batches'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Failed to write {len(params)} deployment log rows: {e}")
+
+audit_log = DeploymentLogWriter()
+
+class DeploymentLogMaintenance:
+    """Scheduled rollup and retention purge for deployment_log
+    
+    rollup() folds every row not yet counted into deployment_log_daily,
+    walking forward by id so each run only reads new rows. purge() then
+    deletes rows older than monitoring.log_retention_days in short
+    transactions of monitoring.log_purge_batch_size rows, oldest first, and
+    never touches rows the rollup has not counted yet.
+    """
+    
+    def __init__(self):
+        self.stats = {'rolled_up': 0, 'purged': 0, 'runs': 0, 'errors': 0}
+        self._scheduler = schedule.Scheduler()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()  # One rollup or purge at a time
+    
+    def start(self):
+        """Roll up and purge now, then every monitoring.log_purge_interval minutes"""
+        if self._thread is not None:
+            return
+        
+        self._scheduler.every(config.get('monitoring.log_purge_interval', 10)).minutes.do(self.run)
+        
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='deployment-log-maintenance', daemon=True)
+        self._thread.start()
+        logger.info("Deployment log maintenance started")
+    
+    def stop(self):
+        """Stop the scheduler thread"""
+        self._stop.set()
+        self._scheduler.clear()
+        self._thread = None
+    
+    def _run(self):
+        self.run()
+        while not self._stop.wait(30):
+            self._scheduler.run_pending()
+    
+    def run(self):
+        """Roll up, then purge"""
+        self.stats['runs'] += 1
+        try:
+            self.rollup()
+            self.purge()
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Deployment log maintenance failed: {e}")
+    
+    def rollup(self) -> int:
+        """Count new rows into deployment_log_daily; returns the number of rows read"""
+        with self._lock, get_db() as conn:
+            state = conn.execute('SELECT last_id FROM deployment_log_rollup_state WHERE id = 1').fetchone()
+            last_id = state['last_id'] if state else 0
+            upper = conn.execute('SELECT MAX(id) FROM deployment_log').fetchone()[0]
+            if upper is None or upper <= last_id:
+                return 0
+            
+            # Ids can have gaps (AUTOINCREMENT never reuses them), so count the rows
+            rows = conn.execute('SELECT COUNT(*) FROM deployment_log WHERE id > ? AND id <= ?',
+                                (last_id, upper)).fetchone()[0]
+            conn.execute('''
+                INSERT INTO deployment_log_daily
+                (day, display_id, actions, successes, errors, warnings, attempts,
+                 latency_count, total_latency_ms, max_latency_ms)
+                SELECT date(timestamp), COALESCE(display_id, 0), COUNT(*),
+                       SUM(status = 'success'), SUM(status IN ('error', 'failed')), SUM(status = 'warning'),
+                       COALESCE(SUM(attempts), 0), COUNT(latency_ms), COALESCE(SUM(latency_ms), 0), MAX(latency_ms)
+                FROM deployment_log
+                WHERE id > ? AND id <= ?
+                GROUP BY date(timestamp), COALESCE(display_id, 0)
+                ON CONFLICT(day, display_id) DO UPDATE SET
+                    actions = actions + excluded.actions,
+                    successes = successes + excluded.successes,
+                    errors = errors + excluded.errors,
+                    warnings = warnings + excluded.warnings,
+                    attempts = attempts + excluded.attempts,
+                    latency_count = latency_count + excluded.latency_count,
+                    total_latency_ms = total_latency_ms + excluded.total_latency_ms,
+                    max_latency_ms = MAX(COALESCE(max_latency_ms, excluded.max_latency_ms),
+                                         COALESCE(excluded.max_latency_ms, max_latency_ms))
+            ''', (last_id, upper))
+            conn.execute('''
+                INSERT INTO deployment_log_rollup_state (id, last_id) VALUES (1, ?)
+                ON CONFLICT(id) DO UPDATE SET last_id = excluded.last_id
+            ''', (upper,))
+            conn.commit()
+        
+        self.stats['rolled_up'] += rows
+        return rows
+    
+    def purge(self) -> int:
+        """Delete rows past retention, one short transaction per batch; returns rows deleted"""
+        retention_days = config.get('monitoring.log_retention_days', 30)
+        batch_size = config.get('monitoring.log_purge_batch_size', 5000)
+        cutoff = datetime.now() - timedelta(days=retention_days)
+        deleted = 0
+        
+        while not self._stop.is_set():
+            with self._lock, get_db() as conn:
+                state = conn.execute('SELECT last_id FROM deployment_log_rollup_state WHERE id = 1').fetchone()
+                if state is None:
+                    break
+                
+                # Candidates come from idx_deployment_log_time_id, so ids need not be in time order
+                count = conn.execute('''
+                    DELETE FROM deployment_log
+                    WHERE id IN (
+                        SELECT id FROM deployment_log
+                        WHERE timestamp < ? AND id <= ?
+                        ORDER BY timestamp LIMIT ?
+                    )
+                ''', (cutoff, state['last_id'], batch_size)).rowcount
+                conn.commit()
+            
+            deleted += count
+            if count < batch_size:
+                break
+            time.sleep(0.05)  # Let queued writers in between batches
+        
+        if deleted:
+            self.stats['purged'] += deleted
+            logger.info(f"Purged {deleted} deployment log rows older than {retention_days} days")
+        return deleted
+    
+    def daily(self, display_id: Optional[int] = None, days: int = 30) -> List[Dict[str, Any]]:
+        """Daily summaries, newest first"""
+        since = (datetime.now() - timedelta(days=days)).date().isoformat()
+        query = '''
+            SELECT day, display_id, actions, successes, errors, warnings, attempts,
+                   CASE WHEN latency_count > 0 THEN ROUND(total_latency_ms / latency_count, 2) END AS avg_latency_ms,
+                   max_latency_ms
+            FROM deployment_log_daily
+            WHERE day >= ?
+        '''
+        params: List[Any] = [since]
+        if display_id is not None:
+            query += ' AND display_id = ?'
+            params.append(display_id)
+        query += ' ORDER BY day DESC, display_id'
+        
+        with get_db() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+log_maintenance = DeploymentLogMaintenance()
+
+def save_display_identity(controller: 'SamsungLH55BECHLGFXGOController'):
+    """Persist a display's identity fields so they survive restarts"""
+    try:
+        with get_db() as conn:
+            conn.execute('''
+                INSERT INTO display_status (id, name, ip, model_number, serial_number, software_version)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    ip = excluded.ip,
+                    model_number = COALESCE(excluded.model_number, model_number),
+                    serial_number = COALESCE(excluded.serial_number, serial_number),
+                    software_version = COALESCE(excluded.software_version, software_version)
+            ''', (
+                controller.display_id,
+                controller.status.name,
+                controller.ip,
+                controller.status.model_number,
+                controller.status.serial_number,
+                controller.status.software_version
+            ))
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not persist identity for display {controller.display_id}: {e}")
 
 # Configuration Management
 class VideoWallConfig:
@@ -786,15 +1747,47 @@ class VideoWallConfig:
             },
             'monitoring': {
                 'health_check_interval': 30,
+                'status_poll_interval': 10,
+                'identity_refresh_interval': 86400,
+                'history_raw_samples': 360,
+                'history_minute_buckets': 360,
+                'history_hour_buckets': 336,
                 'temperature_warning_threshold': 60,
                 'temperature_critical_threshold': 70,
-                'max_error_count': 5
+                'max_error_count': 5,
+                'log_retention_days': 30,
+                'log_purge_interval': 10,
+                'log_purge_batch_size': 5000
             },
             'video_wall': {
                 'enabled': False,
                 'default_layout': '2x2',
                 'bezel_compensation': True,
                 'auto_power_management': True
+            },
+            'mdc': {
+                'broadcast_enabled': True,
+                'broadcast_settle_time': 1.0,
+                'max_concurrency': None,
+                'display_deadline': 15.0,
+                'initial_timeout': 3.0,
+                'min_timeout': 0.2,
+                'max_timeout': 5.0,
+                'connect_min_timeout': 1.0,
+                'slow_command_min_timeout': 3.0,
+                'retry_backoff_base': 0.05,
+                'retry_backoff_max': 1.0,
+                'breaker_failure_threshold': 2,
+                'breaker_reset_timeout': 10.0,
+                'breaker_max_reset_timeout': 120.0
+            },
+            'realtime': {
+                'batch_interval': 0.2
+            },
+            'audit_log': {
+                'flush_interval': 0.25,
+                'batch_size': 500,
+                'compress_threshold': 1024
             }
         }
     
@@ -885,8 +1878,644 @@ def initialize_displays():
         except Exception as e:
             logger.error(f"Failed to initialize display {display_id}: {e}")
     
+    # Restore identity fields persisted by earlier runs
+    try:
+        with get_db() as conn:
+            rows = conn.execute('''
+                SELECT id, model_number, serial_number, software_version FROM display_status
+            ''').fetchall()
+    except sqlite3.Error:
+        rows = []
+    
+    for row in rows:
+        controller = display_controllers.get(row['id'])
+        if not controller:
+            continue
+        
+        # Only values read from the display; the model column holds a schema default
+        for field in ('model_number', 'serial_number', 'software_version'):
+            if row[field]:
+                setattr(controller.status, field, row[field])
+    
     logger.info(f"Initialized {len(display_controllers)} Samsung LH55BECHLGFXGO displays")
 
+# Parallel fan-out
+async def fan_out(display_ids: List[int], operation, concurrency: Optional[int] = None,
+                  deadline: Optional[float] = None) -> Dict[int, Dict[str, Any]]:
+    """Run operation(display_id, controller) on every display in parallel
+    
+    At most `concurrency` displays are worked on at once (default
+    mdc.max_concurrency, or every display in one round when that is unset)
+    and each one gets `deadline` seconds. Failures and timeouts are reported
+    per display in the returned results dict instead of being raised.
+    """
+    concurrency = concurrency or config.get('mdc.max_concurrency') or len(display_ids)
+    deadline = deadline or config.get('mdc.display_deadline', 15.0)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run(display_id: int) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    operation(display_id, display_controllers[display_id]),
+                    timeout=deadline
+                )
+            except asyncio.TimeoutError:
+                return {'success': False, 'error': f'Display {display_id} did not respond within {deadline}s'}
+            except Exception as e:
+                return {'success': False, 'error': str(e)}
+    
+    results = await asyncio.gather(*[run(display_id) for display_id in display_ids])
+    return dict(zip(display_ids, results))
+
+# Metric history
+class MetricRing:
+    """Fixed-size ring of timestamped samples stored in typed arrays"""
+    
+    def __init__(self, size: int, fields: int = 1):
+        self.size = size
+        self.times = array('I', bytes(4 * size))  # Epoch seconds
+        self.columns = [array('f', bytes(4 * size)) for _ in range(fields)]
+        self.count = 0
+        self.next = 0
+    
+    def append(self, timestamp: float, *values: float):
+        """Overwrite the oldest slot once the ring is full"""
+        i = self.next
+        self.times[i] = int(timestamp)
+        for column, value in zip(self.columns, values):
+            column[i] = value
+        self.next = (i + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+    
+    def points(self, since: float = 0) -> List[List[float]]:
+        """Samples at or after since, oldest first, as [timestamp, value, ...]"""
+        start = (self.next - self.count) % self.size
+        points = []
+        for offset in range(self.count):
+            i = (start + offset) % self.size
+            if self.times[i] >= since:
+                points.append([self.times[i]] + [round(column[i], 2) for column in self.columns])
+        return points
+
+class MetricSeries:
+    """Raw samples of one metric plus minute and hour rollups of [avg, min, max]"""
+    
+    ROLLUPS = (('minute', 60), ('hour', 3600))
+    
+    def __init__(self, raw_size: int, minute_size: int, hour_size: int):
+        self.raw = MetricRing(raw_size)
+        self.rollups = {'minute': MetricRing(minute_size, 3), 'hour': MetricRing(hour_size, 3)}
+        self._buckets: Dict[str, Optional[List[float]]] = {'minute': None, 'hour': None}  # [start, count, total, min, max]
+    
+    def add(self, timestamp: float, value: float):
+        """Record a sample and fold it into the open rollup buckets"""
+        value = float(value)
+        self.raw.append(timestamp, value)
+        
+        for name, width in self.ROLLUPS:
+            start = timestamp - timestamp % width
+            bucket = self._buckets[name]
+            
+            if bucket and bucket[0] != start:
+                self.rollups[name].append(bucket[0], bucket[2] / bucket[1], bucket[3], bucket[4])
+                bucket = None
+            
+            if bucket is None:
+                self._buckets[name] = [start, 1, value, value, value]
+            else:
+                bucket[1] += 1
+                bucket[2] += value
+                bucket[3] = min(bucket[3], value)
+                bucket[4] = max(bucket[4], value)
+    
+    def points(self, resolution: str = 'raw', since: float = 0) -> List[List[float]]:
+        """Raw [timestamp, value] points or rollup [timestamp, avg, min, max] points"""
+        if resolution == 'raw':
+            return self.raw.points(since)
+        
+        points = self.rollups[resolution].points(since)
+        bucket = self._buckets[resolution]
+        if bucket and bucket[0] >= since:
+            # Include the bucket still being filled
+            points.append([int(bucket[0]), round(bucket[2] / bucket[1], 2),
+                           round(bucket[3], 2), round(bucket[4], 2)])
+        return points
+
+class MetricHistory:
+    """Bounded in-memory history of per-display temperature, RTT, error count and power state
+    
+    Memory per display is fixed by the monitoring.history_* ring sizes no
+    matter how long the system runs.
+    """
+    
+    METRICS = ('temperature', 'rtt_ms', 'error_count', 'power')
+    RESOLUTIONS = ('raw', 'minute', 'hour')
+    
+    def __init__(self):
+        self.series: Dict[int, Dict[str, MetricSeries]] = {}
+        self._lock = threading.Lock()
+    
+    def _new_series(self) -> MetricSeries:
+        return MetricSeries(
+            config.get('monitoring.history_raw_samples', 360),
+            config.get('monitoring.history_minute_buckets', 360),
+            config.get('monitoring.history_hour_buckets', 336)
+        )
+    
+    def record(self, display_id: int, metric: str, value: float, timestamp: Optional[float] = None):
+        """Record one sample"""
+        timestamp = timestamp or time.time()
+        with self._lock:
+            display_series = self.series.setdefault(display_id, {})
+            series = display_series.get(metric)
+            if series is None:
+                series = display_series[metric] = self._new_series()
+            series.add(timestamp, value)
+    
+    def record_health(self, display_id: int, health: Dict[str, Any]):
+        """Status poller listener: record the metrics of one health check"""
+        timestamp = time.time()
+        
+        temperature = health.get('temperature', {}).get('value')
+        if temperature is not None:
+            self.record(display_id, 'temperature', temperature, timestamp)
+        
+        power = health.get('power', {}).get('status')
+        if power in ('on', 'off'):
+            self.record(display_id, 'power', 1.0 if power == 'on' else 0.0, timestamp)
+        
+        error_count = health.get('connection', {}).get('error_count')
+        if error_count is not None:
+            self.record(display_id, 'error_count', error_count, timestamp)
+        
+        controller = display_controllers.get(display_id)
+        if controller and controller.rtt.srtt is not None:
+            self.record(display_id, 'rtt_ms', controller.rtt.srtt * 1000, timestamp)
+    
+    def history(self, display_id: int, metrics: Optional[List[str]] = None,
+                resolution: str = 'raw', since: float = 0) -> Dict[str, List[List[float]]]:
+        """Points per metric for one display"""
+        with self._lock:
+            display_series = self.series.get(display_id, {})
+            return {
+                metric: display_series[metric].points(resolution, since) if metric in display_series else []
+                for metric in (metrics or self.METRICS)
+            }
+
+# Background status polling
+class DisplayStatusPoller:
+    """Refreshes every display in the background so read endpoints can serve a cached snapshot
+    
+    Each cycle polls the volatile tier (power, input, temperature); identity
+    fields are only re-read by health_check when their own tier is due.
+    """
+    
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval
+        self.health: Dict[int, Dict[str, Any]] = {}
+        self.last_poll: Optional[datetime] = None
+        self.listeners = []  # Called as listener(display_id, health_data) after each refresh
+        self.poll_listeners = []  # Awaited as listener(results) once per poll, on the MDC loop
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """Start polling on the MDC loop"""
+        get_mdc_loop().call_soon_threadsafe(self._start)
+    
+    def stop(self):
+        """Stop polling"""
+        if self._task:
+            get_mdc_loop().call_soon_threadsafe(self._task.cancel)
+    
+    def _start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info("Background status poller started")
+    
+    async def _run(self):
+        """Poll all displays every interval seconds"""
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Status poll failed: {e}")
+            
+            await asyncio.sleep(self.interval or config.get(
+                'monitoring.status_poll_interval',
+                config.get('monitoring.health_check_interval', 30)
+            ))
+    
+    async def poll_once(self) -> Dict[int, Dict[str, Any]]:
+        """Health check every display once and update the cached snapshot"""
+        results = await fan_out(
+            list(display_controllers.keys()),
+            lambda display_id, controller: controller.health_check()
+        )
+        
+        self.health.update(results)
+        self.last_poll = datetime.now()
+        
+        for display_id, health_data in results.items():
+            for listener in self.listeners:
+                try:
+                    listener(display_id, health_data)
+                except Exception as e:
+                    logger.error(f"Status listener failed for display {display_id}: {e}")
+        
+        # Per-poll batches, e.g. database writes handed to a worker thread
+        for listener in self.poll_listeners:
+            try:
+                await listener(results)
+            except Exception as e:
+                logger.error(f"Poll listener failed: {e}")
+        
+        return results
+    
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since the last completed poll, or None if none has run yet"""
+        if self.last_poll is None:
+            return None
+        return round((datetime.now() - self.last_poll).total_seconds(), 1)
+
+status_poller = DisplayStatusPoller()
+metric_history = MetricHistory()
+status_poller.listeners.append(metric_history.record_health)
+
+# Versioned display state for Socket.IO deltas
+class DisplayStateTracker:
+    """Last published copy of every DisplayStatus, so clients only receive changed fields
+    
+    Every change gets a fleet-wide sequence number. A bounded log of recent
+    deltas lets a reconnecting client catch up from its last sequence number;
+    clients that fell further behind get a full snapshot instead. Sequence
+    numbers restart with the process, so every frame also carries an epoch
+    that changes on each start.
+    """
+    
+    IGNORED_FIELDS = ('last_seen',)  # Changes on every reply; sent with snapshots only
+    
+    def __init__(self, max_log: int = 2000):
+        self.epoch = uuid.uuid4().hex
+        self.seq = 0
+        self._state: Dict[int, Dict[str, Any]] = {}
+        self._log: deque = deque(maxlen=max_log)
+        self._lock = threading.Lock()
+    
+    def update(self, display_id: int, status: DisplayStatus,
+               action: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Record the current status; returns the delta, or None if nothing changed"""
+        current = status.to_dict()
+        
+        with self._lock:
+            previous = self._state.get(display_id)
+            changes = {
+                field: value for field, value in current.items()
+                if field not in self.IGNORED_FIELDS and (previous is None or previous.get(field) != value)
+            }
+            self._state[display_id] = current
+            if not changes:
+                return None
+            
+            self.seq += 1
+            delta = {
+                'display_id': display_id,
+                'seq': self.seq,
+                'changes': changes,
+                'action': action,
+                'timestamp': datetime.now().isoformat()
+            }
+            self._log.append(delta)
+            return delta
+    
+    def published(self, display_id: int, field: str, default=None):
+        """Last published value of one field of a display"""
+        with self._lock:
+            return self._state.get(display_id, {}).get(field, default)
+    
+    def snapshot(self, display_ids: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Published state of the given displays (default all) and the sequence number it reflects"""
+        with self._lock:
+            return {
+                'epoch': self.epoch,
+                'seq': self.seq,
+                'displays': {
+                    display_id: dict(state) for display_id, state in self._state.items()
+                    if display_ids is None or display_id in display_ids
+                }
+            }
+    
+    def since(self, last_seq: int, display_ids: Optional[List[int]] = None) -> Optional[List[Dict[str, Any]]]:
+        """Deltas after last_seq, or None if the log no longer reaches back that far"""
+        with self._lock:
+            if last_seq >= self.seq:
+                return []
+            if not self._log or self._log[0]['seq'] > last_seq + 1:
+                return None
+            return [
+                delta for delta in self._log
+                if delta['seq'] > last_seq and (display_ids is None or delta['display_id'] in display_ids)
+            ]
+
+display_state = DisplayStateTracker()
+
+class DisplayUpdateBroadcaster:
+    """Room-based Socket.IO subscriptions with one merged frame per client per tick
+    
+    Clients subscribe to single displays, the active video wall or the whole
+    fleet. Deltas are queued and every realtime.batch_interval seconds each
+    subscribed client gets at most one display_deltas frame covering its rooms,
+    with consecutive changes to the same display merged.
+    """
+    
+    FLEET_ROOM = 'fleet'
+    WALL_ROOM = 'wall'
+    
+    def __init__(self):
+        self.subscriptions: Dict[str, set] = {}  # sid -> rooms
+        self._synced: Dict[str, Tuple[int, Optional[set]]] = {}  # sid -> (seq, displays) of its catch-up
+        self._pending: List[Tuple[Dict[str, Any], set]] = []
+        self._lock = threading.Lock()
+        self._task = None
+    
+    @staticmethod
+    def display_room(display_id: int) -> str:
+        return f'display:{display_id}'
+    
+    def subscribe(self, sid: str, rooms: List[str], catch_up=None):
+        """Add rooms to a client's subscription (call from a Socket.IO handler)
+        
+        catch_up(display_ids) sends the client its initial state and returns
+        the sequence number it reflects. It runs before the client is
+        registered and under the batching lock, so no batched frame can
+        overtake it or repeat deltas it already covered.
+        """
+        display_ids = self.display_ids(set(rooms))
+        with self._lock:
+            if catch_up is not None:
+                self._synced[sid] = (catch_up(display_ids), None if display_ids is None else set(display_ids))
+            self.subscriptions.setdefault(sid, set()).update(rooms)
+        for room in rooms:
+            join_room(room, sid=sid)
+    
+    def unsubscribe(self, sid: str, rooms: Optional[List[str]] = None):
+        """Remove some or all of a client's rooms"""
+        with self._lock:
+            subscribed = self.subscriptions.get(sid, set())
+            removed = set(rooms) & subscribed if rooms is not None else set(subscribed)
+            subscribed -= removed
+            if not subscribed:
+                self.subscriptions.pop(sid, None)
+                self._synced.pop(sid, None)
+        for room in removed:
+            try:
+                leave_room(room, sid=sid)
+            except Exception:
+                pass  # Already gone when the client disconnected
+    
+    def display_ids(self, rooms: set) -> Optional[List[int]]:
+        """Displays covered by rooms, or None for the whole fleet"""
+        if self.FLEET_ROOM in rooms:
+            return None
+        
+        display_ids = {int(room.split(':', 1)[1]) for room in rooms if room.startswith('display:')}
+        if self.WALL_ROOM in rooms:
+            display_ids.update(id for id, c in display_controllers.items() if c.status.video_wall_enabled)
+        return sorted(display_ids)
+    
+    def start(self):
+        """Start the flush task
+        
+        Call once at startup from the thread that runs the Socket.IO server:
+        under eventlet or gevent a task spawned from another OS thread (such
+        as mdc-io, where deltas are queued) would never be scheduled.
+        """
+        with self._lock:
+            if self._task is None:
+                self._task = socketio.start_background_task(self._run)
+    
+    def queue(self, delta: Dict[str, Any], in_wall: bool):
+        """Queue a delta for the next tick"""
+        rooms = {self.FLEET_ROOM, self.display_room(delta['display_id'])}
+        if in_wall:
+            rooms.add(self.WALL_ROOM)
+        
+        with self._lock:
+            # Nobody to send it to; later subscribers catch up from display_state
+            if self.subscriptions:
+                self._pending.append((delta, rooms))
+    
+    def _run(self):
+        """Flush queued deltas every tick"""
+        while True:
+            socketio.sleep(config.get('realtime.batch_interval', 0.2))
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Display update flush failed: {e}")
+    
+    def flush(self):
+        """Send each subscribed client one frame with the deltas for its rooms"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            subscriptions = [
+                (sid, set(rooms), self._synced.get(sid, (0, None)))
+                for sid, rooms in self.subscriptions.items()
+            ]
+        
+        if not pending:
+            return
+        
+        for sid, rooms, (synced_seq, synced_ids) in subscriptions:
+            merged: Dict[int, Dict[str, Any]] = {}
+            for delta, delta_rooms in pending:
+                if rooms.isdisjoint(delta_rooms):
+                    continue
+                if delta['seq'] <= synced_seq and (synced_ids is None or delta['display_id'] in synced_ids):
+                    continue  # Already in the client's catch-up
+                
+                current = merged.get(delta['display_id'])
+                if current is None:
+                    merged[delta['display_id']] = dict(delta, changes=dict(delta['changes']))
+                else:
+                    current['changes'].update(delta['changes'])
+                    current.update(seq=delta['seq'], action=delta['action'], timestamp=delta['timestamp'])
+            
+            if merged:
+                deltas = sorted(merged.values(), key=lambda d: d['seq'])
+                socketio.emit('display_deltas', {
+                    'epoch': display_state.epoch,
+                    'seq': deltas[-1]['seq'],
+                    'deltas': deltas
+                }, to=sid)
+
+update_broadcaster = DisplayUpdateBroadcaster()
+
+def publish_display_state(display_ids: List[int], action: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Queue the changed fields of each display that changed for subscribed clients"""
+    deltas = []
+    for display_id in display_ids:
+        controller = display_controllers.get(display_id)
+        if controller is None:
+            continue
+        
+        # Wall subscribers also hear about a display leaving the wall
+        was_in_wall = display_state.published(display_id, 'video_wall_enabled', False)
+        delta = display_state.update(display_id, controller.status, action)
+        if delta:
+            in_wall = controller.status.video_wall_enabled or was_in_wall
+            update_broadcaster.queue(delta, in_wall)
+            deltas.append(delta)
+    
+    return deltas
+
+status_poller.listeners.append(lambda display_id, health: publish_display_state([display_id]))
+
+# Prometheus exposition
+def _prometheus_labels(**labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels.items()) + '}'
+
+def render_prometheus_metrics() -> str:
+    """Render command, connection and display metrics in Prometheus text format"""
+    controllers = list(display_controllers.items())
+    lines = []
+    
+    def metric(name: str, kind: str, help_text: str, samples):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for suffix, labels, value in samples:
+            lines.append(f'{name}{suffix}{_prometheus_labels(**labels)} {value}')
+    
+    # Command latency histograms
+    histogram_samples = []
+    for display_id, controller in controllers:
+        for command, histogram in list(controller.metrics.histograms.items()):
+            labels = {'command': command, 'display': display_id}
+            cumulative = 0
+            for bound, bucket_count in zip(CommandMetrics.BUCKETS + ('+Inf',), histogram[:-1]):
+                cumulative += bucket_count
+                histogram_samples.append(('_bucket', dict(labels, le=bound), cumulative))
+            histogram_samples.append(('_sum', labels, round(histogram[-1], 6)))
+            histogram_samples.append(('_count', labels, cumulative))
+    metric('mdc_command_duration_seconds', 'histogram',
+           'MDC command latency including retries', histogram_samples)
+    
+    # Per-display counters
+    counters = (
+        ('mdc_command_retries_total', 'MDC command retries', lambda c: c.metrics.counters['retries']),
+        ('mdc_command_timeouts_total', 'MDC replies that timed out', lambda c: c.metrics.counters['timeouts']),
+        ('mdc_command_failures_total', 'MDC commands that failed after all retries',
+         lambda c: c.metrics.counters['failures']),
+        ('mdc_checksum_mismatches_total', 'MDC frames dropped for a bad checksum',
+         lambda c: c._decoder.checksum_errors),
+        ('mdc_reconnects_total', 'Display reconnections after the first connect',
+         lambda c: max(0, c._connection_generation - 1))
+    )
+    for name, help_text, read in counters:
+        metric(name, 'counter', help_text,
+               [('', {'display': display_id}, read(controller)) for display_id, controller in controllers])
+    
+    # Display gauges
+    metric('video_wall_displays', 'gauge', 'Configured displays', [('', {}, len(controllers))])
+    metric('video_wall_displays_online', 'gauge', 'Displays with an open connection',
+           [('', {}, sum(1 for _, c in controllers if c.status.online))])
+    metric('video_wall_displays_responsive', 'gauge', 'Displays answering MDC commands',
+           [('', {}, sum(1 for _, c in controllers if c.status.responsive))])
+    metric('mdc_display_temperature_celsius', 'gauge', 'Last reported display temperature',
+           [('', {'display': display_id}, controller.status.temperature)
+            for display_id, controller in controllers if controller.status.temperature is not None])
+    metric('mdc_display_rtt_seconds', 'gauge', 'Smoothed MDC round-trip time',
+           [('', {'display': display_id}, round(controller.rtt.srtt, 6))
+            for display_id, controller in controllers if controller.rtt.srtt is not None])
+    metric('mdc_circuit_open', 'gauge', 'Circuit breaker open (1) or closed (0)',
+           [('', {'display': display_id}, int(controller.breaker.is_open)) for display_id, controller in controllers])
+    
+    snapshot_age = status_poller.snapshot_age()
+    if snapshot_age is not None:
+        metric('video_wall_status_snapshot_age_seconds', 'gauge', 'Age of the status poller snapshot',
+               [('', {}, snapshot_age)])
+    
+    return '\n'.join(lines) + '\n'
+
+# Daisy-chain broadcast
+def plan_broadcast(display_ids: List[int]) -> Tuple[List[List[int]], List[int]]:
+    """Split display_ids into whole daisy chains (broadcastable) and individual displays"""
+    targets = set(display_ids)
+    chains: Dict[Tuple[str, int], List[int]] = {}
+    
+    for display_id, controller in display_controllers.items():
+        chains.setdefault(controller.link, []).append(display_id)
+    
+    broadcast_chains = []
+    individual = []
+    handled = set()
+    
+    if config.get('mdc.broadcast_enabled', True):
+        for chain in chains.values():
+            # Only worth it when one packet replaces several
+            if len(chain) > 1 and targets.issuperset(chain):
+                broadcast_chains.append(chain)
+                handled.update(chain)
+    
+    for display_id in display_ids:
+        if display_id not in handled:
+            individual.append(display_id)
+    
+    return broadcast_chains, individual
+
+async def broadcast_to_chains(chains: List[List[int]], commands: List[Tuple[MDCCommand, bytes]],
+                              verify) -> Dict[int, Dict[str, Any]]:
+    """Send commands once per chain, then confirm every display with a parallel status sweep
+    
+    verify(controller) is called after each display's status refresh and returns
+    True when the display reached the requested state.
+    """
+    results: Dict[int, Dict[str, Any]] = {}
+    confirm_ids = []
+    
+    for chain in chains:
+        head = display_controllers[chain[0]]
+        sent = {'success': True}
+        
+        for command, data in commands:
+            sent = await head.send_broadcast(command, data)
+            if not sent['success']:
+                break
+        
+        if sent['success']:
+            confirm_ids.extend(chain)
+        else:
+            for display_id in chain:
+                results[display_id] = {'success': False, 'broadcast': True, 'error': sent.get('error')}
+    
+    if not confirm_ids:
+        return results
+    
+    # Give the displays time to apply the change before reading it back
+    await asyncio.sleep(config.get('mdc.broadcast_settle_time', 1.0))
+    
+    status_results = await fan_out(
+        confirm_ids,
+        lambda display_id, controller: controller.get_full_status()
+    )
+    
+    for display_id, status_result in status_results.items():
+        if not status_result['success']:
+            results[display_id] = {'success': False, 'broadcast': True, 'error': status_result.get('error')}
+        else:
+            confirmed = verify(display_controllers[display_id])
+            results[display_id] = {
+                'success': confirmed,
+                'broadcast': True,
+                'status': status_result['status']
+            }
+            if not confirmed:
+                results[display_id]['error'] = 'Display did not confirm broadcast state'
+    
+    return results
+
 if __name__ == "__main__":
     # Initialize system
     init_database()
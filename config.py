@@ -11,7 +11,7 @@ class Config:
     SECRET_KEY = os.getenv('VIDEO_WALL_SECRET_KEY', 'your-secret-key-change-this')
     
     # Database Configuration
-    DATABASE_URL = os.getenv('DATABASE_URL', 'video_wall.db')
+    DATABASE_URL = os.getenv('DATABASE_URL', 'samsung_video_wall.db')
     
     # Display Configuration
     DISPLAY_CONFIGS = {
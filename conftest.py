@@ -0,0 +1,130 @@
+"""
+Shared pytest fixtures for the Samsung LH55BECHLGFXGO Video Wall tests
+The control system runs in a scratch directory against simulated displays
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / 'bin'))
+
+# The application reads config.yaml and writes its database and log in the
+# working directory, so give the test session a directory of its own
+os.chdir(tempfile.mkdtemp(prefix='video_wall_tests_'))
+os.environ.pop('DATABASE_URL', None)
+
+import clean_video_wall_system  # noqa: E402
+from mdc_display_simulator import SimulatedFleet, SimulatorProfile, VirtualLink  # noqa: E402
+
+# The endpoints module is meant to run alongside the core module's globals
+# (see main.py), so execute it in that namespace
+_endpoints = PROJECT_ROOT / 'samsung_lh55_api_endpoints.py'
+exec(compile(_endpoints.read_text(), str(_endpoints), 'exec'), clean_video_wall_system.__dict__)
+clean_video_wall_system.init_database()
+
+DB_TABLES = ('deployment_log', 'deployment_log_daily', 'deployment_log_rollup_state',
+             'display_status', 'video_wall_layouts', 'discovered_displays')
+
+def on_mdc_loop(coro, timeout: float = 30):
+    """Run a coroutine on the loop that owns all display connections"""
+    future = asyncio.run_coroutine_threadsafe(coro, clean_video_wall_system.get_mdc_loop())
+    return future.result(timeout)
+
+@pytest.fixture
+def core():
+    """The control system module, with the API endpoints loaded"""
+    return clean_video_wall_system
+
+@pytest.fixture
+def run():
+    """Run a coroutine on the MDC loop and return its result"""
+    return on_mdc_loop
+
+@pytest.fixture
+def settings(core):
+    """Override config values by dotted key for one test"""
+    saved = []
+    
+    def override(key: str, value):
+        section, name = key.split('.', 1)
+        values = core.config.config.setdefault(section, {})
+        saved.append((values, name, values.get(name, KeyError)))
+        values[name] = value
+    
+    yield override
+    
+    for values, name, previous in reversed(saved):
+        if previous is KeyError:
+            values.pop(name, None)
+        else:
+            values[name] = previous
+
+@pytest.fixture
+def db(core):
+    """Empty application tables, with queued audit rows written first"""
+    core.audit_log.close()
+    with core.get_db() as conn:
+        for table in DB_TABLES:
+            conn.execute(f'DELETE FROM {table}')
+        conn.commit()
+    return core.get_db
+
+async def _shutdown(controller):
+    for task in (controller._probe_task, controller._actor_task):
+        if task is not None:
+            task.cancel()
+    if controller.writer:
+        controller.writer.close()
+
+@pytest.fixture
+def fleet(core):
+    """Factory for simulated displays registered as display_controllers"""
+    fleets = []
+    
+    def make(count: int = 1, chain_size: int = 1, profile=None) -> SimulatedFleet:
+        fleet = SimulatedFleet(count, chain_size, profile=profile or SimulatorProfile(latency=0))
+        on_mdc_loop(fleet.start())
+        fleets.append(fleet)
+        
+        for display_id, display in fleet.displays_config().items():
+            controller = core.SamsungLH55BECHLGFXGOController(display_id, display['ip'], display['port'])
+            controller.status.name = display['name']
+            core.display_controllers[display_id] = controller
+        return fleet
+    
+    core.display_controllers.clear()
+    yield make
+    
+    for controller in core.display_controllers.values():
+        on_mdc_loop(_shutdown(controller))
+    core.display_controllers.clear()
+    for fleet in fleets:
+        on_mdc_loop(fleet.stop())
+
+@pytest.fixture
+def link():
+    """Factory for single virtual links that are not registered as displays"""
+    links = []
+    
+    def make(display_ids=(1,), profile=None, host: str = '127.0.0.1') -> VirtualLink:
+        virtual_link = VirtualLink(list(display_ids), host, profile=profile or SimulatorProfile(latency=0))
+        on_mdc_loop(virtual_link.start())
+        links.append(virtual_link)
+        return virtual_link
+    
+    yield make
+    
+    for virtual_link in links:
+        on_mdc_loop(virtual_link.stop())
+
+@pytest.fixture
+def client(core):
+    """Flask test client for the API endpoints"""
+    return core.app.test_client()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Samsung LH55BECHLGFXGO MDC Display Simulator
+Local stand-in for load and latency testing without display hardware
+"""
+
+import asyncio
+import argparse
+import logging
+import random
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# MDC command bytes (same values as MDCCommand in clean_video_wall_system)
+STATUS = 0x00
+POWER = 0x11
+VOLUME = 0x12
+MUTE = 0x13
+INPUT_SOURCE = 0x14
+PICTURE_MODE = 0x15
+CONTRAST = 0x22
+BRIGHTNESS = 0x23
+CURRENT_TEMP = 0x2B
+SERIAL_NUMBER = 0x2C
+SOFTWARE_VERSION = 0x2D
+MODEL_NUMBER = 0x2E
+VIDEO_WALL_MODE = 0x84
+POWER_STATUS = 0xF1
+
+MDC_HEADER = 0xAA
+MDC_BROADCAST_ID = 0xFE
+
+@dataclass
+class SimulatorProfile:
+    """Network behaviour applied to every reply"""
+    latency: float = 0.02        # seconds
+    jitter: float = 0.0          # standard deviation of latency, seconds
+    packet_loss: float = 0.0     # probability a reply is never sent
+    bad_checksum: float = 0.0    # probability a reply has a corrupted checksum
+
+@dataclass
+class VirtualDisplayState:
+    """Emulated LH55BECHLGFXGO settings"""
+    display_id: int
+    power: bool = True
+    volume: int = 50
+    muted: bool = False
+    input_source: int = 0x21  # HDMI1
+    picture_mode: int = 0x00  # STANDARD
+    brightness: int = 50
+    contrast: int = 50
+    temperature: int = 38
+    serial_number: str = ''
+    model_number: str = 'LH55BECHLGFXGO'
+    software_version: str = 'S-BECSIM-1000.0'
+    video_wall: Tuple[int, int, int, int, int] = (0, 1, 1, 1, 1)
+    
+    def __post_init__(self):
+        if not self.serial_number:
+            self.serial_number = f'SIM{self.display_id:07d}'
+
+def build_frame(command: int, display_id: int, data: bytes = b'') -> bytes:
+    """Build an MDC frame the way the controller's _create_mdc_packet does"""
+    frame = struct.pack('BBBB', MDC_HEADER, command, display_id, len(data)) + data
+    return frame + struct.pack('B', sum(frame) & 0xFF)
+
+class VirtualLink:
+    """One TCP endpoint serving one display, or several on an emulated daisy chain"""
+    
+    def __init__(self, display_ids: List[int], host: str = '127.0.0.1', port: int = 0,
+                 profile: Optional[SimulatorProfile] = None):
+        self.host = host
+        self.port = port
+        self.profile = profile or SimulatorProfile()
+        self.displays: Dict[int, VirtualDisplayState] = {
+            display_id: VirtualDisplayState(display_id) for display_id in display_ids
+        }
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.clients: Set[asyncio.StreamWriter] = set()
+        self.stats = {
+            'commands': 0,
+            'broadcasts': 0,
+            'dropped_replies': 0,
+            'corrupted_replies': 0,
+            'connections': 0
+        }
+    
+    async def start(self):
+        """Start listening; port 0 picks a free port"""
+        self.server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logger.info(f"Virtual link for displays {list(self.displays)} listening on {self.host}:{self.port}")
+    
+    async def stop(self):
+        """Stop listening and drop client connections"""
+        for writer in list(self.clients):
+            writer.close()
+        
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve MDC requests on one connection, one at a time like a real display"""
+        self.stats['connections'] += 1
+        self.clients.add(writer)
+        buffer = bytearray()
+        try:
+            while True:
+                frame = self._next_request(buffer)
+                if frame is None:
+                    chunk = await reader.read(4096)
+                    if not chunk:
+                        break
+                    buffer.extend(chunk)
+                    continue
+                
+                reply = self.handle_request(frame[1], frame[2], frame[4:-1])
+                if reply is None:
+                    continue
+                
+                await self._send_reply(writer, reply)
+        
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+    
+    def _next_request(self, buffer: bytearray) -> Optional[bytes]:
+        """Cut the next valid request frame out of buffer, or None if more bytes are needed"""
+        while True:
+            # Skip stray bytes up to the next header
+            start = buffer.find(MDC_HEADER)
+            if start < 0:
+                buffer.clear()
+                return None
+            del buffer[:start]
+            
+            if len(buffer) < 4 or len(buffer) < 4 + buffer[3] + 1:
+                return None
+            
+            frame = bytes(buffer[:4 + buffer[3] + 1])
+            if sum(frame[:-1]) & 0xFF != frame[-1]:
+                # Drop only the header byte so a frame right behind a stray 0xAA is still found
+                logger.debug("Dropping request with bad checksum")
+                del buffer[:1]
+                continue
+            
+            del buffer[:len(frame)]
+            return frame
+    
+    async def _send_reply(self, writer: asyncio.StreamWriter, reply: bytes):
+        """Apply latency, loss and corruption from the profile, then send"""
+        profile = self.profile
+        
+        delay = random.gauss(profile.latency, profile.jitter) if profile.jitter else profile.latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        if random.random() < profile.packet_loss:
+            self.stats['dropped_replies'] += 1
+            return
+        
+        if random.random() < profile.bad_checksum:
+            self.stats['corrupted_replies'] += 1
+            reply = reply[:-1] + bytes([(reply[-1] + 1) & 0xFF])
+        
+        writer.write(reply)
+        await writer.drain()
+    
+    def handle_request(self, command: int, display_id: int, data: bytes) -> Optional[bytes]:
+        """Apply a request to the emulated state and return the reply frame (None for no reply)"""
+        self.stats['commands'] += 1
+        
+        if display_id == MDC_BROADCAST_ID:
+            # Broadcasts reach every display on the chain and are never answered
+            self.stats['broadcasts'] += 1
+            for state in self.displays.values():
+                self._apply(state, command, data)
+            return None
+        
+        state = self.displays.get(display_id)
+        if state is None:
+            return None
+        
+        payload = self._apply(state, command, data)
+        return build_frame(command, display_id, payload)
+    
+    def _apply(self, state: VirtualDisplayState, command: int, data: bytes) -> bytes:
+        """Update state for set commands and return the reply payload"""
+        if command == STATUS:
+            return bytes([int(state.power), state.volume, int(state.muted),
+                          state.input_source, state.picture_mode])
+        
+        if command in (POWER, POWER_STATUS):
+            if data and command == POWER:
+                state.power = data[0] == 0x01
+            return bytes([int(state.power)])
+        
+        if command == CURRENT_TEMP:
+            # Drift a little so temperature history has something to show
+            if state.power:
+                state.temperature = max(30, min(75, state.temperature + random.choice((-1, 0, 0, 1))))
+            return bytes([state.temperature])
+        
+        if command == SERIAL_NUMBER:
+            return state.serial_number.encode('ascii')
+        if command == MODEL_NUMBER:
+            return state.model_number.encode('ascii')
+        if command == SOFTWARE_VERSION:
+            return state.software_version.encode('ascii')
+        
+        if command == VIDEO_WALL_MODE:
+            if len(data) >= 5:
+                state.video_wall = tuple(data[:5])
+            return bytes(state.video_wall)
+        
+        # Simple one-byte settings: set when data is given, echo the current value
+        settings = {
+            VOLUME: 'volume',
+            MUTE: 'muted',
+            INPUT_SOURCE: 'input_source',
+            PICTURE_MODE: 'picture_mode',
+            BRIGHTNESS: 'brightness',
+            CONTRAST: 'contrast'
+        }
+        attribute = settings.get(command)
+        if attribute is None:
+            # Unknown command - acknowledge by echoing the request data
+            return data
+        
+        if data:
+            value = data[0]
+            setattr(state, attribute, bool(value) if attribute == 'muted' else value)
+        return bytes([int(getattr(state, attribute))])
+
+@dataclass
+class SimulatedFleet:
+    """A set of virtual links on localhost ports"""
+    count: int
+    chain_size: int = 1
+    host: str = '127.0.0.1'
+    base_port: int = 0  # 0 picks free ports
+    profile: SimulatorProfile = field(default_factory=SimulatorProfile)
+    links: List[VirtualLink] = field(default_factory=list)
+    
+    async def start(self) -> 'SimulatedFleet':
+        """Start count displays, chain_size of them per link"""
+        display_ids = list(range(1, self.count + 1))
+        
+        for index in range(0, self.count, self.chain_size):
+            port = self.base_port + len(self.links) if self.base_port else 0
+            link = VirtualLink(display_ids[index:index + self.chain_size], self.host, port, self.profile)
+            await link.start()
+            self.links.append(link)
+        
+        logger.info(f"Simulated fleet of {self.count} displays on {len(self.links)} links started")
+        return self
+    
+    async def stop(self):
+        """Stop every link"""
+        for link in self.links:
+            await link.stop()
+        self.links = []
+    
+    def displays_config(self) -> Dict[int, Dict]:
+        """Displays section for config.yaml pointing at the simulated fleet"""
+        displays = {}
+        for link in self.links:
+            for display_id in link.displays:
+                displays[display_id] = {
+                    'name': f'Simulated LH55BECHLGFXGO-{display_id:02d}',
+                    'ip': link.host,
+                    'port': link.port,
+                    'protocol': 'tcp',
+                    'model': 'LH55BECHLGFXGO'
+                }
+        return displays
+    
+    def display(self, display_id: int) -> Optional[VirtualDisplayState]:
+        """State of one simulated display"""
+        for link in self.links:
+            if display_id in link.displays:
+                return link.displays[display_id]
+        return None
+
+async def main():
+    """Run a simulated fleet until interrupted"""
+    parser = argparse.ArgumentParser(description='Samsung LH55BECHLGFXGO MDC display simulator')
+    parser.add_argument('--count', type=int, default=4, help='number of virtual displays')
+    parser.add_argument('--chain-size', type=int, default=1, help='displays per TCP link (daisy chain)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--base-port', type=int, default=15150, help='first port, 0 for random ports')
+    parser.add_argument('--latency', type=float, default=0.02, help='reply latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='latency standard deviation in seconds')
+    parser.add_argument('--loss', type=float, default=0.0, help='probability a reply is dropped')
+    parser.add_argument('--bad-checksum', type=float, default=0.0, help='probability a reply is corrupted')
+    parser.add_argument('--print-config', action='store_true', help='print a displays section for config.yaml')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    profile = SimulatorProfile(args.latency, args.jitter, args.loss, args.bad_checksum)
+    fleet = await SimulatedFleet(args.count, args.chain_size, args.host, args.base_port, profile).start()
+    
+    if args.print_config:
+        import yaml
+        print(yaml.safe_dump({'displays': fleet.displays_config()}, default_flow_style=False))
+    
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await fleet.stop()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -165,66 +165,69 @@ def serve_static(filename):
 # Background monitoring task
 def start_background_monitoring():
     """Start background monitoring tasks"""
-    def monitoring_loop():
-        """Background monitoring loop"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        async def monitor():
-            logger.info("Starting background monitoring for Samsung LH55BECHLGFXGO displays")
-            
-            while True:
-                try:
-                    # Health check all displays
-                    for display_id, controller in display_controllers.items():
-                        try:
-                            health = await controller.health_check()
-                            
-                            # Update database
-                            with get_db() as conn:
-                                conn.execute('''
-                                    INSERT OR REPLACE INTO display_status 
-                                    (id, name, ip, online, responsive, temperature, last_update)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                                ''', (
-                                    display_id,
-                                    controller.status.name,
-                                    controller.ip,
-                                    health.get('connection', {}).get('status') == 'connected',
-                                    health.get('power', {}).get('responsive', False),
-                                    health.get('temperature', {}).get('value'),
-                                    datetime.now()
-                                ))
-                                conn.commit()
-                            
-                            # Temperature alerts
-                            temp = health.get('temperature', {}).get('value')
-                            if temp and temp > config.get('monitoring.temperature_critical_threshold', 70):
-                                logger.critical(f"CRITICAL: Display {display_id} temperature: {temp}°C")
-                                socketio.emit('critical_alert', {
-                                    'type': 'temperature',
-                                    'display_id': display_id,
-                                    'temperature': temp,
-                                    'message': f'Display {display_id} temperature critical: {temp}°C'
-                                })
-                            elif temp and temp > config.get('monitoring.temperature_warning_threshold', 60):
-                                logger.warning(f"WARNING: Display {display_id} temperature: {temp}°C")
-                                
-                        except Exception as e:
-                            logger.error(f"Health check failed for display {display_id}: {e}")
-                    
-                    # Wait for next check
-                    await asyncio.sleep(config.get('monitoring.health_check_interval', 30))
-                    
-                except Exception as e:
-                    logger.error(f"Monitoring loop error: {e}")
-                    await asyncio.sleep(60)  # Wait longer on error
-        
-        loop.run_until_complete(monitor())
+    def save_health(rows):
+        """Upsert one poll's display rows in a single transaction (worker thread)"""
+        # Upsert so identity columns written by the identity tier are kept
+        with get_db() as conn:
+            conn.executemany('''
+                INSERT INTO display_status 
+                (id, name, ip, online, responsive, temperature, last_update)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    ip = excluded.ip,
+                    online = excluded.online,
+                    responsive = excluded.responsive,
+                    temperature = excluded.temperature,
+                    last_update = excluded.last_update
+            ''', rows)
+            conn.commit()
+    
+    async def persist_health(results):
+        """Persist every polled display without blocking the MDC loop"""
+        now = datetime.now()
+        rows = [
+            (
+                display_id,
+                display_controllers[display_id].status.name,
+                display_controllers[display_id].ip,
+                health.get('connection', {}).get('status') == 'connected',
+                health.get('power', {}).get('responsive', False),
+                health.get('temperature', {}).get('value'),
+                now
+            )
+            for display_id, health in results.items() if display_id in display_controllers
+        ]
+        if rows:
+            await asyncio.to_thread(save_health, rows)
+    
+    def record_health(display_id, health):
+        """Raise temperature alerts for each polled display"""
+        # Temperature alerts
+        temp = health.get('temperature', {}).get('value')
+        if temp and temp > config.get('monitoring.temperature_critical_threshold', 70):
+            logger.critical(f"CRITICAL: Display {display_id} temperature: {temp}°C")
+            socketio.emit('critical_alert', {
+                'type': 'temperature',
+                'display_id': display_id,
+                'temperature': temp,
+                'message': f'Display {display_id} temperature critical: {temp}°C'
+            })
+        elif temp and temp > config.get('monitoring.temperature_warning_threshold', 60):
+            logger.warning(f"WARNING: Display {display_id} temperature: {temp}°C")
     
-    monitoring_thread = threading.Thread(target=monitoring_loop, daemon=True)
-    monitoring_thread.start()
-    logger.info("Background monitoring thread started")
+    # The poller refreshes every display each monitoring.status_poll_interval
+    # seconds; /api/displays and /api/monitoring/health serve its snapshot
+    status_poller.listeners.append(record_health)
+    status_poller.poll_listeners.append(persist_health)
+    status_poller.start()
+    
+    # Batched Socket.IO display_deltas, flushed from the server's own thread
+    update_broadcaster.start()
+    
+    # deployment_log rollups and retention purge every monitoring.log_purge_interval minutes
+    log_maintenance.start()
+    logger.info("Background monitoring started for Samsung LH55BECHLGFXGO displays")
 
 # Graceful shutdown handler
 def signal_handler(signum, frame):
@@ -245,6 +248,9 @@ def signal_handler(signum, frame):
     except:
         pass
     
+    # Write queued deployment log rows
+    audit_log.close()
+    
     sys.exit(0)
 
 def main():
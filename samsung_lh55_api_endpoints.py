@@ -10,25 +10,29 @@ Add these to your main application file
 # DISPLAY CONTROL ENDPOINTS
 # ============================================================================
 
+def wants_fresh_data() -> bool:
+    """True when the caller asked to bypass the poller cache with ?fresh=1"""
+    return request.args.get('fresh', '').lower() in ('1', 'true', 'yes')
+
 @app.route('/api/displays', methods=['GET'])
 async def get_all_displays():
     """Get all Samsung LH55BECHLGFXGO displays"""
     try:
         displays = {}
+        fresh = wants_fresh_data()
+        
+        if fresh:
+            # Synchronous probe: one MDC status query per online display
+            online_ids = [id for id, c in display_controllers.items() if c.status.online]
+            await fan_out(online_ids, lambda display_id, controller: controller.get_full_status())
         
         for display_id, controller in display_controllers.items():
-            # Get current status
-            if controller.status.online:
-                health = await controller.health_check()
-            else:
-                health = controller.status.to_dict()
-                
             displays[display_id] = {
                 'id': display_id,
                 'name': controller.status.name,
                 'model': 'LH55BECHLGFXGO',
                 'ip': controller.ip,
-                'status': health,
+                'status': controller.status_summary(),
                 'specs': asdict(controller.specs)
             }
         
@@ -36,6 +40,8 @@ async def get_all_displays():
             'success': True,
             'total_displays': len(displays),
             'displays': displays,
+            'fresh': fresh,
+            'snapshot_age': 0 if fresh else status_poller.snapshot_age(),
             'model_info': {
                 'series': 'Samsung BEC Series',
                 'model': 'LH55BECHLGFXGO',
@@ -91,6 +97,40 @@ async def get_display_details(display_id):
         logger.error(f"Failed to get display {display_id} details: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/displays/<int:display_id>/history', methods=['GET'])
+def get_display_history(display_id):
+    """Temperature, RTT, error count and power history of a Samsung LH55BECHLGFXGO display
+    
+    Query parameters: metric (comma-separated), resolution (raw, minute or
+    hour) and since (unix timestamp).
+    """
+    try:
+        if display_id not in display_controllers:
+            return jsonify({'success': False, 'error': 'Display not found'}), 404
+        
+        resolution = request.args.get('resolution', 'raw')
+        if resolution not in MetricHistory.RESOLUTIONS:
+            return jsonify({'success': False, 'error': f'Resolution must be one of {list(MetricHistory.RESOLUTIONS)}'}), 400
+        
+        metrics = [m for m in request.args.get('metric', '').split(',') if m] or None
+        unknown = [m for m in metrics or [] if m not in MetricHistory.METRICS]
+        if unknown:
+            return jsonify({'success': False, 'error': f'Unknown metrics: {unknown}'}), 400
+        
+        since = request.args.get('since', 0, type=float)
+        
+        return jsonify({
+            'success': True,
+            'display_id': display_id,
+            'resolution': resolution,
+            'format': ['timestamp', 'value'] if resolution == 'raw' else ['timestamp', 'avg', 'min', 'max'],
+            'metrics': metric_history.history(display_id, metrics, resolution, since)
+        })
+        
+    except Exception as e:
+        logger.error(f"Failed to get display {display_id} history: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/displays/<int:display_id>/power', methods=['POST'])
 async def control_display_power(display_id):
     """Control Samsung LH55BECHLGFXGO power"""
@@ -124,20 +164,10 @@ async def control_display_power(display_id):
         
         # Log the action
         if result['success']:
-            with get_db() as conn:
-                conn.execute('''
-                    INSERT INTO deployment_log (display_id, action, status, details, timestamp)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (display_id, f'power_{action}', 'success', json.dumps(result), datetime.now()))
-                conn.commit()
+            audit_log.log(display_id, f'power_{action}', 'success', result)
         
-        # Emit real-time update
-        socketio.emit('display_update', {
-            'display_id': display_id,
-            'action': f'power_{action}',
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
+        # Push changed fields to dashboards
+        publish_display_state([display_id], f'power_{action}')
         
         return jsonify(result)
         
@@ -180,13 +210,8 @@ async def control_display_volume(display_id):
         # Determine overall success
         overall_success = all(r.get('success', False) for r in results.values())
         
-        # Emit real-time update
-        socketio.emit('display_update', {
-            'display_id': display_id,
-            'action': 'volume_control',
-            'result': results,
-            'timestamp': datetime.now().isoformat()
-        })
+        # Push changed fields to dashboards
+        publish_display_state([display_id], 'volume_control')
         
         return jsonify({
             'success': overall_success,
@@ -220,14 +245,8 @@ async def control_display_input(display_id):
         controller = display_controllers[display_id]
         result = await controller.set_input_source(source_enum)
         
-        # Emit real-time update
-        socketio.emit('display_update', {
-            'display_id': display_id,
-            'action': 'input_change',
-            'input_source': input_source,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
+        # Push changed fields to dashboards
+        publish_display_state([display_id], 'input_change')
         
         return jsonify(result)
         
@@ -278,6 +297,9 @@ async def control_display_picture(display_id):
         
         overall_success = all(r.get('success', False) for r in results.values())
         
+        # Push changed fields to dashboards
+        publish_display_state([display_id], 'picture_control')
+        
         return jsonify({
             'success': overall_success,
             'results': results
@@ -385,48 +407,33 @@ async def apply_video_wall_layout():
             return jsonify({'success': False, 'error': 'Not enough displays for this layout'}), 400
         
         # Apply video wall configuration to each display
-        results = {}
         display_ids = list(display_controllers.keys())[:h * v]
+        positions = {
+            display_id: ((i % h) + 1, (i // h) + 1)
+            for i, display_id in enumerate(display_ids)
+        }
         
-        for i, display_id in enumerate(display_ids):
-            h_pos = (i % h) + 1
-            v_pos = (i // h) + 1
+        async def apply_position(display_id, controller):
+            h_pos, v_pos = positions[display_id]
+            result = await controller.set_video_wall_mode(
+                enabled=True,
+                h_monitors=h,
+                v_monitors=v,
+                h_position=h_pos,
+                v_position=v_pos
+            )
             
-            controller = display_controllers[display_id]
-            
-            try:
-                result = await controller.set_video_wall_mode(
-                    enabled=True,
-                    h_monitors=h,
-                    v_monitors=v,
-                    h_position=h_pos,
-                    v_position=v_pos
-                )
-                
-                results[display_id] = {
-                    'success': result['success'],
-                    'position': f"{h_pos},{v_pos}",
-                    'details': result
-                }
-                
-                # Update database
-                if result['success']:
-                    with get_db() as conn:
-                        conn.execute('''
-                            UPDATE display_status 
-                            SET video_wall_enabled = 1, grid_position = ?
-                            WHERE id = ?
-                        ''', (f"{h_pos},{v_pos}", display_id))
-                        conn.commit()
-                
-            except Exception as e:
-                results[display_id] = {
-                    'success': False,
-                    'error': str(e)
-                }
+            return {
+                'success': result['success'],
+                'position': f"{h_pos},{v_pos}",
+                'details': result
+            }
+        
+        results = await fan_out(display_ids, apply_position)
         
         # Save layout to database
-        layout_id = f"layout_{int(time.time())}"
+        # Millisecond timestamp plus a random suffix: applies within one second must not collide
+        layout_id = f"layout_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
         layout_data = {
             'name': layout_name,
             'description': f'{h}x{v} Samsung LH55BECHLGFXGO Video Wall',
@@ -436,6 +443,13 @@ async def apply_video_wall_layout():
         }
         
         with get_db() as conn:
+            # Record grid positions in one transaction
+            conn.executemany('''
+                UPDATE display_status 
+                SET video_wall_enabled = 1, grid_position = ?
+                WHERE id = ?
+            ''', [(r['position'], display_id) for display_id, r in results.items() if r['success']])
+            
             # Deactivate previous layouts
             conn.execute('UPDATE video_wall_layouts SET active = 0')
             
@@ -450,10 +464,12 @@ async def apply_video_wall_layout():
                 layout_data['description'],
                 layout_data['grid_width'],
                 layout_data['grid_height'],
-                json.dumps(layout_data['display_mapping'])
+                json.dumps(compact_result(layout_data['display_mapping']))
             ))
             conn.commit()
         
+        publish_display_state(display_ids, 'layout_applied')
+        
         # Calculate success rate
         successful_displays = sum(1 for r in results.values() if r['success'])
         total_displays = len(results)
@@ -465,7 +481,7 @@ async def apply_video_wall_layout():
             'results': results,
             'success_rate': successful_displays / total_displays,
             'timestamp': datetime.now().isoformat()
-        })
+        }, to=[DisplayUpdateBroadcaster.FLEET_ROOM, DisplayUpdateBroadcaster.WALL_ROOM])
         
         return jsonify({
             'success': successful_displays == total_displays,
@@ -484,31 +500,21 @@ async def apply_video_wall_layout():
 async def disable_video_wall():
     """Disable video wall mode on all Samsung LH55BECHLGFXGO displays"""
     try:
-        results = {}
-        
-        for display_id, controller in display_controllers.items():
-            try:
-                result = await controller.set_video_wall_mode(enabled=False)
-                results[display_id] = result
-                
-                # Update database
-                if result['success']:
-                    with get_db() as conn:
-                        conn.execute('''
-                            UPDATE display_status 
-                            SET video_wall_enabled = 0, grid_position = NULL
-                            WHERE id = ?
-                        ''', (display_id,))
-                        conn.commit()
-                        
-            except Exception as e:
-                results[display_id] = {'success': False, 'error': str(e)}
+        results = await fan_out(list(display_controllers.keys()),
+                                lambda display_id, controller: controller.set_video_wall_mode(enabled=False))
         
-        # Deactivate layouts in database
+        # Clear grid positions and deactivate layouts in one transaction
         with get_db() as conn:
+            conn.executemany('''
+                UPDATE display_status 
+                SET video_wall_enabled = 0, grid_position = NULL
+                WHERE id = ?
+            ''', [(display_id,) for display_id, r in results.items() if r['success']])
             conn.execute('UPDATE video_wall_layouts SET active = 0')
             conn.commit()
         
+        publish_display_state(list(results.keys()), 'video_wall_disabled')
+        
         successful_displays = sum(1 for r in results.values() if r['success'])
         total_displays = len(results)
         
@@ -517,7 +523,7 @@ async def disable_video_wall():
             'action': 'video_wall_disabled',
             'results': results,
             'timestamp': datetime.now().isoformat()
-        })
+        }, to=[DisplayUpdateBroadcaster.FLEET_ROOM, DisplayUpdateBroadcaster.WALL_ROOM])
         
         return jsonify({
             'success': successful_displays == total_displays,
@@ -690,36 +696,33 @@ async def bulk_power_control():
         if invalid_ids:
             return jsonify({'success': False, 'error': f'Invalid display IDs: {invalid_ids}'}), 400
         
-        results = {}
+        # Whole daisy chains get one broadcast packet, the rest are addressed individually
+        chains, individual_ids = plan_broadcast(display_ids)
+        power_on = action == 'on'
+        power_state = PowerState.ON if power_on else PowerState.OFF
+        
+        results = await broadcast_to_chains(
+            chains,
+            [(MDCCommand.POWER, bytes([power_state.value]))],
+            lambda controller: controller.status.power == power_on
+        )
         
         # Execute power commands
-        for display_id in display_ids:
-            try:
-                controller = display_controllers[display_id]
-                
-                if action == 'on':
-                    result = await controller.power_on()
-                else:
-                    result = await controller.power_off()
-                
-                results[display_id] = result
-                
-            except Exception as e:
-                results[display_id] = {'success': False, 'error': str(e)}
+        async def apply_power(display_id, controller):
+            return await (controller.power_on() if power_on else controller.power_off())
+        
+        results.update(await fan_out(individual_ids, apply_power))
+        
+        publish_display_state(display_ids, f'bulk_power_{action}')
         
         successful_count = sum(1 for r in results.values() if r.get('success'))
         
         # Log bulk operation
-        with get_db() as conn:
-            conn.execute('''
-                INSERT INTO deployment_log (display_id, action, status, details, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (0, f'bulk_power_{action}', 'success', json.dumps({
-                'display_ids': display_ids,
-                'successful_count': successful_count,
-                'results': results
-            }), datetime.now()))
-            conn.commit()
+        audit_log.log(0, f'bulk_power_{action}', 'success', {
+            'display_ids': display_ids,
+            'successful_count': successful_count,
+            'results': results
+        }, command=MDCCommand.POWER.name, success=successful_count == len(display_ids))
         
         return jsonify({
             'success': successful_count > 0,
@@ -751,32 +754,45 @@ async def bulk_volume_control():
         
         results = {}
         
-        for display_id in display_ids:
-            if display_id not in display_controllers:
-                results[display_id] = {'success': False, 'error': 'Display not found'}
-                continue
+        unknown_ids = [id for id in display_ids if id not in display_controllers]
+        for display_id in unknown_ids:
+            results[display_id] = {'success': False, 'error': 'Display not found'}
+        
+        # Whole daisy chains get one broadcast packet, the rest are addressed individually
+        broadcast_commands = []
+        if volume is not None:
+            broadcast_commands.append((MDCCommand.VOLUME, bytes([volume])))
+        if mute is not None:
+            broadcast_commands.append((MDCCommand.MUTE, bytes([0x01 if mute else 0x00])))
+        
+        def volume_applied(controller):
+            return ((volume is None or controller.status.volume == volume) and
+                    (mute is None or controller.status.muted == mute))
+        
+        chains, individual_ids = plan_broadcast([id for id in display_ids if id in display_controllers])
+        results.update(await broadcast_to_chains(chains, broadcast_commands, volume_applied))
+        
+        async def apply_volume(display_id, controller):
+            display_results = {}
             
-            try:
-                controller = display_controllers[display_id]
-                display_results = {}
-                
-                if volume is not None:
-                    volume_result = await controller.set_volume(volume)
-                    display_results['volume'] = volume_result
-                
-                if mute is not None:
-                    mute_result = await controller.set_mute(mute)
-                    display_results['mute'] = mute_result
-                
-                # Overall success for this display
-                display_success = all(r.get('success', False) for r in display_results.values())
-                results[display_id] = {
-                    'success': display_success,
-                    'operations': display_results
-                }
-                
-            except Exception as e:
-                results[display_id] = {'success': False, 'error': str(e)}
+            if volume is not None:
+                volume_result = await controller.set_volume(volume)
+                display_results['volume'] = volume_result
+            
+            if mute is not None:
+                mute_result = await controller.set_mute(mute)
+                display_results['mute'] = mute_result
+            
+            # Overall success for this display
+            display_success = all(r.get('success', False) for r in display_results.values())
+            return {
+                'success': display_success,
+                'operations': display_results
+            }
+        
+        results.update(await fan_out(individual_ids, apply_volume))
+        
+        publish_display_state(display_ids, 'bulk_volume')
         
         successful_count = sum(1 for r in results.values() if r.get('success'))
         
@@ -823,11 +839,30 @@ async def get_system_health():
         
         temperatures = []
         total_errors = 0
+        fresh = wants_fresh_data()
+        
+        if fresh:
+            # Check all displays in parallel
+            health_results = await fan_out(
+                list(display_controllers.keys()),
+                lambda display_id, controller: controller.health_check()
+            )
+            health_summary['snapshot_age'] = 0
+        else:
+            # Serve the background poller's snapshot, falling back to cached status
+            health_results = {
+                display_id: status_poller.health.get(display_id) or
+                            dict(controller.status_summary(), overall_health='unknown')
+                for display_id, controller in display_controllers.items()
+            }
+            health_summary['snapshot_age'] = status_poller.snapshot_age()
         
-        # Check each display
-        for display_id, controller in display_controllers.items():
+        for display_id, health_data in health_results.items():
+            controller = display_controllers[display_id]
             try:
-                health_data = await controller.health_check()
+                if 'overall_health' not in health_data:
+                    raise RuntimeError(health_data.get('error', 'Health check failed'))
+                
                 health_summary['display_health'][display_id] = health_data
                 
                 # Update statistics
@@ -919,53 +954,208 @@ async def get_system_health():
         logger.error(f"System health check failed: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint"""
+    return render_prometheus_metrics(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+ALERT_LEVEL_STATUSES = {
+    'error': ('error', 'failed'),
+    'warning': ('warning',)
+}
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_log_cursor(timestamp: str, row_id: int) -> str:
+    """Opaque keyset cursor pointing just past a deployment_log row"""
+    return base64.urlsafe_b64encode(json.dumps([timestamp, row_id]).encode()).decode().rstrip('=')
+
+def decode_log_cursor(cursor: str) -> Tuple[str, int]:
+    """(timestamp, id) from encode_log_cursor; raises ValueError for anything else"""
+    try:
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        return str(timestamp), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError('Invalid cursor') from e
+
+def wants_ndjson() -> bool:
+    """True for ?format=ndjson or an Accept header preferring NDJSON"""
+    return (request.args.get('format') == 'ndjson' or
+            request.accept_mimetypes.best == 'application/x-ndjson')
+
+def deployment_log_response(where: List[str], params: List[Any], to_item, key: str, filters: Dict[str, Any]):
+    """Newest-first deployment_log rows, keyset-paginated on (timestamp, id)
+    
+    JSON responses hold at most limit items (page_count) plus next_cursor
+    when more remain, and total_count, the number of rows matching the
+    filters across all pages. NDJSON responses stream one item per line (each with its own
+    cursor) straight from the database cursor, up to limit if one is given.
+    """
+    ndjson = wants_ndjson()
+    limit = request.args.get('limit', None if ndjson else DEFAULT_PAGE_SIZE, type=int)
+    if limit is not None and (limit < 1 or (limit > MAX_PAGE_SIZE and not ndjson)):
+        return jsonify({'success': False, 'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+    
+    filter_where, filter_params = where, params
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            timestamp, row_id = decode_log_cursor(cursor)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        # Row value comparison, so SQLite walks idx_deployment_log_time_id instead of sorting
+        where = where + ['(timestamp, id) < (?, ?)']
+        params = params + [timestamp, row_id]
+    
+    query = f'''
+        SELECT * FROM deployment_log
+        WHERE {' AND '.join(where)}
+        ORDER BY timestamp DESC, id DESC
+    '''
+    
+    if ndjson:
+        if limit is not None:
+            query += ' LIMIT ?'
+            params = params + [limit]
+        
+        def generate():
+            with get_db() as conn:
+                rows = conn.execute(query, params)
+                while True:
+                    batch = rows.fetchmany(500)
+                    if not batch:
+                        return
+                    yield ''.join(
+                        json.dumps({**to_item(row), 'cursor': encode_log_cursor(row['timestamp'], row['id'])},
+                                   default=str) + '\n'
+                        for row in batch
+                    )
+        
+        return Response(generate(), mimetype='application/x-ndjson')
+    
+    # One extra row tells us whether another page exists
+    with get_db() as conn:
+        rows = conn.execute(query + ' LIMIT ?', params + [limit + 1]).fetchall()
+        # Counted from the same index as the page, without the cursor bound
+        total_count = conn.execute(
+            f"SELECT COUNT(*) FROM deployment_log WHERE {' AND '.join(filter_where)}", filter_params
+        ).fetchone()[0]
+    
+    page = rows[:limit]
+    next_cursor = encode_log_cursor(page[-1]['timestamp'], page[-1]['id']) if len(rows) > limit else None
+    
+    return jsonify({
+        'success': True,
+        key: [to_item(row) for row in page],
+        'total_count': total_count,
+        'page_count': len(page),
+        'limit': limit,
+        'next_cursor': next_cursor,
+        'filter': filters
+    })
+
+def alert_from_log(log) -> Dict[str, Any]:
+    """Alert view of a deployment_log row"""
+    return {
+        'id': log['id'],
+        'level': 'warning' if log['status'] == 'warning' else 'error',
+        'message': f"Display {log['display_id']}: {log['action']} {log['status']}",
+        'display_id': log['display_id'],
+        'action': log['action'],
+        'timestamp': log['timestamp'],
+        'details': decode_details(log['details'])
+    }
+
+def audit_entry_from_log(log) -> Dict[str, Any]:
+    """Full view of a deployment_log row"""
+    return {
+        'id': log['id'],
+        'display_id': log['display_id'],
+        'action': log['action'],
+        'status': log['status'],
+        'command': log['command'],
+        'latency_ms': log['latency_ms'],
+        'success': None if log['success'] is None else bool(log['success']),
+        'attempts': log['attempts'],
+        'timestamp': log['timestamp'],
+        'details': decode_details(log['details'])
+    }
+
 @app.route('/api/monitoring/alerts', methods=['GET'])
 def get_system_alerts():
-    """Get current system alerts"""
+    """Get current system alerts, newest first (?limit=&cursor=, or ?format=ndjson to stream)"""
     try:
         level_filter = request.args.get('level')
         hours_back = request.args.get('hours', 24, type=int)
         
         cutoff_time = datetime.now() - timedelta(hours=hours_back)
         
-        with get_db() as conn:
-            query = '''
-                SELECT * FROM deployment_log 
-                WHERE timestamp > ? AND status IN ('error', 'failed', 'warning')
-                ORDER BY timestamp DESC
-            '''
-            
-            logs = conn.execute(query, (cutoff_time,)).fetchall()
-            
-            alerts = []
-            for log in logs:
-                alert_level = 'warning' if log['status'] == 'warning' else 'error'
-                
-                if level_filter and alert_level != level_filter:
-                    continue
-                
-                alerts.append({
-                    'id': log['id'],
-                    'level': alert_level,
-                    'message': f"Display {log['display_id']}: {log['action']} {log['status']}",
-                    'display_id': log['display_id'],
-                    'action': log['action'],
-                    'timestamp': log['timestamp'],
-                    'details': log['details']
-                })
+        # SQLite searches idx_deployment_log_status_time once per status, so only
+        # alert rows in the window are read. A single status (level=warning)
+        # comes out already in (timestamp, id) order; several are merged with
+        # a sort over those alert rows only.
+        statuses = ALERT_LEVEL_STATUSES.get(level_filter, ()) if level_filter else ('error', 'failed', 'warning')
+        if not statuses:
+            statuses = (None,)  # Unknown level: matches nothing
+        
+        return deployment_log_response(
+            [f"status IN ({', '.join('?' * len(statuses))})", 'timestamp > ?'],
+            [*statuses, cutoff_time],
+            alert_from_log, 'alerts',
+            {'level': level_filter, 'hours_back': hours_back}
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to get alerts: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/monitoring/audit-log', methods=['GET'])
+def get_audit_log():
+    """Deployment log entries, newest first (?limit=&cursor=, or ?format=ndjson to stream)"""
+    try:
+        display_id = request.args.get('display_id', type=int)
+        action = request.args.get('action')
+        status = request.args.get('status')
+        hours_back = request.args.get('hours', 24, type=int)
+        
+        where = ['timestamp > ?']
+        params: List[Any] = [datetime.now() - timedelta(hours=hours_back)]
+        for column, value in (('display_id', display_id), ('action', action), ('status', status)):
+            if value is not None:
+                where.append(f'{column} = ?')
+                params.append(value)
+        
+        return deployment_log_response(
+            where, params, audit_entry_from_log, 'entries',
+            {'display_id': display_id, 'action': action, 'status': status, 'hours_back': hours_back}
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to get audit log: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/monitoring/daily', methods=['GET'])
+def get_daily_summaries():
+    """Daily per-display action counts and command latency from the deployment log rollups"""
+    try:
+        display_id = request.args.get('display_id', type=int)
+        days = request.args.get('days', 30, type=int)
+        
+        summaries = log_maintenance.daily(display_id, days)
         
         return jsonify({
             'success': True,
-            'alerts': alerts,
-            'total_count': len(alerts),
+            'summaries': summaries,
+            'total_count': len(summaries),
             'filter': {
-                'level': level_filter,
-                'hours_back': hours_back
+                'display_id': display_id,
+                'days': days
             }
         })
         
     except Exception as e:
-        logger.error(f"Failed to get alerts: {e}")
+        logger.error(f"Failed to get daily summaries: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 # ============================================================================
@@ -1073,25 +1263,87 @@ def handle_connect():
         'display_count': len(display_controllers)
     })
 
+@socketio.on('disconnect')
+def handle_disconnect():
+    """Drop the client's update subscriptions"""
+    update_broadcaster.unsubscribe(request.sid)
+
+def subscription_rooms(data) -> Tuple[List[str], List[int]]:
+    """Rooms for a subscribe/unsubscribe request and any unknown display IDs in it"""
+    requested = data.get('display_ids') or ([data['display_id']] if data.get('display_id') is not None else [])
+    unknown = [id for id in requested if id not in display_controllers]
+    
+    rooms = [DisplayUpdateBroadcaster.display_room(id) for id in requested]
+    if data.get('wall'):
+        rooms.append(DisplayUpdateBroadcaster.WALL_ROOM)
+    if data.get('fleet') or not rooms:
+        rooms.append(DisplayUpdateBroadcaster.FLEET_ROOM)
+    return rooms, unknown
+
 @socketio.on('subscribe_display_updates')
 def handle_display_subscription(data):
-    """Handle subscription to display updates"""
-    display_id = data.get('display_id')
+    """Handle subscription to display updates
     
-    if display_id and display_id in display_controllers:
-        # Send current status
-        controller = display_controllers[display_id]
-        emit('display_status', {
-            'display_id': display_id,
-            'status': controller.status.to_dict()
-        })
-    else:
-        # Send all display statuses
-        all_statuses = {}
-        for did, controller in display_controllers.items():
-            all_statuses[did] = controller.status.to_dict()
-        
-        emit('all_display_status', all_statuses)
+    Subscribe to one display (display_id), several (display_ids), the active
+    video wall (wall) or by default the whole fleet. Updates then arrive as
+    batched display_deltas frames. A client that passes the epoch and last_seq
+    it has seen receives only the deltas it missed; otherwise (or if too far
+    behind, or the server restarted) it receives a snapshot.
+    """
+    data = data or {}
+    try:
+        last_seq = int(data['last_seq']) if data.get('last_seq') is not None else None
+    except (TypeError, ValueError):
+        last_seq = None  # Unusable; send a snapshot
+    if data.get('epoch') != display_state.epoch:
+        last_seq = None  # Sequence numbers from before a server restart
+    
+    rooms, unknown = subscription_rooms(data)
+    if unknown:
+        emit('error', {'message': f'Invalid display IDs: {unknown}'})
+        return
+    
+    def catch_up(display_ids: Optional[List[int]]) -> int:
+        if last_seq is not None:
+            seq = display_state.seq
+            deltas = display_state.since(last_seq, display_ids)
+            if deltas is not None:
+                emit('display_deltas', {
+                    'epoch': display_state.epoch,
+                    'seq': seq,
+                    'deltas': [delta for delta in deltas if delta['seq'] <= seq]
+                })
+                return seq
+        
+        snapshot = display_state.snapshot(display_ids)
+        if rooms == [DisplayUpdateBroadcaster.display_room(data.get('display_id'))]:
+            # Send current status
+            emit('display_status', {
+                'display_id': data['display_id'],
+                'epoch': snapshot['epoch'],
+                'seq': snapshot['seq'],
+                'status': snapshot['displays'].get(data['display_id'])
+            })
+        else:
+            # Send all subscribed display statuses
+            emit('all_display_status', snapshot)
+        return snapshot['seq']
+    
+    # Bring the published state up to date before reading from it
+    display_ids = update_broadcaster.display_ids(set(rooms))
+    publish_display_state(list(display_controllers.keys()) if display_ids is None else display_ids)
+    
+    update_broadcaster.subscribe(request.sid, rooms, catch_up)
+
+@socketio.on('unsubscribe_display_updates')
+def handle_display_unsubscription(data):
+    """Leave the given update rooms, or all of them when no data is given"""
+    if not data:
+        update_broadcaster.unsubscribe(request.sid)
+        return
+    
+    rooms, _ = subscription_rooms(data)
+    update_broadcaster.unsubscribe(request.sid, rooms)
 
 @socketio.on('request_system_health')
 def handle_health_request():
@@ -0,0 +1,42 @@
+"""
+Tests for the video wall benchmark suite's reporting helpers
+"""
+
+import json
+
+import pytest
+
+from benchmark_video_wall import compare, latency_summary, percentile
+
+# Latency statistics
+def test_percentile_uses_nearest_rank():
+    samples = [i / 100 for i in range(1, 101)]
+    
+    assert percentile(samples, 50) == 0.50
+    assert percentile(samples, 99) == 0.99
+    assert percentile([0.3, 0.1, 0.2], 100) == 0.3
+    assert percentile([], 50) is None
+
+def test_latency_summary_reports_milliseconds():
+    summary = latency_summary([0.010, 0.020, 0.030, 0.040])
+    
+    assert summary == {'count': 4, 'mean_ms': 25.0, 'p50_ms': 20.0, 'p95_ms': 40.0,
+                       'p99_ms': 40.0, 'max_ms': 40.0}
+    assert latency_summary([])['p50_ms'] is None
+
+def test_compare_prints_changes_against_a_baseline(tmp_path, capsys):
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps({
+        'git_revision': 'abc1234',
+        'scenarios': {'poll_all': {'latency': {'p50_ms': 10.0, 'p95_ms': 20.0, 'p99_ms': 40.0},
+                                   'commands_per_sec': 100.0}}
+    }))
+    report = {'scenarios': {'poll_all': {'latency': {'p50_ms': 5.0, 'p95_ms': 20.0, 'p99_ms': 50.0},
+                                         'commands_per_sec': 150.0}}}
+    
+    compare(report, str(baseline))
+    
+    output = capsys.readouterr().out
+    assert 'abc1234' in output
+    assert 'p50 10.0->5.0ms (-50.0%)' in output
+    assert 'commands/s 100.0->150.0 (+50.0%)' in output
@@ -0,0 +1,611 @@
+"""
+Tests for the Samsung LH55BECHLGFXGO control system core
+Displays are served by mdc_display_simulator (see conftest.py)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mdc_display_simulator import SimulatorProfile
+
+# Command actor
+def test_concurrent_commands_share_one_connection_in_order(fleet, core):
+    simulated = fleet(1, profile=SimulatorProfile(latency=0.005))
+    controller = core.display_controllers[1]
+    
+    async def burst():
+        return await asyncio.gather(*(controller.set_volume(volume) for volume in range(1, 21)))
+    
+    results = asyncio.run(burst())
+    
+    # Each caller got the reply to its own request, in submission order
+    assert [result['data'] for result in results] == [bytes([volume]) for volume in range(1, 21)]
+    assert simulated.display(1).volume == 20
+    assert simulated.links[0].stats['connections'] == 1
+
+def test_callers_on_other_threads_go_through_the_same_actor(fleet, core):
+    simulated = fleet(1, profile=SimulatorProfile(latency=0.005))
+    controller = core.display_controllers[1]
+    results = []
+    
+    def caller():
+        for _ in range(5):
+            results.append(asyncio.run(controller.get_power_status()))
+    
+    threads = [threading.Thread(target=caller) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(results) == 20 and all(result['success'] for result in results)
+    assert simulated.links[0].stats['connections'] == 1
+
+# MDC frame decoder
+def frame(command, display_id, data=b''):
+    body = bytes([0xAA, command, display_id, len(data)]) + data
+    return body + bytes([sum(body) & 0xFF])
+
+def test_decoder_reassembles_frames_split_across_reads(core):
+    decoder = core.MDCFrameDecoder()
+    stream = frame(0x12, 1, b'\x1e') + frame(0x11, 1, b'\x01')
+    
+    frames = []
+    for byte in stream:
+        decoder.feed(bytes([byte]))
+        next_frame = decoder.next_frame()
+        if next_frame:
+            frames.append(next_frame)
+    
+    assert frames == [frame(0x12, 1, b'\x1e'), frame(0x11, 1, b'\x01')]
+    assert decoder.next_frame() is None
+
+def test_decoder_resyncs_after_junk_and_corrupt_frames(core):
+    decoder = core.MDCFrameDecoder()
+    corrupt = bytearray(frame(0x14, 1, b'\x21'))
+    corrupt[-1] ^= 0xFF
+    decoder.feed(b'\x00\x55' + bytes(corrupt) + b'\x01' + frame(0x12, 1, b'\x32'))
+    
+    assert decoder.next_frame() == frame(0x12, 1, b'\x32')
+    assert decoder.checksum_errors == 1
+    assert decoder.next_frame() is None
+
+def test_stale_reply_is_skipped_for_the_current_command(fleet, core):
+    fleet(1)
+    controller = core.display_controllers[1]
+    assert asyncio.run(controller.get_power_status())['success']
+    
+    # A late reply to an earlier command is already waiting on the connection
+    controller._decoder.feed(frame(0x12, 1, b'\x10'))
+    result = asyncio.run(controller.get_temperature())
+    
+    assert result['success'] and result['command'] == 0x2B
+
+# Full status query
+def test_full_status_reads_every_field_in_one_round_trip(fleet, core):
+    simulated = fleet(1)
+    display = simulated.display(1)
+    display.volume, display.muted, display.input_source, display.picture_mode = 35, True, 0x25, 0x02
+    controller = core.display_controllers[1]
+    asyncio.run(controller.connect())
+    commands = simulated.links[0].stats['commands']
+    
+    result = asyncio.run(controller.get_full_status())
+    
+    assert simulated.links[0].stats['commands'] == commands + 1
+    assert result['status'] == {'power': True, 'volume': 35, 'muted': True,
+                                'input_source': core.InputSource(0x25).name,
+                                'picture_mode': core.PictureMode(0x02).name}
+    assert controller.status.volume == 35 and controller.status.muted
+
+def test_full_status_keeps_unknown_codes_readable(fleet, core):
+    simulated = fleet(1)
+    simulated.display(1).input_source = 0x7F
+    
+    result = asyncio.run(core.display_controllers[1].get_full_status())
+    
+    assert result['status']['input_source'] == '0x7F'
+
+# Daisy-chain broadcast
+def test_only_whole_chains_are_broadcast(fleet, core, settings):
+    fleet(5, chain_size=3)
+    
+    assert core.plan_broadcast([1, 2, 3, 4]) == ([[1, 2, 3]], [4])
+    assert core.plan_broadcast([1, 2, 4, 5]) == ([[4, 5]], [1, 2])
+    
+    settings('mdc.broadcast_enabled', False)
+    assert core.plan_broadcast([1, 2, 3]) == ([], [1, 2, 3])
+
+def test_broadcast_sends_one_packet_and_confirms_each_display(fleet, core, settings):
+    simulated = fleet(3, chain_size=3)
+    settings('mdc.broadcast_settle_time', 0)
+    
+    results = asyncio.run(core.broadcast_to_chains(
+        [[1, 2, 3]],
+        [(core.MDCCommand.POWER, bytes([core.PowerState.OFF.value]))],
+        lambda controller: not controller.status.power
+    ))
+    
+    assert simulated.links[0].stats['broadcasts'] == 1
+    assert all(not simulated.display(display_id).power for display_id in (1, 2, 3))
+    assert all(results[display_id]['success'] and results[display_id]['broadcast']
+               for display_id in (1, 2, 3))
+
+def test_broadcast_reports_displays_that_did_not_apply_it(fleet, core, settings):
+    fleet(2, chain_size=2)
+    settings('mdc.broadcast_settle_time', 0)
+    
+    results = asyncio.run(core.broadcast_to_chains(
+        [[1, 2]],
+        [(core.MDCCommand.VOLUME, bytes([10]))],
+        lambda controller: controller.status.volume == 90
+    ))
+    
+    assert not results[1]['success'] and 'did not confirm' in results[1]['error']
+
+# Parallel fan-out
+def peak_concurrency(core, display_ids, **kwargs):
+    in_flight = []
+    peak = []
+    
+    async def operation(display_id, controller):
+        in_flight.append(display_id)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(display_id)
+        return {'success': True, 'display': controller.display_id}
+    
+    results = asyncio.run(core.fan_out(display_ids, operation, **kwargs))
+    return max(peak), results
+
+def test_fan_out_covers_the_whole_wall_in_one_round(fleet, core, settings):
+    fleet(8)
+    settings('mdc.max_concurrency', None)
+    
+    peak, results = peak_concurrency(core, list(range(1, 9)))
+    
+    assert peak == 8
+    assert {display_id: result['display'] for display_id, result in results.items()} == {
+        display_id: display_id for display_id in range(1, 9)}
+
+def test_fan_out_respects_a_concurrency_cap(fleet, core, settings):
+    fleet(8)
+    
+    assert peak_concurrency(core, list(range(1, 9)), concurrency=3)[0] == 3
+    
+    settings('mdc.max_concurrency', 2)
+    assert peak_concurrency(core, list(range(1, 9)))[0] == 2
+
+def test_fan_out_reports_timeouts_and_errors_per_display(fleet, core):
+    fleet(3)
+    
+    async def operation(display_id, controller):
+        if display_id == 2:
+            await asyncio.sleep(1)
+        if display_id == 3:
+            raise RuntimeError('link down')
+        return {'success': True}
+    
+    results = asyncio.run(core.fan_out([1, 2, 3], operation, deadline=0.05))
+    
+    assert results[1] == {'success': True}
+    assert not results[2]['success'] and 'did not respond within 0.05s' in results[2]['error']
+    assert results[3] == {'success': False, 'error': 'link down'}
+
+# Background status poller
+def test_poll_caches_health_and_hands_the_batch_to_poll_listeners(fleet, core, run):
+    fleet(3)
+    poller = core.DisplayStatusPoller()
+    batches = []
+    
+    async def failing(results):
+        raise RuntimeError('database locked')
+    
+    async def persist(results):
+        batches.append((threading.current_thread().name, sorted(results)))
+    
+    poller.poll_listeners.extend([failing, persist])
+    results = run(poller.poll_once())
+    
+    assert sorted(poller.health) == [1, 2, 3]
+    assert all(result['overall_health'] == 'healthy' for result in results.values())
+    assert poller.snapshot_age() is not None
+    # One batch per poll, awaited on the MDC loop even after a listener failed
+    assert batches == [('mdc-io', [1, 2, 3])]
+
+# Identity tier
+def test_identity_is_read_once_per_connection(fleet, core, db):
+    simulated = fleet(1)
+    controller = core.display_controllers[1]
+    link = simulated.links[0]
+    
+    identity = asyncio.run(controller.refresh_identity())
+    commands = link.stats['commands']
+    
+    assert identity == {'serial_number': 'SIM0000001', 'model_number': 'LH55BECHLGFXGO',
+                        'software_version': 'S-BECSIM-1000.0'}
+    assert asyncio.run(controller.refresh_identity()) == identity
+    assert link.stats['commands'] == commands
+    
+    # A new connection may be a swapped panel, so the tier is due again
+    asyncio.run(controller.disconnect())
+    asyncio.run(controller.get_power_status())
+    assert controller.identity_due()
+    
+    with db() as conn:
+        row = conn.execute('SELECT serial_number, model_number FROM display_status WHERE id = 1').fetchone()
+    assert tuple(row) == ('SIM0000001', 'LH55BECHLGFXGO')
+
+def test_restart_restores_only_identity_read_from_the_display(fleet, core, db, monkeypatch):
+    simulated = fleet(1)
+    with db() as conn:
+        # The model column always holds its schema default; model_number was never read
+        conn.execute("INSERT INTO display_status (id, name, ip, serial_number) VALUES (1, 'Wall', '127.0.0.1', 'SN123')")
+        conn.commit()
+    
+    monkeypatch.setitem(core.config.config, 'displays', simulated.displays_config())
+    core.display_controllers.clear()
+    core.initialize_displays()
+    
+    status = core.display_controllers[1].status
+    assert status.serial_number == 'SN123'
+    assert status.model_number is None
+
+# Adaptive timeouts
+def test_rtt_estimate_tracks_samples_within_bounds(core):
+    rtt = core.RTTEstimator(initial_timeout=3.0, min_timeout=0.2, max_timeout=5.0)
+    assert rtt.timeout == 3.0
+    
+    for _ in range(20):
+        rtt.observe(0.01)
+    assert rtt.timeout == 0.2
+    
+    rtt.observe(0.5)
+    assert 0.5 < rtt.timeout < 5.0
+    
+    rtt.observe(10.0)
+    assert rtt.timeout == 5.0
+
+def test_timeouts_back_off_until_the_next_reply(core):
+    rtt = core.RTTEstimator(initial_timeout=0.3, min_timeout=0.1, max_timeout=5.0)
+    
+    rtt.on_timeout()
+    rtt.on_timeout()
+    assert rtt.timeout == pytest.approx(1.2)
+    
+    rtt.observe(0.1)
+    assert rtt.timeout == pytest.approx(0.1 + 4 * 0.05)
+
+def test_slow_commands_and_connects_keep_their_floor(fleet, core, settings):
+    settings('mdc.slow_command_min_timeout', 3.0)
+    settings('mdc.connect_min_timeout', 1.0)
+    fleet(1)
+    controller = core.display_controllers[1]
+    
+    for _ in range(5):
+        assert asyncio.run(controller.get_power_status())['success']
+    
+    assert controller.command_timeout(core.MDCCommand.VOLUME) == controller.rtt.min_timeout
+    assert controller.command_timeout(core.MDCCommand.POWER) == 3.0
+    assert controller.connection_timeout == 1.0
+
+def test_lost_reply_times_out_on_the_measured_estimate(fleet, core):
+    simulated = fleet(1, profile=SimulatorProfile(latency=0.01))
+    controller = core.display_controllers[1]
+    controller.max_retries = 1
+    assert asyncio.run(controller.get_power_status())['success']
+    
+    simulated.links[0].profile.packet_loss = 1.0
+    started = time.monotonic()
+    result = asyncio.run(controller.get_power_status())
+    
+    # Well under the 3s initial timeout a fresh connection would wait
+    assert not result['success'] and time.monotonic() - started < 1.0
+    assert controller.rtt.backoff == 2
+
+# Circuit breaker
+def test_breaker_opens_after_consecutive_failures(core):
+    breaker = core.CircuitBreaker(failure_threshold=2, max_error_count=5)
+    
+    assert not breaker.record_failure('timeout')
+    assert breaker.record_failure('timeout')
+    assert breaker.state == breaker.OPEN
+    assert breaker.unreachable_result(7)['error'] == 'Display 7 unreachable (circuit open)'
+    
+    # A failed probe re-opens without reporting a fresh transition
+    breaker.half_open()
+    assert not breaker.record_failure('still down')
+    assert breaker.state == breaker.OPEN
+    
+    breaker.record_success()
+    assert breaker.state == breaker.CLOSED and breaker.last_error is None
+
+def test_open_breaker_fails_fast_until_the_probe_succeeds(fleet, core, settings):
+    settings('mdc.breaker_reset_timeout', 0.3)
+    simulated = fleet(1, profile=SimulatorProfile(latency=0.01))
+    link = simulated.links[0]
+    controller = core.display_controllers[1]
+    controller.max_retries = 1
+    assert asyncio.run(controller.get_power_status())['success']
+    
+    link.profile.packet_loss = 1.0
+    asyncio.run(controller.get_power_status())
+    asyncio.run(controller.get_power_status())
+    assert controller.breaker.is_open
+    
+    # No traffic while open: the cached result comes straight back
+    link.profile.packet_loss = 0.0
+    commands = link.stats['commands']
+    result = asyncio.run(controller.get_temperature())
+    assert result['circuit_state'] == 'open'
+    assert link.stats['commands'] == commands
+    
+    deadline = time.monotonic() + 5
+    while controller.breaker.is_open and time.monotonic() < deadline:
+        time.sleep(0.02)
+    
+    assert not controller.breaker.is_open
+    assert asyncio.run(controller.get_temperature())['success']
+
+# Metric history
+def test_ring_keeps_the_newest_samples_in_order(core):
+    ring = core.MetricRing(3)
+    for second in range(5):
+        ring.append(1000 + second, second * 1.5)
+    
+    assert ring.points() == [[1002, 3.0], [1003, 4.5], [1004, 6.0]]
+    assert ring.points(since=1004) == [[1004, 6.0]]
+
+def test_series_rolls_samples_up_into_minutes(core):
+    series = core.MetricSeries(raw_size=10, minute_size=10, hour_size=10)
+    for timestamp, value in ((60, 40), (90, 44), (119, 42), (120, 50)):
+        series.add(timestamp, value)
+    
+    assert series.points('minute') == [[60, 42.0, 40.0, 44.0], [120, 50.0, 50.0, 50.0]]
+    assert series.points('hour') == [[0, 44.0, 40.0, 50.0]]
+    assert series.points('minute', since=100) == [[120, 50.0, 50.0, 50.0]]
+
+def test_health_checks_feed_the_history(fleet, core, run):
+    fleet(1)
+    core.metric_history.series.clear()
+    
+    health = run(core.display_controllers[1].health_check())
+    core.metric_history.record_health(1, health)
+    history = core.metric_history.history(1)
+    
+    assert history['temperature'][0][1] == health['temperature']['value']
+    assert history['power'][0][1] == 1.0
+    assert history['error_count'][0][1] == 0
+    assert len(history['rtt_ms']) == 1
+
+# Command metrics
+def test_command_histogram_buckets_are_upper_bounds(core):
+    metrics = core.CommandMetrics()
+    metrics.observe('POWER', 0.005, True)
+    metrics.observe('POWER', 0.006, True)
+    metrics.observe('POWER', 30.0, False)
+    
+    histogram = metrics.histograms['POWER']
+    assert histogram[0] == 1 and histogram[1] == 1
+    assert histogram[len(core.CommandMetrics.BUCKETS)] == 1  # +Inf
+    assert histogram[-1] == pytest.approx(30.011)
+    assert metrics.counters['failures'] == 1
+
+# Display state deltas
+def test_tracker_publishes_only_changed_fields(core):
+    tracker = core.DisplayStateTracker()
+    status = core.DisplayStatus(id=1, name='Wall 1', ip='10.0.0.1')
+    
+    first = tracker.update(1, status)
+    assert first['seq'] == 1 and first['changes']['volume'] == 50
+    
+    status.last_seen = core.datetime.now()
+    assert tracker.update(1, status) is None
+    
+    status.volume, status.muted = 20, True
+    delta = tracker.update(1, status, action='volume')
+    assert delta['seq'] == 2 and delta['action'] == 'volume'
+    assert delta['changes'] == {'volume': 20, 'muted': True}
+
+def test_tracker_catch_up_from_a_sequence_number(core):
+    tracker = core.DisplayStateTracker(max_log=3)
+    statuses = {display_id: core.DisplayStatus(id=display_id, name=f'Wall {display_id}', ip='10.0.0.1')
+                for display_id in (1, 2)}
+    for display_id, status in statuses.items():
+        tracker.update(display_id, status)
+    statuses[1].power = True
+    tracker.update(1, statuses[1])
+    
+    assert [delta['seq'] for delta in tracker.since(1)] == [2, 3]
+    assert [delta['seq'] for delta in tracker.since(1, [1])] == [3]
+    assert tracker.since(3) == []
+    assert tracker.snapshot([2])['displays'].keys() == {2}
+    
+    # Once the bounded log no longer reaches back, callers need a snapshot
+    statuses[2].power = True
+    tracker.update(2, statuses[2])
+    assert tracker.since(0) is None
+    assert tracker.snapshot()['seq'] == 4
+
+# Database connection pool
+def test_pool_reuses_connections_tuned_for_wal(core, tmp_path):
+    pool = core.SQLitePool(str(tmp_path / 'pool.db'), max_idle=1)
+    
+    conn = pool.acquire()
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+    pool.release(conn)
+    assert pool.acquire() is conn
+    
+    # Only max_idle connections are kept; the rest are closed
+    other = pool.acquire()
+    pool.release(conn)
+    pool.release(other)
+    assert list(pool._idle) == [conn]
+    pool.close()
+
+def test_pool_rolls_back_work_left_uncommitted(core, tmp_path):
+    pool = core.SQLitePool(str(tmp_path / 'pool.db'))
+    conn = pool.acquire()
+    conn.execute('CREATE TABLE notes (text TEXT)')
+    conn.commit()
+    conn.execute("INSERT INTO notes VALUES ('draft')")
+    pool.release(conn)
+    
+    conn = pool.acquire()
+    assert conn.execute('SELECT COUNT(*) FROM notes').fetchone()[0] == 0
+    pool.release(conn)
+    pool.close()
+
+def test_concurrent_threads_never_share_a_connection(core, tmp_path):
+    pool = core.SQLitePool(str(tmp_path / 'pool.db'))
+    in_use = set()
+    shared = []
+    lock = threading.Lock()
+    
+    def worker():
+        for _ in range(50):
+            conn = pool.acquire()
+            with lock:
+                shared.append(id(conn) in in_use)
+                in_use.add(id(conn))
+            conn.execute('SELECT 1').fetchone()
+            with lock:
+                in_use.discard(id(conn))
+            pool.release(conn)
+    
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert not any(shared)
+    assert len(pool._idle) <= pool.max_idle
+    pool.close()
+
+@pytest.mark.parametrize('url, path', [
+    ('sqlite:////var/lib/video-wall/wall.db', '/var/lib/video-wall/wall.db'),
+    ('wall.db', 'wall.db')
+])
+def test_database_url_names_the_sqlite_file(core, monkeypatch, url, path):
+    monkeypatch.setenv('DATABASE_URL', url)
+    assert core.database_path() == path
+
+# Write-behind deployment log
+def test_writer_batches_rows_and_flushes_on_close(core, db):
+    writer = core.DeploymentLogWriter(flush_interval=5, batch_size=10)
+    for index in range(25):
+        writer.log(index % 3, 'set_volume', 'success', f'volume {index}')
+    writer.close()
+    
+    with db() as conn:
+        assert conn.execute('SELECT COUNT(*) FROM deployment_log').fetchone()[0] == 25
+    assert writer.stats == {'queued': 25, 'written': 25, 'batches': 3, 'errors': 0}
+
+def test_writer_flushes_a_partial_batch_after_the_interval(core, db):
+    writer = core.DeploymentLogWriter(flush_interval=0.05, batch_size=500)
+    writer.log(1, 'power_on', 'success')
+    
+    deadline = time.monotonic() + 5
+    while writer.stats['written'] < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
+    assert writer.stats['written'] == 1
+    with db() as conn:
+        assert conn.execute('SELECT action FROM deployment_log').fetchone()[0] == 'power_on'
+    writer.close()
+
+# Deployment log encoding
+def test_results_are_stored_compact_and_binary_safe(core, settings):
+    settings('audit_log.compress_threshold', 1024)
+    result = {'success': True, 'command': 0x12, 'data': b'\x1e', 'raw_response': b'\xaa\xff',
+              'latency_ms': 4.2, 'attempts': 1}
+    
+    assert core.decode_details(core.encode_details(result)) == (
+        '{"success":true,"command":18,"data":"1e","latency_ms":4.2,"attempts":1}')
+    assert core.result_columns(result) == {'command': 'VOLUME', 'latency_ms': 4.2, 'success': True, 'attempts': 1}
+    assert core.result_columns({'success': False, 'command': 0x7F})['command'] == '0x7F'
+    assert core.encode_details('already text') == 'already text'
+
+def test_large_details_are_compressed(core, settings):
+    settings('audit_log.compress_threshold', 256)
+    results = {display_id: {'success': True, 'data': bytes(8)} for display_id in range(50)}
+    
+    stored = core.encode_details(results)
+    
+    assert isinstance(stored, bytes)
+    assert core.json.loads(core.decode_details(stored))['7'] == {'success': True, 'data': '00' * 8}
+
+def test_writer_fills_result_columns(core, db):
+    writer = core.DeploymentLogWriter()
+    writer.log(1, 'set_volume', 'success', {'success': True, 'command': 0x12, 'latency_ms': 3.5, 'attempts': 2})
+    writer.close()
+    
+    with db() as conn:
+        row = conn.execute('SELECT command, latency_ms, success, attempts FROM deployment_log').fetchone()
+    assert tuple(row) == ('VOLUME', 3.5, 1, 2)
+
+def test_api_responses_carry_bytes_as_hex(core):
+    with core.app.app_context():
+        assert core.json.loads(core.app.json.dumps({'data': b'\x01\xff'})) == {'data': '01ff'}
+
+# Deployment log rollup and retention
+def insert_log_rows(conn, rows):
+    conn.executemany('''
+        INSERT INTO deployment_log (display_id, action, status, latency_ms, attempts, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+
+def test_rollup_counts_each_row_once(core, db):
+    maintenance = core.DeploymentLogMaintenance()
+    day = core.datetime.now() - core.timedelta(days=1)
+    with db() as conn:
+        insert_log_rows(conn, [(1, 'power_on', 'success', 10.0, 1, day),
+                               (1, 'power_on', 'error', None, 3, day),
+                               (2, 'set_volume', 'success', 30.0, 1, day)])
+    
+    assert maintenance.rollup() == 3
+    with db() as conn:
+        insert_log_rows(conn, [(1, 'set_volume', 'warning', 50.0, 1, day)])
+    assert maintenance.rollup() == 1
+    assert maintenance.rollup() == 0
+    
+    [summary] = maintenance.daily(display_id=1)
+    assert summary == {'day': day.date().isoformat(), 'display_id': 1, 'actions': 3, 'successes': 1,
+                       'errors': 1, 'warnings': 1, 'attempts': 5, 'avg_latency_ms': 30.0, 'max_latency_ms': 50.0}
+
+def test_purge_deletes_by_age_even_when_ids_are_out_of_time_order(core, db, settings):
+    settings('monitoring.log_retention_days', 30)
+    settings('monitoring.log_purge_batch_size', 100)
+    maintenance = core.DeploymentLogMaintenance()
+    now = core.datetime.now()
+    
+    # Imported history: the newest rows got the lowest ids
+    rows = [(1, 'power_on', 'success', None, 1, now - core.timedelta(days=index / 10 + 0.05))
+            for index in range(1000)]
+    with db() as conn:
+        insert_log_rows(conn, rows)
+    maintenance.rollup()
+    with db() as conn:
+        # Not rolled up yet, so kept however old it is
+        insert_log_rows(conn, [(1, 'power_on', 'success', None, 1, now - core.timedelta(days=90))])
+    
+    deleted = maintenance.purge()
+    
+    with db() as conn:
+        oldest = conn.execute('SELECT MIN(timestamp) FROM deployment_log WHERE id <= 1000').fetchone()[0]
+        remaining = conn.execute('SELECT COUNT(*) FROM deployment_log').fetchone()[0]
+    assert deleted == 700
+    assert remaining == 301
+    assert oldest >= str(now - core.timedelta(days=30))
+
+def test_purge_waits_for_the_first_rollup(core, db):
+    with db() as conn:
+        insert_log_rows(conn, [(1, 'power_on', 'success', None, 1, core.datetime(2020, 1, 1))])
+    
+    assert core.DeploymentLogMaintenance().purge() == 0
@@ -0,0 +1,75 @@
+"""
+Tests for the MDC display simulator
+"""
+
+import asyncio
+
+import pytest
+
+from mdc_display_simulator import (MDC_BROADCAST_ID, POWER, STATUS, VOLUME, SimulatorProfile,
+                                   VirtualLink, build_frame)
+from conftest import on_mdc_loop
+
+async def exchange(link: VirtualLink, request: bytes, replies: int = 1, timeout: float = 1.0):
+    """Send raw bytes to a link and read back the given number of reply frames"""
+    reader, writer = await asyncio.open_connection(link.host, link.port)
+    try:
+        writer.write(request)
+        await writer.drain()
+        
+        frames = []
+        for _ in range(replies):
+            header = await asyncio.wait_for(reader.readexactly(4), timeout)
+            frames.append(header + await reader.readexactly(header[3] + 1))
+        return frames
+    finally:
+        writer.close()
+
+# Request handling
+def test_set_commands_update_state_and_echo_it(link):
+    virtual_link = link()
+    
+    reply = on_mdc_loop(exchange(virtual_link, build_frame(VOLUME, 1, b'\x1e')))[0]
+    
+    assert reply == build_frame(VOLUME, 1, b'\x1e')
+    assert virtual_link.displays[1].volume == 30
+
+def test_status_reply_carries_every_field(link):
+    virtual_link = link()
+    virtual_link.displays[1].muted = True
+    
+    reply = on_mdc_loop(exchange(virtual_link, build_frame(STATUS, 1)))[0]
+    
+    assert reply[4:9] == bytes([1, 50, 1, 0x21, 0x00])
+
+def test_broadcast_reaches_the_whole_chain_without_a_reply(link):
+    virtual_link = link((1, 2, 3))
+    
+    assert virtual_link.handle_request(POWER, MDC_BROADCAST_ID, b'\x00') is None
+    assert not any(display.power for display in virtual_link.displays.values())
+    assert virtual_link.handle_request(POWER, 9, b'\x00') is None
+    assert virtual_link.stats['broadcasts'] == 1
+
+def test_junk_and_corrupt_requests_do_not_desync_the_link(link):
+    virtual_link = link()
+    corrupt = bytearray(build_frame(VOLUME, 1, b'\x0a'))
+    corrupt[-1] ^= 0xFF
+    
+    # A stray header byte with no frame behind it is skipped too
+    request = b'\x00\x13' + bytes(corrupt) + b'\xaa' + build_frame(VOLUME, 1, b'\x14')
+    replies = on_mdc_loop(exchange(virtual_link, request))
+    
+    assert replies == [build_frame(VOLUME, 1, b'\x14')]
+    assert virtual_link.displays[1].volume == 20
+
+# Network profile
+def test_profile_drops_and_corrupts_replies(link):
+    dropping = link(profile=SimulatorProfile(latency=0, packet_loss=1.0))
+    with pytest.raises(asyncio.TimeoutError):
+        on_mdc_loop(exchange(dropping, build_frame(VOLUME, 1), timeout=0.2))
+    assert dropping.stats['dropped_replies'] == 1
+    
+    corrupting = link(profile=SimulatorProfile(latency=0, bad_checksum=1.0))
+    reply = on_mdc_loop(exchange(corrupting, build_frame(VOLUME, 1)))[0]
+    assert reply[-1] != build_frame(VOLUME, 1, b'\x32')[-1]
+    assert corrupting.stats['corrupted_replies'] == 1
@@ -0,0 +1,262 @@
+"""
+Tests for the Samsung LH55BECHLGFXGO REST API endpoints
+"""
+
+import asyncio
+
+import pytest
+
+from mdc_display_simulator import SimulatorProfile
+
+# Cached reads
+def test_health_is_served_from_the_poller_snapshot(fleet, core, run, client):
+    simulated = fleet(2)
+    run(core.status_poller.poll_once())
+    commands = sum(link.stats['commands'] for link in simulated.links)
+    
+    cached = client.get('/api/monitoring/health').get_json()['health']
+    
+    assert sum(link.stats['commands'] for link in simulated.links) == commands
+    assert sorted(cached['display_health']) == ['1', '2']
+    assert cached['snapshot_age'] is not None
+    
+    fresh = client.get('/api/monitoring/health?fresh=1').get_json()['health']
+    
+    assert sum(link.stats['commands'] for link in simulated.links) > commands
+    assert fresh['snapshot_age'] == 0
+
+# Video wall layouts
+def test_repeated_applies_get_distinct_layout_ids(fleet, client, db):
+    fleet(4)
+    
+    for _ in range(3):
+        response = client.post('/api/video-wall/apply', json={'layout_name': '2x2'})
+        assert response.get_json()['success']
+    
+    with db() as conn:
+        assert conn.execute('SELECT COUNT(DISTINCT id) FROM video_wall_layouts').fetchone()[0] == 3
+
+# Display history
+def test_history_endpoint_returns_points_and_validates_queries(fleet, core, client):
+    fleet(1)
+    core.metric_history.series.clear()
+    core.metric_history.record(1, 'temperature', 41, timestamp=1000)
+    core.metric_history.record(1, 'temperature', 43, timestamp=1010)
+    
+    response = client.get('/api/displays/1/history?metric=temperature&since=1005').get_json()
+    assert response['metrics'] == {'temperature': [[1010, 43.0]]}
+    
+    minute = client.get('/api/displays/1/history?metric=temperature&resolution=minute').get_json()
+    assert minute['format'] == ['timestamp', 'avg', 'min', 'max']
+    assert minute['metrics']['temperature'] == [[960, 42.0, 41.0, 43.0]]
+    
+    assert client.get('/api/displays/1/history?resolution=day').status_code == 400
+    assert client.get('/api/displays/1/history?metric=humidity').status_code == 400
+    assert client.get('/api/displays/99/history').status_code == 404
+
+# Prometheus metrics
+def test_metrics_endpoint_exposes_latency_histograms_and_counters(fleet, core, client):
+    simulated = fleet(1, profile=SimulatorProfile(latency=0.03))
+    controller = core.display_controllers[1]
+    controller.max_retries = 1
+    for _ in range(3):
+        asyncio.run(controller.get_power_status())
+    simulated.links[0].profile.packet_loss = 1.0
+    asyncio.run(controller.get_power_status())
+    
+    response = client.get('/metrics')
+    body = response.get_data(as_text=True)
+    
+    assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert '# TYPE mdc_command_duration_seconds histogram' in body
+    assert 'mdc_command_duration_seconds_bucket{command="POWER_STATUS",display="1",le="0.025"} 0' in body
+    assert 'mdc_command_duration_seconds_count{command="POWER_STATUS",display="1"} 4' in body
+    assert 'mdc_command_timeouts_total{display="1"} 1' in body
+    assert 'mdc_command_failures_total{display="1"} 1' in body
+    assert 'video_wall_displays 1' in body
+
+# Socket.IO display updates
+@pytest.fixture
+def realtime(core, monkeypatch):
+    """Fresh published state and subscriptions; frames are flushed by hand"""
+    monkeypatch.setattr(core, 'display_state', core.DisplayStateTracker())
+    monkeypatch.setattr(core, 'update_broadcaster', core.DisplayUpdateBroadcaster())
+    clients = []
+    
+    def connect(subscription=None):
+        socket = core.socketio.test_client(core.app)
+        clients.append(socket)
+        if subscription is not None:
+            socket.emit('subscribe_display_updates', subscription)
+        return socket
+    
+    yield connect
+    
+    for socket in clients:
+        if socket.is_connected():
+            socket.disconnect()
+
+def frames(socket, name='display_deltas'):
+    return [message['args'][0] for message in socket.get_received() if message['name'] == name]
+
+def test_each_client_gets_one_merged_frame_for_its_rooms(fleet, core, realtime):
+    fleet(3)
+    single = realtime({'display_id': 1})
+    everything = realtime({'fleet': True})
+    single.get_received(), everything.get_received()
+    
+    controllers = core.display_controllers
+    controllers[1].status.volume = 10
+    core.publish_display_state([1])
+    controllers[1].status.muted = True
+    core.publish_display_state([1])
+    controllers[2].status.power = True
+    core.publish_display_state([2])
+    core.update_broadcaster.flush()
+    
+    [frame] = frames(single)
+    assert [delta['display_id'] for delta in frame['deltas']] == [1]
+    assert frame['deltas'][0]['changes'] == {'volume': 10, 'muted': True}
+    assert frame['seq'] == frame['deltas'][0]['seq'] == 5
+    
+    [frame] = frames(everything)
+    assert [delta['display_id'] for delta in frame['deltas']] == [1, 2]
+    assert frame['seq'] == 6
+
+def test_wall_room_follows_video_wall_membership(fleet, core, realtime):
+    fleet(2)
+    core.display_controllers[2].status.video_wall_enabled = True
+    wall = realtime({'wall': True})
+    assert list(frames(wall, 'all_display_status')[0]['displays']) == ['2']
+    
+    for display_id in (1, 2):
+        core.display_controllers[display_id].status.volume = 5
+    core.publish_display_state([1, 2])
+    core.update_broadcaster.flush()
+    
+    [frame] = frames(wall)
+    assert [delta['display_id'] for delta in frame['deltas']] == [2]
+    
+    # Leaving the wall is the last update wall subscribers get for a display
+    core.display_controllers[2].status.video_wall_enabled = False
+    core.publish_display_state([2])
+    core.update_broadcaster.flush()
+    
+    [frame] = frames(wall)
+    assert frame['deltas'][0]['changes'] == {'video_wall_enabled': False}
+
+def test_updates_are_not_queued_without_subscribers(fleet, core, realtime):
+    fleet(1)
+    core.display_controllers[1].status.volume = 15
+    core.publish_display_state([1])
+    
+    assert core.update_broadcaster._pending == []
+    
+    socket = realtime({'display_id': 1})
+    assert frames(socket, 'display_status')[0]['status']['volume'] == 15
+
+# Reconnect catch-up
+def test_reconnect_receives_only_missed_deltas(fleet, core, realtime):
+    fleet(2)
+    first = realtime({'fleet': True})
+    snapshot = frames(first, 'all_display_status')[0]
+    first.disconnect()
+    
+    core.display_controllers[1].status.volume = 30
+    core.publish_display_state([1])
+    
+    again = realtime({'fleet': True, 'epoch': snapshot['epoch'], 'last_seq': snapshot['seq']})
+    [catch_up] = frames(again)
+    
+    assert [(delta['display_id'], delta['changes']) for delta in catch_up['deltas']] == [(1, {'volume': 30})]
+    assert catch_up['seq'] == snapshot['seq'] + 1
+
+@pytest.mark.parametrize('resume', [
+    {'last_seq': 'latest'},
+    {'last_seq': 0, 'epoch': 'from-a-previous-run'},
+    {'last_seq': 0}
+])
+def test_unusable_resume_points_get_a_snapshot(fleet, realtime, resume):
+    fleet(1)
+    realtime({'fleet': True})
+    
+    socket = realtime(dict(resume, fleet=True))
+    received = socket.get_received()
+    
+    assert [message['name'] for message in received if message['name'] != 'connected'] == ['all_display_status']
+
+def test_catch_up_is_not_repeated_by_the_next_batch(fleet, core, realtime):
+    fleet(1)
+    first = realtime({'fleet': True})
+    snapshot = frames(first, 'all_display_status')[0]
+    
+    # Queued for the first client, then covered by the second client's catch-up
+    core.display_controllers[1].status.volume = 12
+    core.publish_display_state([1])
+    second = realtime({'fleet': True, 'epoch': snapshot['epoch'], 'last_seq': snapshot['seq']})
+    assert len(frames(second)) == 1
+    
+    core.update_broadcaster.flush()
+    
+    assert frames(second) == []
+    assert len(frames(first)) == 1
+
+# Deployment log pages
+def add_log_rows(db, core, count, status='success', minutes_per_timestamp=10):
+    now = core.datetime.now()
+    with db() as conn:
+        conn.executemany('''
+            INSERT INTO deployment_log (display_id, action, status, timestamp) VALUES (?, ?, ?, ?)
+        ''', [(index % 4, 'set_volume', status, now - core.timedelta(minutes=index // minutes_per_timestamp))
+              for index in range(count)])
+        conn.commit()
+
+def test_keyset_pages_cover_every_row_once_despite_tied_timestamps(core, db, client):
+    add_log_rows(db, core, 250)
+    
+    pages = []
+    response = client.get('/api/monitoring/audit-log?limit=100').get_json()
+    pages.append(response)
+    # A row written mid-walk sorts before the cursor and must not shift later pages
+    add_log_rows(db, core, 1)
+    while response['next_cursor']:
+        response = client.get(f"/api/monitoring/audit-log?limit=100&cursor={response['next_cursor']}").get_json()
+        pages.append(response)
+    
+    ids = [entry['id'] for page in pages for entry in page['entries']]
+    keys = [(entry['timestamp'], entry['id']) for page in pages for entry in page['entries']]
+    
+    assert [page['page_count'] for page in pages] == [100, 100, 50]
+    assert len(set(ids)) == 250
+    assert keys == sorted(keys, reverse=True)
+    assert pages[0]['total_count'] == 250 and pages[-1]['total_count'] == 251
+
+def test_alerts_filter_levels_in_sql(core, db, client):
+    add_log_rows(db, core, 5, status='success')
+    add_log_rows(db, core, 3, status='warning')
+    add_log_rows(db, core, 2, status='failed')
+    
+    everything = client.get('/api/monitoring/alerts').get_json()
+    warnings = client.get('/api/monitoring/alerts?level=warning&limit=2').get_json()
+    
+    assert everything['total_count'] == 5
+    assert {alert['level'] for alert in everything['alerts']} == {'warning', 'error'}
+    assert (warnings['total_count'], warnings['page_count']) == (3, 2) and warnings['next_cursor']
+    assert client.get('/api/monitoring/alerts?level=debug').get_json()['total_count'] == 0
+
+def test_ndjson_streams_one_entry_per_line(core, db, client):
+    add_log_rows(db, core, 30)
+    
+    response = client.get('/api/monitoring/audit-log?format=ndjson&limit=25')
+    lines = [core.json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    resumed = client.get(f"/api/monitoring/audit-log?format=ndjson&cursor={lines[-1]['cursor']}")
+    
+    assert response.mimetype == 'application/x-ndjson'
+    assert len(lines) == 25 and all(line['cursor'] for line in lines)
+    assert len(resumed.get_data(as_text=True).splitlines()) == 5
+
+@pytest.mark.parametrize('query', ['cursor=not-a-cursor', 'limit=0', 'limit=5000'])
+def test_bad_page_requests_are_rejected(db, client, query):
+    response = client.get(f'/api/monitoring/audit-log?{query}')
+    
+    assert response.status_code == 400 and not response.get_json()['success']
@@ -0,0 +1,192 @@
+"""
+Tests for the web dashboard's card windowing and heatmap
+The page script runs under Node against a minimal stand-in for the DOM
+"""
+
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+PAGE = Path(__file__).resolve().parent / 'samsung_lh55_web_interface.html'
+
+pytestmark = pytest.mark.skipif(shutil.which('node') is None, reason='Node.js is not installed')
+
+# Just enough DOM for the card grid: elements, class lists, fragments and an
+# IntersectionObserver the test drives by hand
+FAKE_DOM = '''
+class FakeClassList {
+    constructor(element) { this.element = element; }
+    get names() { return this.element.className.split(' ').filter(Boolean); }
+    contains(name) { return this.names.includes(name); }
+    add(name) { if (!this.contains(name)) this.element.className = [...this.names, name].join(' '); }
+    remove(name) { this.element.className = this.names.filter(n => n !== name).join(' '); }
+    toggle(name, force) { (force ?? !this.contains(name)) ? this.add(name) : this.remove(name); }
+}
+
+class FakeElement {
+    constructor(tagName) {
+        this.tagName = tagName;
+        this.className = '';
+        this.innerHTML = '';
+        this.textContent = '';
+        this.children = [];
+        this.parent = null;
+        this.dataset = {};
+        this.style = { setProperty(name, value) { this[name] = value; } };
+        this.classList = new FakeClassList(this);
+        this.offsetHeight = 0;
+    }
+    appendChild(child) {
+        if (child.tagName === '#fragment') {
+            child.children.slice().forEach(c => this.appendChild(c));
+            return child;
+        }
+        child.remove();
+        child.parent = this;
+        this.children.push(child);
+        return child;
+    }
+    remove() {
+        if (this.parent) this.parent.children.splice(this.parent.children.indexOf(this), 1);
+        this.parent = null;
+    }
+    contains(element) { return element === this || this.children.some(c => c.contains(element)); }
+    addEventListener() {}
+}
+
+const elements = {};
+const document = {
+    activeElement: null,
+    addEventListener() {},
+    createElement: tag => new FakeElement(tag),
+    createDocumentFragment: () => new FakeElement('#fragment'),
+    getElementById: id => elements[id] || (elements[id] = new FakeElement('div'))
+};
+const window = { addEventListener() {} };
+
+const observed = new Set();
+let observerCallback = null;
+class IntersectionObserver {
+    constructor(callback) { observerCallback = callback; }
+    observe(element) { observed.add(element); }
+    unobserve(element) { observed.delete(element); }
+}
+function scroll(element, visible) {
+    observerCallback([{ target: element, isIntersecting: visible }]);
+}
+'''
+
+def page_script() -> str:
+    html = PAGE.read_text()
+    return re.findall(r'<script>(.*?)</script>', html, re.S)[-1]
+
+def run_page(test: str):
+    """Run the page script and then test under Node; returns what test passes to report()"""
+    source = FAKE_DOM + page_script() + '\nfunction report(value) { console.log(JSON.stringify(value)); }\n' + test
+    completed = subprocess.run(['node', '-e', source], capture_output=True, text=True, timeout=30)
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+DISPLAYS = '''
+function fleet(count) {
+    const data = {};
+    for (let id = 1; id <= count; id++) {
+        data[id] = { name: `Wall ${id}`, ip: `10.0.0.${id}`, model: 'LH55BECHLGFXGO',
+                     status: { connection: { status: 'connected' }, power: { status: 'on' },
+                               temperature: { value: 40 + id } } };
+    }
+    return data;
+}
+'''
+
+# Card windowing
+def test_every_display_gets_a_placeholder_until_it_scrolls_into_view():
+    result = run_page(DISPLAYS + '''
+        displays = fleet(500);
+        renderDisplayCards(displays);
+        const grid = document.getElementById('displays-grid');
+        
+        scroll(cardElements.get('3'), true);
+        report({
+            cards: grid.children.length,
+            observed: observed.size,
+            filled: grid.children.filter(card => !card.classList.contains('placeholder')).length,
+            third: cardElements.get('3').innerHTML.includes('Wall 3')
+        });
+    ''')
+    
+    assert result == {'cards': 500, 'observed': 500, 'filled': 1, 'third': True}
+
+def test_cards_are_released_off_screen_unless_being_edited():
+    result = run_page(DISPLAYS + '''
+        displays = fleet(3);
+        renderDisplayCards(displays);
+        const [first, second] = [cardElements.get('1'), cardElements.get('2')];
+        scroll(first, true);
+        scroll(second, true);
+        
+        const slider = new FakeElement('input');
+        second.appendChild(slider);
+        document.activeElement = slider;
+        scroll(first, false);
+        scroll(second, false);
+        
+        report([first.classList.contains('placeholder'), first.innerHTML,
+                second.classList.contains('placeholder')]);
+    ''')
+    
+    assert result == [True, '', False]
+
+def test_rerender_keeps_elements_and_drops_removed_displays():
+    result = run_page(DISPLAYS + '''
+        displays = fleet(3);
+        renderDisplayCards(displays);
+        const kept = cardElements.get('2');
+        
+        const patched = [];
+        patchDisplayCard = (card, id) => { patched.push(id); return true; };
+        scroll(kept, true);
+        delete displays['3'];
+        renderDisplayCards(displays);
+        
+        report({
+            same: cardElements.get('2') === kept,
+            ids: document.getElementById('displays-grid').children.map(card => card.dataset.displayId),
+            observed: observed.size,
+            patched,
+            offscreen: updateDisplayCard('1')
+        });
+    ''')
+    
+    assert result == {'same': True, 'ids': ['1', '2'], 'observed': 2, 'patched': ['2'], 'offscreen': True}
+
+# Heatmap
+def test_heatmap_colors_by_temperature_and_status():
+    result = run_page(DISPLAYS + '''
+        const cell = new FakeElement('div');
+        const display = fleet(1)[1];
+        const paint = (status, metric) => {
+            paintHeatmapCell(cell, { name: 'Wall 1', status }, metric);
+            return [cell.style.background, cell.title];
+        };
+        
+        report([
+            paint({ connection: { status: 'connected' }, temperature: { value: 40 } }, 'temperature'),
+            paint({ connection: { status: 'connected' }, temperature: { value: 80 } }, 'temperature'),
+            paint({ connection: { status: 'failed' } }, 'temperature'),
+            paint({ connection: { status: 'connected' }, power: { status: 'on', responsive: false } }, 'status'),
+            paint(display.status, 'status')
+        ]);
+    ''')
+    
+    assert result == [
+        ['hsl(120, 75%, 42%)', 'Wall 1: 40°C'],
+        ['hsl(0, 75%, 42%)', 'Wall 1: 80°C'],
+        ['#424242', 'Wall 1: Offline'],
+        ['#FF9800', 'Wall 1: Not responding'],
+        ['#4CAF50', 'Wall 1: On']
+    ]